@@ -0,0 +1,753 @@
+"""Local stand-in for the Rivian API, for load and soak testing.
+
+Serves the GraphQL gateway and charging endpoints and the vehicle state web
+socket subscription for a simulated fleet that drives, parks, charges and
+sleeps. Latency, rate limiting, session token expiry and dropped web sockets
+are configurable, so reconnect and backoff behavior can be exercised locally.
+
+Only the queries the integration sends are understood: `vehicleState`,
+`getLiveSessionData`, `getVehicle`, `currentUser`, `getRegisteredWallboxes`,
+the vehicle image queries and the `createCsrfToken` and `login` mutations,
+alone or combined into one batched query.
+
+Run it on its own and point a client at it, or let `soak.py` start it:
+
+    python benchmarks/fake_api.py --vehicles 25 --latency 0.2 --rate-limit 60
+"""
+from __future__ import annotations
+
+import argparse
+import asyncio
+from collections import Counter, deque
+from collections.abc import Callable
+from dataclasses import dataclass, field
+from datetime import datetime, timezone
+import json
+import logging
+import math
+from pathlib import Path
+import random
+import re
+import secrets
+import sys
+import time
+from typing import Any
+
+from aiohttp import WSMsgType, web
+from rivian.rivian import LIVE_SESSION_VALUE_RECORD_KEYS
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+# pylint: disable=wrong-import-position
+from custom_components.rivian.const import VEHICLE_STATE_API_FIELDS  # noqa: E402
+from custom_components.rivian.helpers import get_model_descriptions  # noqa: E402
+
+GATEWAY_PATH = "/api/gql/gateway/graphql"
+CHARGING_PATH = "/api/gql/chrg/user/graphql"
+WEBSOCKET_PATH = "/gql-consumer-subscriptions/graphql"
+
+MODEL = "R1T"
+RATE_WINDOW = 60  # seconds
+TICK = 0.5  # seconds between fleet simulation steps
+MODE_DURATIONS = {  # seconds, before any speedup
+    "driving": (5 * 60, 30 * 60),
+    "parked": (10 * 60, 60 * 60),
+    "charging": (20 * 60, 90 * 60),
+    "sleep": (30 * 60, 3 * 60 * 60),
+}
+MODE_NEXT = {
+    "driving": ("parked", "parked", "charging"),
+    "parked": ("driving", "sleep", "charging"),
+    "charging": ("parked",),
+    "sleep": ("driving", "parked"),
+}
+PUSH_BACKOFF = {"driving": 1, "charging": 5, "parked": 10}  # x push interval
+
+_TOKEN = re.compile(r'\.\.\.|"(?:[^"\\]|\\.)*"|[$\w.+-]+|[{}():!=\[\]@]')
+
+
+@dataclass
+class FakeApiConfig:
+    """Behavior of the stand-in server."""
+
+    vehicles: int = 1
+    latency: float = 0.0  # seconds
+    jitter: float = 0.0  # seconds
+    rate_limit: int | None = None  # requests per user session per rate window
+    token_ttl: float | None = None  # seconds
+    push_interval: float = 5.0  # seconds between pushes of a driving vehicle
+    drop_interval: float | None = None  # seconds between dropping web sockets
+    speedup: float = 1.0  # how much faster vehicles change what they're doing
+    seed: int = 0
+
+
+@dataclass
+class Field:
+    """A field of a GraphQL selection."""
+
+    name: str
+    alias: str | None = None
+    args: dict[str, str] = field(default_factory=dict)
+    selections: list[Field] = field(default_factory=list)
+
+    @property
+    def key(self) -> str:
+        """Return the response key of the field."""
+        return self.alias or self.name
+
+    @property
+    def names(self) -> list[str]:
+        """Return the names of the selected sub-fields."""
+        return [sub.name for sub in self.selections if sub.name != "__typename"]
+
+
+class GraphQLError(Exception):
+    """An error returned in a GraphQL response."""
+
+    def __init__(self, code: str, message: str, status: int = 200) -> None:
+        """Initialize the error."""
+        super().__init__(message)
+        self.code = code
+        self.status = status
+
+
+def parse_query(query: str) -> list[Field]:
+    """Parse the root fields of a query, mutation or subscription document."""
+    tokens = _TOKEN.findall(query)
+    idx = 0
+    if tokens and tokens[0] in ("query", "mutation", "subscription"):
+        idx = 1
+        while tokens[idx] not in ("(", "{"):
+            idx += 1
+        if tokens[idx] == "(":
+            idx = tokens.index(")", idx) + 1
+    fields, _ = _parse_selection(tokens, idx)
+    return fields
+
+
+def _parse_selection(tokens: list[str], idx: int) -> tuple[list[Field], int]:
+    """Parse the selection set starting at `idx`, inline fragments flattened."""
+    if tokens[idx] != "{":
+        raise GraphQLError("GRAPHQL_PARSE_FAILED", f"Expected {{, got {tokens[idx]}")
+    idx += 1
+    fields: list[Field] = []
+    while tokens[idx] != "}":
+        if tokens[idx] == "...":
+            idx += 1
+            if tokens[idx] == "on":
+                selections, idx = _parse_selection(tokens, idx + 2)
+                fields.extend(selections)
+            else:
+                idx += 1  # named fragment spread, the fields aren't needed
+            continue
+        current = Field(tokens[idx])
+        idx += 1
+        if tokens[idx] == ":":
+            current = Field(tokens[idx + 1], alias=current.name)
+            idx += 2
+        if tokens[idx] == "(":
+            idx += 1
+            while tokens[idx] != ")":
+                current.args[tokens[idx]] = tokens[idx + 2]
+                idx += 3
+            idx += 1
+        if tokens[idx] == "{":
+            current.selections, idx = _parse_selection(tokens, idx)
+        fields.append(current)
+    return fields, idx + 1
+
+
+def _argument(value: str, variables: dict[str, Any]) -> Any:
+    """Resolve an argument, which is a variable or a literal."""
+    if value.startswith("$"):
+        return variables.get(value[1:])
+    return json.loads(value) if value.startswith('"') else value
+
+
+def _now() -> str:
+    """Return the current time as the API formats it."""
+    return datetime.now(timezone.utc).isoformat(timespec="milliseconds")[:-6] + "Z"
+
+
+class FakeVehicle:
+    """A simulated vehicle moving between driving, parked, charging and sleep."""
+
+    def __init__(self, idx: int, rng: random.Random, speedup: float) -> None:
+        """Initialize the vehicle."""
+        self.id = f"01-{200000000 + idx}"
+        self.vin = f"7FCTGAAL{idx:09d}"
+        self.rng = rng
+        self.speedup = speedup
+        self.mode = rng.choice(("parked", "sleep"))
+        self.mode_until = self._mode_end(time.monotonic())
+        self.next_push = time.monotonic()
+        self.latitude = 37.0 + rng.uniform(-1, 1)
+        self.longitude = -122.0 + rng.uniform(-1, 1)
+        self.bearing = rng.uniform(0, 360)
+        self.charge_start: str | None = None
+        self.charged = 0.0
+        self.state: dict[str, Any] = self._initial_state()
+
+    def _initial_state(self) -> dict[str, Any]:
+        """Return plausible values for every vehicle state field."""
+        model = get_model_descriptions(MODEL)
+        numeric = {
+            description.field
+            for description in model.sensors
+            if description.native_unit_of_measurement
+        }
+        state = {
+            key: round(self.rng.uniform(0, 100), 1) if key in numeric else "closed"
+            for key in VEHICLE_STATE_API_FIELDS
+        }
+        return state | {
+            "batteryCapacity": 135.0,
+            "batteryLevel": round(self.rng.uniform(40, 90), 1),
+            "batteryLimit": 85,
+            "chargerState": "charging_ready",
+            "chargerStatus": "chrgr_sts_not_connected",
+            "gearStatus": "park",
+            "gnssSpeed": 0,
+            "powerState": "sleep" if self.mode == "sleep" else "ready",
+            "vehicleMileage": self.rng.randrange(1_000_000, 50_000_000),
+        }
+
+    def _mode_end(self, now: float) -> float:
+        """Return when the current mode ends."""
+        return now + self.rng.uniform(*MODE_DURATIONS[self.mode]) / self.speedup
+
+    def step(self, now: float, elapsed: float) -> dict[str, Any]:
+        """Advance the simulation, returning the fields that changed."""
+        before = dict(self.state)
+        if now >= self.mode_until:
+            self.mode = self.rng.choice(MODE_NEXT[self.mode])
+            self.mode_until = self._mode_end(now)
+            self.charge_start = _now() if self.mode == "charging" else None
+            self.charged = 0.0
+        state = self.state
+        state["powerState"] = {"driving": "go", "sleep": "sleep"}.get(
+            self.mode, "ready"
+        )
+        state["gearStatus"] = "drive" if self.mode == "driving" else "park"
+        charging = self.mode == "charging"
+        state["chargerState"] = "charging_active" if charging else "charging_ready"
+        state["chargerStatus"] = (
+            "chrgr_sts_connected_charging" if charging else "chrgr_sts_not_connected"
+        )
+
+        elapsed *= self.speedup
+        if self.mode == "driving":
+            speed = self.rng.uniform(10, 30)  # meters per second
+            self.bearing = (self.bearing + self.rng.uniform(-20, 20)) % 360
+            distance = speed * elapsed
+            self.latitude += distance * math.cos(math.radians(self.bearing)) / 111_320
+            self.longitude += (
+                distance
+                * math.sin(math.radians(self.bearing))
+                / (111_320 * math.cos(math.radians(self.latitude)))
+            )
+            state["gnssSpeed"] = round(speed * 3.6, 1)
+            state["vehicleMileage"] += round(distance)
+            state["batteryLevel"] = max(state["batteryLevel"] - distance / 5000, 5.0)
+        else:
+            state["gnssSpeed"] = 0
+        if charging:
+            energy = 11 * elapsed / 3600  # kWh at 11 kW
+            self.charged += energy
+            state["batteryLevel"] = min(
+                state["batteryLevel"] + energy / state["batteryCapacity"] * 100,
+                state["batteryLimit"],
+            )
+        state["batteryLevel"] = round(state["batteryLevel"], 1)
+        state["distanceToEmpty"] = round(state["batteryLevel"] * 5.2)
+        if self.mode != "sleep" and self.rng.random() < 0.2:
+            key = self.rng.choice(sorted(VEHICLE_STATE_API_FIELDS))
+            if isinstance(state.get(key), float):
+                state[key] = round(self.rng.uniform(0, 100), 1)
+        changed = {key for key, value in state.items() if before.get(key) != value}
+        if self.mode == "driving":
+            changed.add("gnssLocation")
+        return {key: self.item(key) for key in changed}
+
+    def item(self, key: str) -> dict[str, Any] | None:
+        """Return a vehicle state field as the API does."""
+        if key == "gnssLocation":
+            return {
+                "__typename": "VehicleLocation",
+                "latitude": round(self.latitude, 6),
+                "longitude": round(self.longitude, 6),
+                "timeStamp": _now(),
+            }
+        if key == "cloudConnection":
+            return {"__typename": "VehicleCloudConnection", "lastSync": _now()}
+        if key not in self.state:
+            return None
+        value = self.state[key]
+        typename = "TimeStampedString" if isinstance(value, str) else "TimeStampedFloat"
+        return {"__typename": typename, "timeStamp": _now(), "value": value}
+
+    def live_session(self, keys: list[str]) -> dict[str, Any]:
+        """Return the live charging session, with empty values if not charging."""
+        values: dict[str, Any] = {}
+        if self.charge_start:
+            values = {
+                "chargerId": "fake-charger",
+                "current": 48,
+                "currentCurrency": "USD",
+                "currentPrice": round(self.charged * 0.3, 2),
+                "isFreeSession": False,
+                "isRivianCharger": True,
+                "kilometersChargedPerHour": 57,
+                "power": 11,
+                "rangeAddedThisSession": round(self.charged * 3.2),
+                "soc": self.state["batteryLevel"],
+                "startTime": self.charge_start,
+                "timeElapsed": "0",
+                "totalChargedEnergy": round(self.charged, 2),
+                "vehicleChargerState": "charging_active",
+            }
+        session: dict[str, Any] = {"__typename": "LiveSessionData"}
+        for key in keys:
+            value = values.get(key)
+            if key in LIVE_SESSION_VALUE_RECORD_KEYS:
+                value = {
+                    "__typename": "ValueRecord",
+                    "value": value,
+                    "updatedAt": _now(),
+                }
+            session[key] = value
+        return session
+
+
+class FakeRivianApi:
+    """Stand-in Rivian API server for a simulated fleet."""
+
+    def __init__(self, config: FakeApiConfig) -> None:
+        """Initialize the server."""
+        self.config = config
+        self.rng = random.Random(config.seed)
+        self.vehicles = {
+            vehicle.id: vehicle
+            for vehicle in (
+                FakeVehicle(idx, self.rng, config.speedup)
+                for idx in range(config.vehicles)
+            )
+        }
+        self.sessions: dict[str, float] = {}  # user session token: expiry
+        self.requests: dict[str, deque[float]] = {}
+        self.stats: Counter[str] = Counter()
+        self.operations: Counter[str] = Counter()
+        self._subscriptions: dict[
+            web.WebSocketResponse, dict[str, tuple[str, list[str]]]
+        ] = {}
+        self._runner: web.AppRunner | None = None
+        self._tasks: list[asyncio.Task] = []
+        self._resolvers: dict[str, Callable[[Field, dict[str, Any]], Any]] = {
+            "createCsrfToken": self._create_csrf_token,
+            "currentUser": self._current_user,
+            "getLiveSessionData": self._live_session,
+            "getRegisteredWallboxes": self._wallboxes,
+            "getVehicle": self._drivers_and_keys,
+            "getVehicleMobileImages": self._images,
+            "getVehicleOrderMobileImages": lambda *_: [],
+            "login": self._login,
+            "vehicleState": self._vehicle_state,
+        }
+
+    async def async_start(self, host: str = "127.0.0.1", port: int = 0) -> str:
+        """Start serving, returning the base URL."""
+        app = web.Application()
+        app.router.add_post(GATEWAY_PATH, self._handle_graphql)
+        app.router.add_post(CHARGING_PATH, self._handle_graphql)
+        app.router.add_get(WEBSOCKET_PATH, self._handle_websocket)
+        app.router.add_get("/stats", self._handle_stats)
+        self._runner = web.AppRunner(app)
+        await self._runner.setup()
+        site = web.TCPSite(self._runner, host, port)
+        await site.start()
+        port = site._server.sockets[0].getsockname()[1]  # type: ignore[union-attr]
+        self._tasks.append(asyncio.create_task(self._simulate()))
+        if self.config.drop_interval:
+            self._tasks.append(asyncio.create_task(self._drop_websockets()))
+        return f"http://{host}:{port}"
+
+    async def async_stop(self) -> None:
+        """Stop serving."""
+        for task in self._tasks:
+            task.cancel()
+        await asyncio.gather(*self._tasks, return_exceptions=True)
+        for websocket in list(self._subscriptions):
+            await websocket.close()
+        if self._runner:
+            await self._runner.cleanup()
+
+    def as_dict(self) -> dict[str, Any]:
+        """Return the request counters."""
+        return {
+            **self.stats,
+            "operations": dict(self.operations),
+            "websockets": len(self._subscriptions),
+            "subscriptions": sum(len(subs) for subs in self._subscriptions.values()),
+        }
+
+    def _issue_session(self) -> str:
+        """Create a user session token."""
+        token = secrets.token_hex(16)
+        ttl = self.config.token_ttl
+        self.sessions[token] = time.monotonic() + ttl if ttl else math.inf
+        return token
+
+    def _authenticate(self, token: str | None) -> None:
+        """Check a user session token."""
+        if (expiry := self.sessions.get(token or "")) is None:
+            raise GraphQLError("UNAUTHENTICATED", "Invalid user session", 401)
+        if time.monotonic() >= expiry:
+            self.stats["expired"] += 1
+            raise GraphQLError("UNAUTHENTICATED", "User session expired", 401)
+
+    def _limit_rate(self, token: str) -> None:
+        """Enforce the request rate limit of a user session."""
+        if not (limit := self.config.rate_limit):
+            return
+        now = time.monotonic()
+        requests = self.requests.setdefault(token, deque())
+        while requests and requests[0] <= now - RATE_WINDOW:
+            requests.popleft()
+        if len(requests) >= limit:
+            self.stats["rate_limited"] += 1
+            raise GraphQLError("RATE_LIMIT", "Rate limit exceeded", 429)
+        requests.append(now)
+
+    async def _delay(self) -> None:
+        """Wait for the configured latency."""
+        if delay := self.config.latency + self.rng.uniform(0, self.config.jitter):
+            await asyncio.sleep(delay)
+
+    async def _handle_graphql(self, request: web.Request) -> web.Response:
+        """Answer a GraphQL query."""
+        self.stats["requests"] += 1
+        await self._delay()
+        try:
+            body = await request.json()
+            fields = parse_query(body["query"])
+            variables = body.get("variables") or {}
+            if not {"createCsrfToken", "login"}.issuperset(f.name for f in fields):
+                token = request.headers.get("U-Sess", "")
+                self._authenticate(token)
+                self._limit_rate(token)
+            data = {}
+            for root in fields:
+                if (resolver := self._resolvers.get(root.name)) is None:
+                    raise GraphQLError("BAD_REQUEST_ERROR", f"Unknown {root.name}")
+                self.operations[root.name] += 1
+                data[root.key] = resolver(root, variables)
+        except GraphQLError as err:
+            self.stats["errors"] += 1
+            error = {"message": str(err), "extensions": {"code": err.code}}
+            return web.json_response(
+                {"data": None, "errors": [error]}, status=err.status
+            )
+        return web.json_response({"data": data})
+
+    async def _handle_stats(self, request: web.Request) -> web.Response:
+        """Return the request counters."""
+        return web.json_response(self.as_dict())
+
+    async def _handle_websocket(self, request: web.Request) -> web.WebSocketResponse:
+        """Serve vehicle state subscriptions over graphql-transport-ws."""
+        websocket = web.WebSocketResponse(protocols=("graphql-transport-ws",))
+        await websocket.prepare(request)
+        self.stats["websocket_connects"] += 1
+        subscriptions: dict[str, tuple[str, list[str]]] = {}
+        async for msg in websocket:
+            if msg.type != WSMsgType.TEXT:
+                continue
+            data = json.loads(msg.data)
+            if (msg_type := data.get("type")) == "connection_init":
+                try:
+                    self._authenticate(data.get("payload", {}).get("u-sess"))
+                except GraphQLError:
+                    await websocket.close(code=4401, message=b"Unauthenticated")
+                    break
+                await self._delay()
+                self._subscriptions[websocket] = subscriptions
+                await websocket.send_json({"type": "connection_ack"})
+            elif msg_type == "subscribe" and websocket in self._subscriptions:
+                payload = data["payload"]
+                (root,) = parse_query(payload["query"])
+                vehicle_id = _argument(root.args["id"], payload.get("variables") or {})
+                if vehicle_id not in self.vehicles:
+                    await websocket.send_json(
+                        {
+                            "id": data["id"],
+                            "type": "error",
+                            "payload": [{"message": "Unknown vehicle"}],
+                        }
+                    )
+                    continue
+                self.stats["subscribes"] += 1
+                subscriptions[data["id"]] = (vehicle_id, root.names)
+            elif msg_type == "complete":
+                subscriptions.pop(data.get("id"), None)
+            elif msg_type == "ping":
+                await websocket.send_json({"type": "pong"})
+        self._subscriptions.pop(websocket, None)
+        return websocket
+
+    async def _simulate(self) -> None:
+        """Step the fleet and push the changes to subscribers."""
+        last = time.monotonic()
+        while True:
+            await asyncio.sleep(TICK)
+            now = time.monotonic()
+            elapsed, last = now - last, now
+            for vehicle in self.vehicles.values():
+                changes = vehicle.step(now, elapsed)
+                if vehicle.mode == "sleep" and not changes.get("powerState"):
+                    continue
+                if now < vehicle.next_push and not changes.get("powerState"):
+                    continue
+                backoff = PUSH_BACKOFF.get(vehicle.mode, 1)
+                vehicle.next_push = now + self.config.push_interval * backoff
+                await self._push(vehicle, changes)
+
+    async def _push(self, vehicle: FakeVehicle, changes: dict[str, Any]) -> None:
+        """Send a vehicle's changes to its subscribers."""
+        for websocket, subscriptions in list(self._subscriptions.items()):
+            for sub_id, (vehicle_id, keys) in list(subscriptions.items()):
+                if vehicle_id != vehicle.id:
+                    continue
+                items = {key: changes[key] for key in keys if key in changes}
+                if not items:
+                    continue
+                try:
+                    await websocket.send_json(
+                        {
+                            "id": sub_id,
+                            "type": "next",
+                            "payload": {"data": {"vehicleState": items}},
+                        }
+                    )
+                except ConnectionResetError:
+                    break
+                self.stats["pushes"] += 1
+
+    async def _drop_websockets(self) -> None:
+        """Close every web socket now and then, as the cloud does."""
+        while True:
+            await asyncio.sleep(self.config.drop_interval or 0)
+            for websocket in list(self._subscriptions):
+                self.stats["websocket_drops"] += 1
+                await websocket.close(code=1012, message=b"Service restart")
+
+    def _vehicle(self, root: Field, variables: dict[str, Any]) -> FakeVehicle:
+        """Get the vehicle a field's `id` or `vehicleId` argument refers to."""
+        value = root.args.get("id") or root.args.get("vehicleId") or ""
+        if (vehicle := self.vehicles.get(_argument(value, variables))) is None:
+            raise GraphQLError("DATA_ERROR", "Vehicle not found")
+        return vehicle
+
+    def _create_csrf_token(self, root: Field, variables: dict[str, Any]) -> Any:
+        """Create app session tokens."""
+        return {
+            "__typename": "CreateCsrfTokenResponse",
+            "csrfToken": secrets.token_hex(16),
+            "appSessionToken": secrets.token_hex(16),
+        }
+
+    def _login(self, root: Field, variables: dict[str, Any]) -> Any:
+        """Log in, whatever the credentials."""
+        return {
+            "__typename": "MobileLoginResponse",
+            "accessToken": secrets.token_hex(16),
+            "refreshToken": secrets.token_hex(16),
+            "userSessionToken": self._issue_session(),
+        }
+
+    def _vehicle_state(self, root: Field, variables: dict[str, Any]) -> Any:
+        """Get the requested vehicle state fields."""
+        vehicle = self._vehicle(root, variables)
+        return {key: vehicle.item(key) for key in root.names}
+
+    def _live_session(self, root: Field, variables: dict[str, Any]) -> Any:
+        """Get the live charging session."""
+        return self._vehicle(root, variables).live_session(root.names)
+
+    def _drivers_and_keys(self, root: Field, variables: dict[str, Any]) -> Any:
+        """Get a vehicle's drivers and their devices."""
+        vehicle = self._vehicle(root, variables)
+        return {
+            "__typename": "Vehicle",
+            "id": vehicle.id,
+            "vin": vehicle.vin,
+            "invitedUsers": [
+                {
+                    "__typename": "ProvisionedUser",
+                    "firstName": "Soak",
+                    "lastName": "Test",
+                    "email": "soak@example.com",
+                    "roles": ["primary-owner"],
+                    "userId": "fake-user",
+                    "devices": [
+                        {
+                            "type": "phone",
+                            "mappedIdentityId": f"identity-{vehicle.id}",
+                            "id": f"device-{vehicle.id}",
+                            "hrid": f"hrid-{vehicle.id}",
+                            "deviceName": "Soak Test Phone",
+                            "isPaired": True,
+                            "isEnabled": True,
+                        }
+                    ],
+                }
+            ],
+        }
+
+    def _current_user(self, root: Field, variables: dict[str, Any]) -> Any:
+        """Get the user and their vehicles."""
+        user: dict[str, Any] = {
+            "__typename": "User",
+            "id": "fake-user",
+            "vehicles": [
+                {
+                    "id": vehicle.id,
+                    "vin": vehicle.vin,
+                    "name": f"Rivian {idx}",
+                    "vas": {
+                        "__typename": "UserVehicleAccess",
+                        "vasVehicleId": f"vas-{vehicle.id}",
+                        "vehiclePublicKey": secrets.token_hex(32),
+                    },
+                    "roles": ["primary-owner"],
+                    "state": "DELIVERED",
+                    "createdAt": "2022-01-01T00:00:00.000Z",
+                    "updatedAt": "2022-01-01T00:00:00.000Z",
+                    "vehicle": {
+                        "__typename": "Vehicle",
+                        "id": vehicle.id,
+                        "vin": vehicle.vin,
+                        "modelYear": 2022,
+                        "make": "Rivian",
+                        "model": MODEL,
+                        "expectedBuildDate": None,
+                        "plannedBuildDate": None,
+                        "expectedGeneralAssemblyStartDate": None,
+                        "actualGeneralAssemblyDate": None,
+                        "vehicleState": {"supportedFeatures": []},
+                    },
+                }
+                for idx, vehicle in enumerate(self.vehicles.values())
+            ],
+            "registrationChannels": [{"type": "EMAIL"}],
+        }
+        if "enrolledPhones" in root.names:
+            user["enrolledPhones"] = []
+        return user
+
+    def _wallboxes(self, root: Field, variables: dict[str, Any]) -> Any:
+        """Get the registered wallboxes."""
+        return [
+            {
+                "__typename": "WallboxRecord",
+                "wallboxId": "fake-wallbox",
+                "userId": "fake-user",
+                "wifiId": "fake-wifi",
+                "name": "Wall Charger",
+                "linked": True,
+                "latitude": "37.0",
+                "longitude": "-122.0",
+                "chargingStatus": "AVAILABLE",
+                "power": None,
+                "currentVoltage": None,
+                "currentAmps": None,
+                "softwareVersion": "1.0.0",
+                "model": "Wallbox",
+                "serialNumber": "fake-serial",
+                "maxAmps": 48,
+                "maxVoltage": 240,
+                "maxPower": 11520,
+            }
+        ]
+
+    def _images(self, root: Field, variables: dict[str, Any]) -> Any:
+        """Get the vehicle images."""
+        return [
+            {
+                "orderId": None,
+                "vehicleId": vehicle.id,
+                "url": f"https://example.com/{vehicle.id}/{placement}.png",
+                "extension": "png",
+                "resolution": "@3x",
+                "size": "large",
+                "design": "r1t",
+                "placement": placement,
+            }
+            for vehicle in self.vehicles.values()
+            for placement in ("side", "front")
+        ]
+
+
+async def async_main(args: argparse.Namespace) -> None:
+    """Serve until interrupted."""
+    server = FakeRivianApi(args.config)
+    url = await server.async_start(args.host, args.port)
+    print(f"Serving {args.config.vehicles} vehicles at {url}, stats at {url}/stats")
+    try:
+        await asyncio.Event().wait()
+    finally:
+        await server.async_stop()
+
+
+def add_config_arguments(parser: argparse.ArgumentParser) -> None:
+    """Add the server behavior arguments."""
+    parser.add_argument("--vehicles", type=int, default=FakeApiConfig.vehicles)
+    parser.add_argument("--latency", type=float, default=0, help="seconds")
+    parser.add_argument("--jitter", type=float, default=0, help="seconds")
+    parser.add_argument(
+        "--rate-limit", type=int, help=f"requests per {RATE_WINDOW} seconds"
+    )
+    parser.add_argument("--token-ttl", type=float, help="user session lifetime")
+    parser.add_argument(
+        "--push-interval", type=float, default=FakeApiConfig.push_interval
+    )
+    parser.add_argument(
+        "--drop-interval", type=float, help="seconds between closing web sockets"
+    )
+    parser.add_argument(
+        "--speedup", type=float, default=1, help="vehicle activity time factor"
+    )
+    parser.add_argument("--seed", type=int, default=0)
+
+
+def config_from_arguments(args: argparse.Namespace) -> FakeApiConfig:
+    """Build the server behavior from parsed arguments."""
+    return FakeApiConfig(
+        vehicles=args.vehicles,
+        latency=args.latency,
+        jitter=args.jitter,
+        rate_limit=args.rate_limit,
+        token_ttl=args.token_ttl,
+        push_interval=args.push_interval,
+        drop_interval=args.drop_interval,
+        speedup=args.speedup,
+        seed=args.seed,
+    )
+
+
+def main() -> None:
+    """Parse the arguments and serve."""
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--host", default="127.0.0.1")
+    parser.add_argument("--port", type=int, default=8080)
+    add_config_arguments(parser)
+    args = parser.parse_args()
+    args.config = config_from_arguments(args)
+    logging.basicConfig(level=logging.INFO)
+    try:
+        asyncio.run(async_main(args))
+    except KeyboardInterrupt:
+        pass
+
+
+if __name__ == "__main__":
+    main()
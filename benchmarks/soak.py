@@ -0,0 +1,211 @@
+"""Soak test of the Rivian integration against the local stand-in API.
+
+Starts `fake_api.py` in process (or uses `--url` to reach one already
+running), points the client built by `get_rivian_api_from_entry` at it and
+runs the user, vehicle, charging, drivers, wallbox and image coordinators the
+way the integration sets them up. Server and client counters are reported at
+every `--report` interval: requests, rate limited and expired sessions, web
+socket connects and drops, pushes received, errors and polling intervals.
+
+Run it from the repository root in a Home Assistant development environment:
+
+    python benchmarks/soak.py --vehicles 25 --duration 600
+    python benchmarks/soak.py --rate-limit 30 --drop-interval 120 --speedup 20
+    python benchmarks/soak.py --token-ttl 300 --latency 0.5 --jitter 1
+"""
+from __future__ import annotations
+
+import argparse
+import asyncio
+from collections import Counter
+import logging
+from pathlib import Path
+import sys
+import tempfile
+import time
+from typing import Any
+
+import aiohttp
+from rivian import Rivian
+import rivian.rivian
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+# pylint: disable=wrong-import-position
+from homeassistant.config_entries import SOURCE_USER, ConfigEntry  # noqa: E402
+from homeassistant.core import HomeAssistant  # noqa: E402
+
+from custom_components.rivian import _async_refresh_all  # noqa: E402
+import custom_components.rivian.coordinator  # noqa: E402
+from custom_components.rivian.const import (  # noqa: E402
+    CONF_ACCESS_TOKEN,
+    CONF_REFRESH_TOKEN,
+    CONF_USER_SESSION_TOKEN,
+    DOMAIN,
+)
+from custom_components.rivian.coordinator import (  # noqa: E402
+    RivianDataUpdateCoordinator,
+    UserCoordinator,
+    VehicleCoordinator,
+    VehicleImageCoordinator,
+    WallboxCoordinator,
+)
+from custom_components.rivian.helpers import get_rivian_api_from_entry  # noqa: E402
+from custom_components.rivian.subscriptions import (  # noqa: E402
+    get_subscription_manager,
+)
+
+from fake_api import (  # noqa: E402
+    CHARGING_PATH,
+    GATEWAY_PATH,
+    WEBSOCKET_PATH,
+    FakeRivianApi,
+    add_config_arguments,
+    config_from_arguments,
+)
+
+DEFAULT_DURATION = 10 * 60  # 10 minutes
+DEFAULT_REPORT = 30  # seconds
+
+
+def redirect_api(url: str) -> None:
+    """Send the client's and the integration's requests to another server."""
+    gateway, charging = url + GATEWAY_PATH, url + CHARGING_PATH
+    rivian.rivian.GRAPHQL_GATEWAY = gateway
+    rivian.rivian.GRAPHQL_CHARGING = charging
+    rivian.rivian.GRAPHQL_WEBSOCKET = url.replace("http", "ws", 1) + WEBSOCKET_PATH
+    # the batched requests use the endpoints imported by the coordinators
+    custom_components.rivian.coordinator.GRAPHQL_GATEWAY = gateway
+    custom_components.rivian.coordinator.GRAPHQL_CHARGING = charging
+
+
+async def async_login() -> dict[str, Any]:
+    """Log in to the server, returning the config entry data."""
+    async with Rivian(request_timeout=30) as client:
+        await client.create_csrf_token()
+        await client.authenticate("soak@example.com", "password")
+        # pylint: disable=protected-access
+        return {
+            CONF_ACCESS_TOKEN: client._access_token,
+            CONF_REFRESH_TOKEN: client._refresh_token,
+            CONF_USER_SESSION_TOKEN: client._user_session_token,
+        }
+
+
+async def async_server_stats(url: str, server: FakeRivianApi | None) -> dict:
+    """Get the server's counters."""
+    if server:
+        return server.as_dict()
+    async with aiohttp.ClientSession() as session:
+        async with session.get(f"{url}/stats") as resp:
+            return await resp.json()
+
+
+def client_stats(
+    coordinators: list[RivianDataUpdateCoordinator], client: Rivian
+) -> dict[str, Any]:
+    """Sum up the coordinators' counters."""
+    # pylint: disable=protected-access
+    errors: Counter[str] = Counter()
+    latencies = []
+    for coordinator in coordinators:
+        errors.update(coordinator.metrics.errors)
+        if (latency := coordinator.metrics.latency(95)) is not None:
+            latencies.append(latency)
+    vehicles = [coor for coor in coordinators if isinstance(coor, VehicleCoordinator)]
+    return {
+        "requests": sum(coor.metrics.requests for coor in coordinators),
+        "pushes": sum(coor.metrics.pushes for coor in coordinators),
+        "errors": dict(errors),
+        "latency_p95": round(max(latencies), 3) if latencies else None,
+        "polling": sum(1 for coor in vehicles if coor._polling),
+        "intervals": sorted(
+            {int(coor.update_interval.total_seconds()) for coor in vehicles}
+        ),
+        "subscriptions": {
+            key: value
+            for key, value in get_subscription_manager(client).stats().items()
+            if key != "vehicles"
+        },
+    }
+
+
+async def async_soak(hass: HomeAssistant, url: str, args: argparse.Namespace) -> None:
+    """Run the coordinators against the server and report as they go."""
+    server: FakeRivianApi | None = None
+    if not url:
+        server = FakeRivianApi(args.config)
+        url = await server.async_start()
+    redirect_api(url)
+    print(f"Soak testing against {url} for {args.duration} seconds")
+
+    entry = ConfigEntry(
+        version=1,
+        minor_version=1,
+        domain=DOMAIN,
+        title="Soak test",
+        data=await async_login(),
+        source=SOURCE_USER,
+    )
+    client = get_rivian_api_from_entry(entry)
+    await client.create_csrf_token()
+
+    user = UserCoordinator(hass=hass, client=client, include_phones=True)
+    await user.async_refresh()
+    vehicles = {
+        vehicle_id: VehicleCoordinator(hass=hass, client=client, vehicle_id=vehicle_id)
+        for vehicle_id in user.get_vehicles()
+    }
+    wallbox = WallboxCoordinator(hass=hass, client=client)
+    images = VehicleImageCoordinator(hass=hass, client=client, version="3")
+    coordinators: list[RivianDataUpdateCoordinator] = [user, wallbox, images]
+    for coor in vehicles.values():
+        await coor.charging_coordinator.sessions.async_load()
+        coordinators += [coor, coor.charging_coordinator, coor.drivers_coordinator]
+
+    # entities keep their coordinators polling
+    unsubs = [coor.async_add_listener(lambda: None) for coor in coordinators]
+    await asyncio.gather(_async_refresh_all(vehicles, wallbox), images.async_refresh())
+
+    start = time.monotonic()
+    while (elapsed := time.monotonic() - start) < args.duration:
+        await asyncio.sleep(min(args.report, args.duration - elapsed))
+        print(f"[{time.monotonic() - start:>7.0f}s]")
+        print(f"  server: {await async_server_stats(url, server)}")
+        print(f"  client: {client_stats(coordinators, client)}")
+
+    for unsub in unsubs:
+        unsub()
+    for coor in coordinators:
+        await coor.async_shutdown()
+    await client.close()
+    if server:
+        await server.async_stop()
+
+
+async def async_main(args: argparse.Namespace) -> None:
+    """Run the soak test in a throwaway Home Assistant instance."""
+    with tempfile.TemporaryDirectory() as config_dir:
+        hass = HomeAssistant(config_dir)
+        await async_soak(hass, args.url, args)
+        await hass.async_stop(force=True)
+
+
+def main() -> None:
+    """Parse the arguments and run the soak test."""
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--url", help="base URL of a running stand-in server")
+    parser.add_argument("--duration", type=float, default=DEFAULT_DURATION)
+    parser.add_argument(
+        "--report", type=float, default=DEFAULT_REPORT, help="seconds between reports"
+    )
+    parser.add_argument("--debug", action="store_true", help="log the integration")
+    add_config_arguments(parser)
+    args = parser.parse_args()
+    args.config = config_from_arguments(args)
+    logging.basicConfig(level=logging.DEBUG if args.debug else logging.WARNING)
+    asyncio.run(async_main(args))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,246 @@
+"""Replay benchmark of the Rivian vehicle update pipeline.
+
+Feeds recorded or synthetic subscription messages through
+`VehicleCoordinator._process_new_data` (and so `_build_vehicle_info_dict`)
+using a fake client, and reports messages per second, per message latency,
+entity listener callbacks per message and memory growth. Callbacks are an
+upper bound of state writes: the device tracker skips writing some of them.
+
+Run it from the repository root in a Home Assistant development environment:
+
+    python benchmarks/vehicle_updates.py
+    python benchmarks/vehicle_updates.py --vehicles 1 5 25 --messages 5000
+    python benchmarks/vehicle_updates.py --replay messages.jsonl
+
+A replay file has one subscription message per line, as received by the
+`callback` of `Rivian.subscribe_for_vehicle_updates`.
+"""
+from __future__ import annotations
+
+import argparse
+import asyncio
+from collections.abc import Callable, Iterator
+from datetime import datetime, timedelta, timezone
+import gc
+import json
+from pathlib import Path
+import random
+import sys
+import tempfile
+import time
+import tracemalloc
+from typing import Any
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+# pylint: disable=wrong-import-position
+from homeassistant.core import HomeAssistant  # noqa: E402
+
+from custom_components.rivian.const import VEHICLE_STATE_API_FIELDS  # noqa: E402
+from custom_components.rivian.coordinator import VehicleCoordinator  # noqa: E402
+from custom_components.rivian.helpers import get_model_descriptions  # noqa: E402
+
+MODEL = "R1T"
+DEFAULT_VEHICLES = (1, 5, 25)
+DEFAULT_MESSAGES = 2000  # per vehicle
+FIELDS_PER_MESSAGE = (1, 5)  # fields changed by a synthetic message
+WARMUP = 0.1  # share of messages before memory is measured
+
+
+class FakeRivian:
+    """Stand-in for the Rivian client that only hands out subscriptions."""
+
+    def __init__(self) -> None:
+        """Initialize the client."""
+        self._ws_monitor = None
+        self.callbacks: dict[str, Callable[[dict[str, Any]], None]] = {}
+
+    async def subscribe_for_vehicle_updates(
+        self,
+        vehicle_id: str,
+        properties: set[str],
+        callback: Callable[[dict[str, Any]], None],
+    ) -> Callable[[], Any]:
+        """Subscribe to a vehicle's updates."""
+        self.callbacks[vehicle_id] = callback
+
+        async def unsubscribe() -> None:
+            self.callbacks.pop(vehicle_id, None)
+
+        return unsubscribe
+
+    async def close(self) -> None:
+        """Close the client."""
+
+
+def synthetic_messages(count: int, seed: int) -> Iterator[dict[str, Any]]:
+    """Generate subscription messages changing a few random fields each."""
+    rng = random.Random(seed)
+    model = get_model_descriptions(MODEL)
+    numeric = {
+        description.field
+        for description in model.sensors
+        if description.native_unit_of_measurement
+    }
+    fields = sorted(VEHICLE_STATE_API_FIELDS & model.fields)
+    timestamp = datetime(2024, 1, 1, tzinfo=timezone.utc)
+    latitude, longitude = 37.0, -122.0
+
+    for _ in range(count):
+        timestamp += timedelta(seconds=rng.uniform(0.5, 5))
+        stamp = timestamp.isoformat()
+        items: dict[str, Any] = {}
+        for field in rng.sample(fields, rng.randint(*FIELDS_PER_MESSAGE)):
+            if field == "gnssLocation":
+                latitude += rng.uniform(-1e-4, 1e-4)
+                longitude += rng.uniform(-1e-4, 1e-4)
+                items[field] = {
+                    "__typename": "VehicleLocation",
+                    "latitude": latitude,
+                    "longitude": longitude,
+                    "timeStamp": stamp,
+                }
+                continue
+            value: Any = (
+                round(rng.uniform(0, 100), 1)
+                if field in numeric
+                else rng.choice(("closed", "open", "unknown"))
+            )
+            items[field] = {
+                "__typename": "TimeStampedValue",
+                "timeStamp": stamp,
+                "value": value,
+            }
+        yield {"type": "data", "payload": {"data": {"vehicleState": items}}}
+
+
+def replayed_messages(path: Path) -> list[dict[str, Any]]:
+    """Load recorded subscription messages."""
+    with path.open(encoding="utf-8") as file:
+        return [json.loads(line) for line in file if line.strip()]
+
+
+def add_entity_listeners(coordinator: VehicleCoordinator, callbacks: list[int]) -> None:
+    """Listen the way the sensor, binary sensor and tracker entities do."""
+
+    def update() -> None:
+        callbacks[0] += 1
+
+    model = get_model_descriptions(MODEL)
+    for description in (*model.sensors, *model.binary_sensors):
+        field = description.field
+        context = None
+        if not getattr(description, "value_fn", None):
+            context = frozenset({field} if isinstance(field, str) else field)
+        coordinator.async_add_listener(update, context)
+    coordinator.async_add_listener(update, frozenset({"gnssLocation"}))
+
+
+async def async_run(
+    hass: HomeAssistant,
+    vehicles: int,
+    messages: list[dict[str, Any]],
+    measure_memory: bool,
+) -> dict[str, float]:
+    """Feed messages round robin to a number of vehicles.
+
+    Latencies aren't kept while measuring memory, so they don't count as growth.
+    """
+    client = FakeRivian()
+    callbacks = [0]
+    coordinators = []
+    for idx in range(vehicles):
+        coordinator = VehicleCoordinator(
+            hass, client, f"vehicle-{idx}"  # type: ignore[arg-type]
+        )
+        await coordinator._async_subscribe()  # pylint: disable=protected-access
+        add_entity_listeners(coordinator, callbacks)
+        coordinators.append(coordinator)
+
+    total = len(messages) * vehicles
+    latencies: list[float] = []
+    warmup = int(total * WARMUP)
+    gc.collect()
+    if measure_memory:
+        tracemalloc.start()
+    baseline = 0
+    sent = 0
+    busy = 0.0
+    for message in messages:
+        for coordinator in coordinators:
+            if measure_memory and sent == warmup:
+                baseline = tracemalloc.get_traced_memory()[0]
+            before = time.perf_counter()
+            client.callbacks[coordinator.vehicle_id](message)
+            latency = time.perf_counter() - before
+            busy += latency
+            if not measure_memory:
+                latencies.append(latency)
+            sent += 1
+            # let the loop drop the refresh timers replaced by each update
+            await asyncio.sleep(0)
+    growth = 0
+    if measure_memory:
+        growth = tracemalloc.get_traced_memory()[0] - baseline
+        tracemalloc.stop()
+
+    for coordinator in coordinators:
+        await coordinator.async_shutdown()
+
+    latencies = sorted(latencies) or [0.0]
+    return {
+        "messages": total,
+        "rate": total / busy,
+        "p50": latencies[len(latencies) // 2] * 1e6,
+        "p95": latencies[int(len(latencies) * 0.95)] * 1e6,
+        "p99": latencies[int(len(latencies) * 0.99)] * 1e6,
+        "callbacks": callbacks[0] / total,
+        "memory": growth / 1024,
+    }
+
+
+async def async_main(args: argparse.Namespace) -> None:
+    """Run the benchmark for every vehicle count."""
+    if args.replay:
+        messages = replayed_messages(args.replay)
+    else:
+        messages = list(synthetic_messages(args.messages, args.seed))
+
+    with tempfile.TemporaryDirectory() as config_dir:
+        hass = HomeAssistant(config_dir)
+        print(
+            f"{'vehicles':>8} {'messages':>9} {'msg/s':>10} {'p50 us':>8} "
+            f"{'p95 us':>8} {'p99 us':>8} {'calls/msg':>10} {'mem KiB':>9}"
+        )
+        for vehicles in args.vehicles:
+            timing = await async_run(hass, vehicles, messages, measure_memory=False)
+            memory = await async_run(hass, vehicles, messages, measure_memory=True)
+            print(
+                f"{vehicles:>8} {timing['messages']:>9} {timing['rate']:>10.0f} "
+                f"{timing['p50']:>8.1f} {timing['p95']:>8.1f} {timing['p99']:>8.1f} "
+                f"{timing['callbacks']:>10.2f} {memory['memory']:>9.1f}"
+            )
+        await hass.async_stop(force=True)
+
+
+def main() -> None:
+    """Parse the arguments and run the benchmark."""
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument(
+        "--vehicles", type=int, nargs="+", default=list(DEFAULT_VEHICLES)
+    )
+    parser.add_argument(
+        "--messages",
+        type=int,
+        default=DEFAULT_MESSAGES,
+        help="synthetic messages sent to each vehicle",
+    )
+    parser.add_argument(
+        "--replay", type=Path, help="JSON lines file of recorded messages"
+    )
+    parser.add_argument("--seed", type=int, default=0)
+    asyncio.run(async_main(parser.parse_args()))
+
+
+if __name__ == "__main__":
+    main()
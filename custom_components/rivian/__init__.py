@@ -1,36 +1,62 @@
 """Rivian (Unofficial)"""
 from __future__ import annotations
 
+import asyncio
+from collections.abc import Coroutine
 import logging
+from typing import Any
 
 from rivian import Rivian
 
 from homeassistant.config_entries import ConfigEntry
-from homeassistant.const import Platform
-from homeassistant.core import HomeAssistant
+from homeassistant.const import CONF_ZONE, Platform
+from homeassistant.core import Event, HomeAssistant, callback
 from homeassistant.exceptions import ConfigEntryNotReady
+from homeassistant.helpers import (
+    config_validation as cv,
+    device_registry as dr,
+    entity_registry as er,
+)
 from homeassistant.helpers.device_registry import DeviceEntry
 from homeassistant.helpers.issue_registry import (
     IssueSeverity,
     async_create_issue,
     async_delete_issue,
 )
+from homeassistant.helpers.typing import ConfigType
 
 from .const import (
     ATTR_API,
     ATTR_COORDINATOR,
+    ATTR_PLATFORMS,
+    ATTR_SNAPSHOT,
     ATTR_USER,
     ATTR_VEHICLE,
     ATTR_WALLBOX,
+    CONF_COALESCE_WINDOW,
     CONF_VEHICLE_CONTROL,
+    CONF_VEHICLE_IMAGE_STYLE,
     DOMAIN,
+    IMAGE_STYLE_CEL,
+    IMAGE_STYLE_NONE,
     ISSUE_URL,
     VERSION,
 )
-from .coordinator import UserCoordinator, VehicleCoordinator, WallboxCoordinator
-from .helpers import get_rivian_api_from_entry
+from .charging import ChargingSessionRecorder
+from .coordinator import (
+    RivianDataUpdateCoordinator,
+    UserCoordinator,
+    VehicleCoordinator,
+    WallboxCoordinator,
+)
+from .credentials import get_credential_refresher
+from .geofence import ZoneIndex
+from .helpers import async_get_vehicle_fields, get_rivian_api_from_entry
+from .services import async_setup_services
+from .snapshot import RivianSnapshotStore
 
 _LOGGER = logging.getLogger(__name__)
+CONFIG_SCHEMA = cv.config_entry_only_config_schema(DOMAIN)
 PLATFORMS: list[Platform] = [
     Platform.BINARY_SENSOR,
     Platform.BUTTON,
@@ -45,6 +71,23 @@ PLATFORMS: list[Platform] = [
     Platform.SWITCH,
     Platform.UPDATE,
 ]
+# Only set up for vehicles with vehicle control enabled
+CONTROL_PLATFORMS = {
+    Platform.BUTTON,
+    Platform.CLIMATE,
+    Platform.COVER,
+    Platform.LOCK,
+    Platform.NUMBER,
+    Platform.SELECT,
+    Platform.SWITCH,
+}
+PARALLEL_REFRESHES = 4
+
+
+async def async_setup(hass: HomeAssistant, config: ConfigType) -> bool:
+    """Set up the Rivian services."""
+    async_setup_services(hass)
+    return True
 
 
 async def async_setup_entry(hass: HomeAssistant, entry: ConfigEntry) -> bool:
@@ -58,15 +101,28 @@ async def async_setup_entry(hass: HomeAssistant, entry: ConfigEntry) -> bool:
     hass.data.setdefault(DOMAIN, {})
 
     client = get_rivian_api_from_entry(entry)
-    try:
-        await client.create_csrf_token()
-    except Exception as err:  # pylint: disable=broad-except
-        _LOGGER.error("Could not update Rivian Data: %s", err, exc_info=1)
-        await client.close()
-        raise ConfigEntryNotReady("Error communicating with API") from err
+    store = RivianSnapshotStore(hass, entry.entry_id)
+    if not RivianSnapshotStore.is_complete(snapshot := await store.async_load()):
+        snapshot = None
+        try:
+            await client.create_csrf_token()
+        except Exception as err:  # pylint: disable=broad-except
+            _LOGGER.error("Could not update Rivian Data: %s", err, exc_info=1)
+            await client.close()
+            raise ConfigEntryNotReady("Error communicating with API") from err
 
     coordinator = UserCoordinator(hass=hass, client=client, include_phones=True)
-    await coordinator.async_config_entry_first_refresh()
+    if snapshot:
+        coordinator.async_restore(snapshot["user"])
+        if entry.options.get(CONF_VEHICLE_CONTROL):
+            # phone identities aren't saved, get them now to set up vehicle control
+            try:
+                await get_credential_refresher(client).async_refresh()
+                await coordinator.async_refresh()
+            except Exception as err:  # pylint: disable=broad-except
+                _LOGGER.warning("Could not get enrolled phones: %s", err)
+    else:
+        await coordinator.async_config_entry_first_refresh()
 
     vehicle_control = entry.options.get(CONF_VEHICLE_CONTROL)
     if vehicle_control and not coordinator.data.get("registrationChannels"):
@@ -83,29 +139,94 @@ async def async_setup_entry(hass: HomeAssistant, entry: ConfigEntry) -> bool:
     else:
         async_delete_issue(hass, DOMAIN, entry.entry_id)
 
-    vehicles = coordinator.get_vehicles()
-    if vehicle_control and (
-        enrolled := coordinator.get_enrolled_phone_data(entry.options.get("public_key"))
-    ):
-        for vehicle_id in vehicles:
-            if vehicle_id in enrolled[1]:
-                vehicles[vehicle_id]["phone_identity_id"] = enrolled[1][vehicle_id]
-
-    vehicle_coordinators: dict[str, VehicleCoordinator] = {}
-    for vehicle_id in vehicles:
-        coor = VehicleCoordinator(hass=hass, client=client, vehicle_id=vehicle_id)
-        await coor.async_config_entry_first_refresh()
-        if not coor.data:
-            raise ConfigEntryNotReady("Issue loading vehicle data")
-        await coor.charging_coordinator.async_config_entry_first_refresh()
-        await coor.drivers_coordinator.async_config_entry_first_refresh()
-        vehicle_coordinators[vehicle_id] = coor
+    vehicles = _get_vehicles(entry, coordinator, bool(vehicle_control))
 
+    coalesce_window = entry.options.get(CONF_COALESCE_WINDOW, 0)
+    vehicle_coordinators: dict[str, VehicleCoordinator] = {
+        vehicle_id: VehicleCoordinator(
+            hass=hass,
+            client=client,
+            vehicle_id=vehicle_id,
+            coalesce_window=coalesce_window,
+            fields=async_get_vehicle_fields(hass, vehicle),
+        )
+        for vehicle_id, vehicle in vehicles.items()
+    }
     wallbox_coordinator = WallboxCoordinator(hass=hass, client=client)
-    await wallbox_coordinator.async_config_entry_first_refresh()
+    await asyncio.gather(
+        *(
+            coor.charging_coordinator.sessions.async_load()
+            for coor in vehicle_coordinators.values()
+        )
+    )
 
+    if zone_entity_ids := entry.options.get(CONF_ZONE):
+        zone_index = ZoneIndex(hass, zone_entity_ids)
+        entry.async_on_unload(zone_index.async_start())
+        for coor in vehicle_coordinators.values():
+            coor.zone_index = zone_index
+
+    if snapshot:
+        for vehicle_id, coor in vehicle_coordinators.items():
+            coor.async_restore(snapshot["vehicle"][vehicle_id])
+            if data := snapshot["charging"].get(vehicle_id):
+                coor.charging_coordinator.async_restore(data)
+            if data := snapshot["drivers"].get(vehicle_id):
+                coor.drivers_coordinator.async_restore(data)
+        wallbox_coordinator.async_restore(snapshot["wallbox"])
+        entry.async_create_background_task(
+            hass,
+            _async_refresh_restored(
+                hass,
+                entry,
+                client,
+                coordinator,
+                vehicles,
+                vehicle_coordinators,
+                wallbox_coordinator,
+            ),
+            f"{DOMAIN} refresh restored data",
+        )
+    else:
+        await _async_refresh_all(
+            vehicle_coordinators, wallbox_coordinator, first_refresh=True
+        )
+
+    @callback
+    def _entity_registry_filter(event: Event) -> bool:
+        """Filter entity registry events to this entry's entities being toggled."""
+        if (
+            event.data["action"] != "update"
+            or "disabled_by" not in event.data["changes"]
+        ):
+            return False
+        entity = er.async_get(hass).async_get(event.data["entity_id"])
+        return entity is not None and entity.config_entry_id == entry.entry_id
+
+    async def _async_update_fields(_: Event) -> None:
+        """Request only the fields of enabled entities."""
+        for vehicle_id, coor in vehicle_coordinators.items():
+            await coor.async_set_fields(
+                async_get_vehicle_fields(hass, vehicles[vehicle_id])
+            )
+
+    entry.async_on_unload(
+        hass.bus.async_listen(
+            er.EVENT_ENTITY_REGISTRY_UPDATED,
+            _async_update_fields,
+            event_filter=_entity_registry_filter,
+        )
+    )
+
+    store.async_track(coordinator, vehicle_coordinators, wallbox_coordinator)
+    for coor in (*vehicle_coordinators.values(), wallbox_coordinator):
+        entry.async_on_unload(coor.async_add_listener(store.async_schedule_save))
+
+    platforms = _get_platforms(entry, vehicles)
     hass.data[DOMAIN][entry.entry_id] = {
         ATTR_API: client,
+        ATTR_PLATFORMS: platforms,
+        ATTR_SNAPSHOT: store,
         ATTR_VEHICLE: vehicles,
         ATTR_COORDINATOR: {
             ATTR_USER: coordinator,
@@ -114,16 +235,136 @@ async def async_setup_entry(hass: HomeAssistant, entry: ConfigEntry) -> bool:
         },
     }
 
-    await hass.config_entries.async_forward_entry_setups(entry, PLATFORMS)
+    await hass.config_entries.async_forward_entry_setups(entry, platforms)
 
     entry.async_on_unload(entry.add_update_listener(update_listener))
 
     return True
 
 
+def _get_vehicles(
+    entry: ConfigEntry, coordinator: UserCoordinator, vehicle_control: bool
+) -> dict[str, dict[str, Any]]:
+    """Get the user's vehicles, with phone identities if controlling them."""
+    vehicles = coordinator.get_vehicles()
+    if vehicle_control and (
+        enrolled := coordinator.get_enrolled_phone_data(entry.options.get("public_key"))
+    ):
+        for vehicle_id in vehicles:
+            if vehicle_id in enrolled[1]:
+                vehicles[vehicle_id]["phone_identity_id"] = enrolled[1][vehicle_id]
+    return vehicles
+
+
+def _get_platforms(
+    entry: ConfigEntry, vehicles: dict[str, dict[str, Any]]
+) -> list[Platform]:
+    """Get the platforms that will have entities for a config entry."""
+    skip = set()
+    if not any(vehicle.get("phone_identity_id") for vehicle in vehicles.values()):
+        skip |= CONTROL_PLATFORMS
+    if entry.options.get(CONF_VEHICLE_IMAGE_STYLE, IMAGE_STYLE_CEL) == IMAGE_STYLE_NONE:
+        skip.add(Platform.IMAGE)
+    return [platform for platform in PLATFORMS if platform not in skip]
+
+
+async def _async_refresh_all(
+    vehicle_coordinators: dict[str, VehicleCoordinator],
+    wallbox_coordinator: WallboxCoordinator,
+    first_refresh: bool = False,
+) -> None:
+    """Refresh the vehicle and wallbox coordinators, limiting parallel requests."""
+    semaphore = asyncio.Semaphore(PARALLEL_REFRESHES)
+
+    async def _refresh(coor: RivianDataUpdateCoordinator) -> None:
+        """Refresh a coordinator."""
+        async with semaphore:
+            if first_refresh:
+                await coor.async_config_entry_first_refresh()
+            else:
+                await coor.async_refresh()
+
+    async def _refresh_vehicle(coor: VehicleCoordinator) -> None:
+        """Refresh a vehicle and its related coordinators."""
+        await _refresh(coor)
+        if not coor.data:
+            raise ConfigEntryNotReady("Issue loading vehicle data")
+        await _async_gather(
+            _refresh(coor.charging_coordinator), _refresh(coor.drivers_coordinator)
+        )
+
+    await _async_gather(
+        *(_refresh_vehicle(coor) for coor in vehicle_coordinators.values()),
+        _refresh(wallbox_coordinator),
+    )
+
+
+async def _async_gather(*coros: Coroutine[Any, Any, None]) -> None:
+    """Run coroutines concurrently, cancelling the others if one of them fails."""
+    tasks = [asyncio.ensure_future(coro) for coro in coros]
+    try:
+        await asyncio.gather(*tasks)
+    except BaseException:
+        # don't leave refreshes running, and subscribing, after setup failed
+        for task in tasks:
+            task.cancel()
+        await asyncio.gather(*tasks, return_exceptions=True)
+        raise
+
+
+async def _async_refresh_restored(
+    hass: HomeAssistant,
+    entry: ConfigEntry,
+    client: Rivian,
+    user_coordinator: UserCoordinator,
+    vehicles: dict[str, dict[str, Any]],
+    vehicle_coordinators: dict[str, VehicleCoordinator],
+    wallbox_coordinator: WallboxCoordinator,
+) -> None:
+    """Replace restored data with live data, reloading if the vehicles changed."""
+    credentials = get_credential_refresher(client)
+    attempt = 0
+    while True:
+        try:
+            await credentials.async_refresh()
+            break
+        except Exception as err:  # pylint: disable=broad-except
+            delay = min(30 * 2**attempt, 900)
+            _LOGGER.warning(
+                "Could not update Rivian Data, retrying in %ss: %s", delay, err
+            )
+            await asyncio.sleep(delay)
+            attempt += 1
+
+    await user_coordinator.async_refresh()
+    vehicle_control = bool(
+        entry.options.get(CONF_VEHICLE_CONTROL)
+        and user_coordinator.data.get("registrationChannels")
+    )
+    live = _get_vehicles(entry, user_coordinator, vehicle_control)
+    changed = _phone_identities(live) != _phone_identities(vehicles)
+    if changed and not user_coordinator.stale:
+        _LOGGER.info("Rivian vehicles changed, reloading")
+        hass.async_create_task(hass.config_entries.async_reload(entry.entry_id))
+        return
+    await _async_refresh_all(vehicle_coordinators, wallbox_coordinator)
+
+
+def _phone_identities(vehicles: dict[str, dict[str, Any]]) -> dict[str, str | None]:
+    """Get the phone identity of each vehicle, `None` if not controlled."""
+    return {
+        vehicle_id: vehicle.get("phone_identity_id")
+        for vehicle_id, vehicle in vehicles.items()
+    }
+
+
 async def async_unload_entry(hass: HomeAssistant, entry: ConfigEntry) -> bool:
     """Unload a config entry."""
-    unload_ok = await hass.config_entries.async_unload_platforms(entry, PLATFORMS)
+    platforms = hass.data[DOMAIN][entry.entry_id][ATTR_PLATFORMS]
+    unload_ok = await hass.config_entries.async_unload_platforms(entry, platforms)
+
+    store: RivianSnapshotStore = hass.data[DOMAIN][entry.entry_id][ATTR_SNAPSHOT]
+    await store.async_save()
 
     api: Rivian = hass.data[DOMAIN][entry.entry_id][ATTR_API]
     await api.close()
@@ -136,6 +377,14 @@ async def async_unload_entry(hass: HomeAssistant, entry: ConfigEntry) -> bool:
 
 async def async_remove_entry(hass: HomeAssistant, entry: ConfigEntry) -> None:
     """Handle removal of an entry."""
+    await RivianSnapshotStore(hass, entry.entry_id).async_remove()
+    # vehicle devices are identified by both vin and id, only ids have sessions
+    for device in dr.async_entries_for_config_entry(dr.async_get(hass), entry.entry_id):
+        if device.config_entries != {entry.entry_id}:
+            continue  # also set up by another entry, which keeps using its sessions
+        for domain, vehicle_id in device.identifiers:
+            if domain == DOMAIN:
+                await ChargingSessionRecorder(hass, vehicle_id).async_remove()
     if public_key := entry.options.get("public_key"):
         client = client = get_rivian_api_from_entry(entry)
         coordinator = UserCoordinator(hass=hass, client=client, include_phones=True)
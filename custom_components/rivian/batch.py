@@ -0,0 +1,281 @@
+"""Batch Rivian GraphQL queries that fall due together into a single request."""
+from __future__ import annotations
+
+import asyncio
+from collections.abc import Awaitable, Callable
+from dataclasses import dataclass
+import logging
+import time
+from typing import Any
+from weakref import WeakKeyDictionary, ref
+
+from aiohttp import ClientResponse
+from rivian import Rivian
+from rivian.exceptions import (
+    RivianApiException,
+    RivianApiRateLimitError,
+    RivianExpiredTokenError,
+    RivianUnauthenticated,
+)
+import rivian.rivian
+
+from .scheduler import get_request_scheduler
+
+_LOGGER = logging.getLogger(__name__)
+
+BATCH_WINDOW = 0.5  # seconds
+
+# The client has no public way to send an arbitrary query, so batched queries
+# rely on its internals, see RivianQueryAdapter
+_BASE_HEADERS: dict[str, str] | None = getattr(rivian.rivian, "BASE_HEADERS", None)
+_CLIENT_INTERNALS = (
+    "_Rivian__graphql_query",
+    "_build_vehicle_state_fragment",
+    "_csrf_token",
+    "_app_session_token",
+    "_user_session_token",
+)
+GRAPHQL_CHARGING: str = getattr(
+    rivian.rivian, "GRAPHQL_CHARGING", "https://rivian.com/api/gql/chrg/user/graphql"
+)
+GRAPHQL_GATEWAY: str = getattr(
+    rivian.rivian, "GRAPHQL_GATEWAY", "https://rivian.com/api/gql/gateway/graphql"
+)
+LIVE_SESSION_VALUE_RECORD_KEYS: set[str] = getattr(
+    rivian.rivian, "LIVE_SESSION_VALUE_RECORD_KEYS", set()
+)
+VALUE_RECORD_TEMPLATE: str = getattr(
+    rivian.rivian, "VALUE_RECORD_TEMPLATE", "{ __typename value updatedAt }"
+)
+
+DRIVERS_SELECTION = (
+    "{ __typename id vin invitedUsers { __typename ... on ProvisionedUser {"
+    " firstName lastName email roles userId devices {"
+    " type mappedIdentityId id hrid deviceName isPaired isEnabled } }"
+    " ... on UnprovisionedUser { email inviteId status } } }"
+)
+USER_SELECTION = (
+    "{ __typename id vehicles { id vin name vas { __typename vasVehicleId"
+    " vehiclePublicKey } roles state createdAt updatedAt vehicle { __typename id"
+    " vin modelYear make model expectedBuildDate plannedBuildDate"
+    " expectedGeneralAssemblyStartDate actualGeneralAssemblyDate vehicleState {"
+    " supportedFeatures { __typename name status } } } } registrationChannels {"
+    " type } %s}"
+)
+USER_PHONES_SELECTION = (
+    "enrolledPhones { __typename vas { __typename vasPhoneId publicKey } enrolled {"
+    " __typename deviceType deviceName vehicleId identityId shortName } } "
+)
+WALLBOX_SELECTION = (
+    "{ __typename wallboxId userId wifiId name linked latitude longitude"
+    " chargingStatus power currentVoltage currentAmps softwareVersion model"
+    " serialNumber maxAmps maxVoltage maxPower }"
+)
+
+
+def live_session_selection(properties: set[str]) -> str:
+    """Build the live charging session selection from properties."""
+    fields = " ".join(
+        f"{p} {VALUE_RECORD_TEMPLATE}" if p in LIVE_SESSION_VALUE_RECORD_KEYS else p
+        for p in sorted(properties)
+    )
+    return f"{{ __typename {fields} }}"
+
+
+@dataclass(frozen=True)
+class BatchOperation:
+    """A root field query that can be combined with others on the same endpoint."""
+
+    key: str
+    url: str
+    field: str
+    selection: str
+    variables: dict[str, tuple[str, Any]]
+    fallback: Callable[[], Awaitable[ClientResponse]]
+
+
+class BatchResponse:
+    """The part of a batched response belonging to a single operation."""
+
+    status = 200
+
+    def __init__(self, data: dict[str, Any], latency: float, size: int) -> None:
+        """Initialize the response.
+
+        `size` is the operation's share of the batched response's size.
+        """
+        self._data = data
+        self.latency = latency
+        self.size = size
+
+    async def json(self) -> dict[str, Any]:
+        """Return the response data."""
+        return self._data
+
+    def raise_for_status(self) -> None:
+        """Batched responses are always successful."""
+
+
+class RivianQueryAdapter:
+    """Send raw GraphQL queries through the Rivian client's internals."""
+
+    def __init__(self, client: Rivian) -> None:
+        """Initialize the adapter."""
+        self._api = ref(client)
+        self.supported = _BASE_HEADERS is not None and all(
+            hasattr(client, attr) for attr in _CLIENT_INTERNALS
+        )
+        if not self.supported:
+            _LOGGER.debug("Rivian client can't send batched queries")
+
+    def vehicle_state_selection(self, properties: set[str]) -> str:
+        """Build the client's vehicle state selection of properties."""
+        if (api := self._api()) is None:
+            raise RivianApiException("Rivian client has been closed")
+        return getattr(api, "_build_vehicle_state_fragment")(properties)
+
+    async def async_query(self, url: str, body: dict[str, Any]) -> ClientResponse:
+        """Send a query with the client's session headers."""
+        # pylint: disable=protected-access
+        if (api := self._api()) is None or _BASE_HEADERS is None:
+            raise RivianApiException("Rivian client has been closed")
+        headers = _BASE_HEADERS | {
+            "Csrf-Token": api._csrf_token,
+            "A-Sess": api._app_session_token,
+            "U-Sess": api._user_session_token,
+        }
+        return await getattr(api, "_Rivian__graphql_query")(headers, url, body)
+
+
+class RivianRequestBatcher:
+    """Combine operations requested within a short window into one request."""
+
+    def __init__(self, client: Rivian, window: float = BATCH_WINDOW) -> None:
+        """Initialize the batcher."""
+        self.adapter = RivianQueryAdapter(client)
+        self.scheduler = get_request_scheduler(client)
+        self.window = window
+        self._pending: dict[str, list[tuple[BatchOperation, asyncio.Future]]] = {}
+        self._timer: asyncio.TimerHandle | None = None
+        self._tasks: set[asyncio.Task] = set()
+
+    async def async_fetch(
+        self, operation: BatchOperation
+    ) -> ClientResponse | BatchResponse:
+        """Queue an operation and wait for its response."""
+        loop = asyncio.get_running_loop()
+        future: asyncio.Future[ClientResponse | BatchResponse] = loop.create_future()
+        self._pending.setdefault(operation.url, []).append((operation, future))
+        if self._timer is None:
+            self._timer = loop.call_later(self.window, self._flush)
+        return await future
+
+    def _flush(self) -> None:
+        """Send the pending operations, one request per endpoint."""
+        self._timer = None
+        pending, self._pending = self._pending, {}
+        for url, operations in pending.items():
+            task = asyncio.get_running_loop().create_task(
+                self._async_send(url, operations)
+            )
+            self._tasks.add(task)
+            task.add_done_callback(self._tasks.discard)
+
+    async def _async_send(
+        self, url: str, operations: list[tuple[BatchOperation, asyncio.Future]]
+    ) -> None:
+        """Send operations and resolve their futures."""
+        if len(operations) == 1:
+            operation, future = operations[0]
+            try:
+                response = await self.scheduler.async_request(operation.fallback)
+            except Exception as err:  # pylint: disable=broad-except
+                _set_exception(future, err)
+            else:
+                _set_result(future, response)
+            return
+
+        if not self.adapter.supported:
+            # fall back to the client's public method for each operation
+            await asyncio.gather(
+                *(self._async_send(url, [operation]) for operation in operations)
+            )
+            return
+
+        try:
+            response, latency = await self.scheduler.async_request(
+                lambda: self._async_query(url, [op for op, _ in operations])
+            )
+            size = len(await response.read()) // len(operations)
+            if not isinstance(data := (await response.json()).get("data"), dict):
+                raise RivianApiException("Batched response has no data")
+        except (
+            RivianApiRateLimitError,
+            RivianExpiredTokenError,
+            RivianUnauthenticated,
+        ) as err:
+            for _, future in operations:
+                _set_exception(future, err)
+        except RivianApiException as err:
+            # one operation may have failed, so retry them on their own
+            _LOGGER.debug("Batched request failed, sending separately: %s", err)
+            await asyncio.gather(
+                *(self._async_send(url, [operation]) for operation in operations)
+            )
+        except Exception as err:  # pylint: disable=broad-except
+            for _, future in operations:
+                _set_exception(future, err)
+        else:
+            for idx, (operation, future) in enumerate(operations):
+                _set_result(
+                    future,
+                    BatchResponse(
+                        {"data": {operation.key: data.get(f"b{idx}")}}, latency, size
+                    ),
+                )
+
+    async def _async_query(
+        self, url: str, operations: list[BatchOperation]
+    ) -> tuple[ClientResponse, float]:
+        """Send a single query combining all operations, returning its latency."""
+        declarations, fields, variables = [], [], {}
+        for idx, operation in enumerate(operations):
+            field = operation.field
+            for name, (graphql_type, value) in operation.variables.items():
+                alias = f"b{idx}_{name}"
+                field = field.replace(f"${name}", f"${alias}")
+                declarations.append(f"${alias}: {graphql_type}")
+                variables[alias] = value
+            fields.append(f"b{idx}: {field} {operation.selection}")
+
+        args = f"({', '.join(declarations)})" if declarations else ""
+        body = {
+            "operationName": "RivianBatch",
+            "query": f"query RivianBatch{args} {{ {' '.join(fields)} }}",
+            "variables": variables or None,
+        }
+        start = time.monotonic()
+        response = await self.adapter.async_query(url, body)
+        return response, time.monotonic() - start
+
+
+def _set_result(future: asyncio.Future, result: Any) -> None:
+    """Set the result of a future that may have been cancelled."""
+    if not future.done():
+        future.set_result(result)
+
+
+def _set_exception(future: asyncio.Future, err: Exception) -> None:
+    """Set the exception of a future that may have been cancelled."""
+    if not future.done():
+        future.set_exception(err)
+
+
+_BATCHERS: WeakKeyDictionary[Rivian, RivianRequestBatcher] = WeakKeyDictionary()
+
+
+def get_request_batcher(client: Rivian) -> RivianRequestBatcher:
+    """Get the request batcher shared by all users of a client."""
+    if (batcher := _BATCHERS.get(client)) is None:
+        batcher = _BATCHERS[client] = RivianRequestBatcher(client)
+    return batcher
@@ -10,10 +10,11 @@ from homeassistant.const import STATE_UNAVAILABLE
 from homeassistant.core import HomeAssistant
 from homeassistant.helpers.entity_platform import AddEntitiesCallback
 
-from .const import ATTR_COORDINATOR, ATTR_VEHICLE, BINARY_SENSORS, DOMAIN
+from .const import ATTR_COORDINATOR, ATTR_VEHICLE, DOMAIN
 from .coordinator import VehicleCoordinator
 from .data_classes import RivianBinarySensorEntityDescription
 from .entity import RivianVehicleEntity
+from .helpers import get_model_descriptions
 
 
 async def async_setup_entry(
@@ -27,9 +28,7 @@ async def async_setup_entry(
     entities = [
         RivianBinarySensorEntity(coordinators[vehicle_id], entry, description, vehicle)
         for vehicle_id, vehicle in vehicles.items()
-        for model, descriptions in BINARY_SENSORS.items()
-        if model in vehicle["model"]
-        for description in descriptions
+        for description in get_model_descriptions(vehicle["model"]).binary_sensors
     ]
 
     async_add_entities(entities)
@@ -88,7 +87,7 @@ class RivianBinarySensorEntity(RivianVehicleEntity, BinarySensorEntity):
             return {
                 "value": entity["value"],
                 "last_update": entity["timeStamp"],
-                "history": str(entity["history"]),
+                **self._get_history(self.entity_description.field),
             }
         except KeyError:
             return None
@@ -2,18 +2,14 @@
 from __future__ import annotations
 
 import asyncio
+import importlib
 import logging
 import platform
-from typing import Any, Final
+from typing import TYPE_CHECKING, Any, Final
 from uuid import UUID
 
-from bleak import BLEDevice
-from home_assistant_bluetooth import BluetoothServiceInfoBleak
 from rivian import VehicleCommand
-import rivian.ble as rivian_ble
 
-from homeassistant.components import bluetooth
-from homeassistant.components.bluetooth import BluetoothScanningMode
 from homeassistant.components.button import ButtonEntity, ButtonEntityDescription
 from homeassistant.config_entries import ConfigEntry
 from homeassistant.core import HomeAssistant, HomeAssistantError
@@ -24,6 +20,10 @@ from .coordinator import UserCoordinator, VehicleCoordinator
 from .data_classes import RivianButtonEntityDescription
 from .entity import RivianVehicleControlEntity
 
+if TYPE_CHECKING:
+    from bleak import BLEDevice
+    from home_assistant_bluetooth import BluetoothServiceInfoBleak
+
 _LOGGER = logging.getLogger(__name__)
 
 
@@ -126,6 +126,23 @@ class RivianPairPhoneButtonEntity(RivianVehicleControlEntity, ButtonEntity):
             )
 
         self._pairing = True
+        try:
+            await self._async_pair()
+        except BaseException:
+            # allow pressing again after a failure, such as bluetooth missing
+            self._pairing = False
+            raise
+
+    async def _async_pair(self) -> None:
+        """Find the vehicle's phone key and pair with it."""
+        # the bluetooth stack is only needed to pair, so load it on demand,
+        # in the executor since importing it blocks
+        rivian_ble, bluetooth = await asyncio.gather(
+            *(
+                self.hass.async_add_executor_job(importlib.import_module, name)
+                for name in ("rivian.ble", "homeassistant.components.bluetooth")
+            )
+        )
 
         entry_data = self.hass.data[DOMAIN][self._config_entry.entry_id]
         vehicle = entry_data[ATTR_VEHICLE][self.coordinator.vehicle_id]
@@ -152,7 +169,7 @@ class RivianPairPhoneButtonEntity(RivianVehicleControlEntity, ButtonEntity):
                     self.hass,
                     _process_more_advertisements,
                     {"local_name": rivian_ble.DEVICE_LOCAL_NAME, "connectable": True},
-                    BluetoothScanningMode.ACTIVE,
+                    bluetooth.BluetoothScanningMode.ACTIVE,
                     30,
                 )
                 return (
@@ -0,0 +1,303 @@
+"""Recorded time series and summaries of live charging sessions."""
+from __future__ import annotations
+
+from array import array
+import asyncio
+from datetime import datetime
+import logging
+import math
+import os
+import struct
+import time
+from typing import Any, TypedDict
+
+from homeassistant.core import HomeAssistant
+from homeassistant.helpers.storage import STORAGE_DIR, Store
+from homeassistant.util import dt as dt_util
+
+from .const import DOMAIN
+
+_LOGGER = logging.getLogger(__name__)
+
+STORAGE_VERSION = 1
+SAVE_DELAY = 10  # seconds
+MAX_SESSIONS = 100  # sessions kept, older samples are compacted away
+
+# timestamp, power (kW), energy (kWh), range added (km), cost
+SAMPLE = struct.Struct("<dffff")
+
+
+class ChargingSession(TypedDict):
+    """Summary of a finished charging session."""
+
+    start: str
+    end: str
+    duration: float  # seconds
+    energy: float | None  # kilowatt hours
+    peak_power: float | None  # kilowatts
+    average_power: float | None  # kilowatts
+    cost: float | None
+    currency: str | None
+    range_added: float | None  # kilometers
+    offset: int  # index of the first sample in the sample file
+    samples: int
+
+
+class ActiveSession(TypedDict):
+    """A charging session that is still being recorded."""
+
+    start_time: str
+    currency: str | None
+    offset: int
+
+
+class ChargingStoreData(TypedDict):
+    """Saved charging sessions."""
+
+    sessions: list[ChargingSession]
+    active: ActiveSession | None
+
+
+class ChargingSeries:
+    """Array backed samples of a charging session."""
+
+    def __init__(self) -> None:
+        """Initialize the series."""
+        self.times = array("d")
+        self.power = array("f")
+        self.energy = array("f")
+        self.range_added = array("f")
+        self.cost = array("f")
+
+    def __len__(self) -> int:
+        """Return the number of samples."""
+        return len(self.times)
+
+    def append(self, sample: tuple[float, float, float, float, float]) -> None:
+        """Append a `(timestamp, power, energy, range added, cost)` sample."""
+        for values, value in zip(
+            (self.times, self.power, self.energy, self.range_added, self.cost), sample
+        ):
+            values.append(value)
+
+    def summarize(self, offset: int, currency: str | None) -> ChargingSession:
+        """Summarize the session."""
+        duration = self.times[-1] - self.times[0]
+        energy = _last(self.energy)
+        power = [value for value in self.power if not math.isnan(value)]
+        if energy is not None and duration >= 60:
+            average_power = energy / (duration / 3600)
+        else:
+            average_power = sum(power) / len(power) if power else None
+        return {
+            "start": dt_util.utc_from_timestamp(self.times[0]).isoformat(),
+            "end": dt_util.utc_from_timestamp(self.times[-1]).isoformat(),
+            "duration": round(duration),
+            "energy": _round(energy),
+            "peak_power": _round(max(power, default=None)),
+            "average_power": _round(average_power),
+            "cost": _round(_last(self.cost)),
+            "currency": currency,
+            "range_added": _round(_last(self.range_added)),
+            "offset": offset,
+            "samples": len(self),
+        }
+
+
+class ChargingSessionRecorder:
+    """Record the live charging sessions of a vehicle.
+
+    Samples are appended to a binary file of fixed size records as they are
+    received, so a session in progress survives a restart. Finished sessions
+    are summarized into a small JSON store pointing into that file.
+    """
+
+    def __init__(self, hass: HomeAssistant, vehicle_id: str) -> None:
+        """Initialize the recorder."""
+        self.hass = hass
+        self._store: Store[ChargingStoreData] = Store(
+            hass, STORAGE_VERSION, f"{DOMAIN}.charging.{vehicle_id}"
+        )
+        self._path = hass.config.path(
+            STORAGE_DIR, f"{DOMAIN}.charging.{vehicle_id}.bin"
+        )
+        self._lock = asyncio.Lock()
+        self.sessions: list[ChargingSession] = []
+        self._active: ActiveSession | None = None
+        self._series: ChargingSeries | None = None
+        self._last_sample: tuple[Any, ...] | None = None
+
+    @property
+    def last(self) -> ChargingSession | None:
+        """Return the last finished session."""
+        return self.sessions[-1] if self.sessions else None
+
+    async def async_load(self) -> None:
+        """Load the sessions, resuming a session that was being recorded."""
+        if not (data := await self._store.async_load()):
+            return
+        self.sessions = data["sessions"]
+        if active := data["active"]:
+            self._active = active
+            self._series = ChargingSeries()
+            for sample in await self.hass.async_add_executor_job(
+                self._read, active["offset"], None
+            ):
+                self._series.append(sample)
+
+    async def async_update(self, data: dict[str, Any] | None) -> None:
+        """Record the latest live session data."""
+
+        def value(key: str) -> Any | None:
+            val = (data or {}).get(key)
+            return val.get("value") if isinstance(val, dict) else val
+
+        async with self._lock:
+            if (start_time := value("startTime")) is None:
+                await self._async_finish()
+                return
+            if self._active and self._active["start_time"] != start_time:
+                await self._async_finish()
+            if self._active is None:
+                offset = await self.hass.async_add_executor_job(self._count)
+                self._active = {
+                    "start_time": start_time,
+                    "currency": value("currentCurrency"),
+                    "offset": offset,
+                }
+                self._series = ChargingSeries()
+                self._store.async_delay_save(self._data_to_save, SAVE_DELAY)
+
+            sample = (
+                _float(value("power")),
+                _float(value("totalChargedEnergy")),
+                _float(value("rangeAddedThisSession")),
+                _float(value("currentPrice")),
+            )
+            if sample == self._last_sample:
+                return
+            self._last_sample = sample
+            record = (time.time(), *sample)
+            if self._series is not None:
+                self._series.append(record)
+            await self.hass.async_add_executor_job(self._append, record)
+
+    async def async_query(
+        self,
+        start: datetime | None = None,
+        end: datetime | None = None,
+        include_samples: bool = False,
+    ) -> list[dict[str, Any]]:
+        """Get the finished sessions that overlap a time range."""
+        sessions = [
+            session
+            for session in self.sessions
+            if (end is None or dt_util.parse_datetime(session["start"]) <= end)
+            and (start is None or dt_util.parse_datetime(session["end"]) >= start)
+        ]
+        results = []
+        for session in sessions:
+            result: dict[str, Any] = {
+                key: val for key, val in session.items() if key != "offset"
+            }
+            if include_samples:
+                samples = await self.hass.async_add_executor_job(
+                    self._read, session["offset"], session["samples"]
+                )
+                result["series"] = [
+                    [None if math.isnan(val) else round(val, 3) for val in sample]
+                    for sample in samples
+                ]
+            results.append(result)
+        return results
+
+    async def _async_finish(self) -> None:
+        """Summarize the active session and compact old ones away."""
+        active, series = self._active, self._series
+        self._active = self._series = self._last_sample = None
+        if active is None:
+            return
+        if series:
+            session = series.summarize(active["offset"], active["currency"])
+            _LOGGER.debug("Charging session finished: %s", session)
+            self.sessions.append(session)
+        if len(self.sessions) > MAX_SESSIONS:
+            del self.sessions[: len(self.sessions) - MAX_SESSIONS]
+            drop = self.sessions[0]["offset"]
+            await self.hass.async_add_executor_job(self._compact, drop)
+            for session in self.sessions:
+                session["offset"] -= drop
+        self._store.async_delay_save(self._data_to_save, SAVE_DELAY)
+
+    async def async_remove(self) -> None:
+        """Remove the recorded sessions and their samples."""
+        await self._store.async_remove()
+        await self.hass.async_add_executor_job(self._remove)
+
+    def _data_to_save(self) -> ChargingStoreData:
+        """Return the data to save."""
+        return {"sessions": self.sessions, "active": self._active}
+
+    def _count(self) -> int:
+        """Return the number of samples in the sample file."""
+        try:
+            return os.path.getsize(self._path) // SAMPLE.size
+        except FileNotFoundError:
+            return 0
+
+    def _append(self, sample: tuple[float, ...]) -> None:
+        """Append a sample to the sample file."""
+        os.makedirs(os.path.dirname(self._path), exist_ok=True)
+        with open(self._path, "ab") as file:
+            file.write(SAMPLE.pack(*sample))
+
+    def _remove(self) -> None:
+        """Remove the sample file."""
+        try:
+            os.remove(self._path)
+        except FileNotFoundError:
+            pass
+
+    def _read(
+        self, offset: int, count: int | None
+    ) -> list[tuple[float, float, float, float, float]]:
+        """Read samples from the sample file, to its end if `count` is `None`."""
+        try:
+            with open(self._path, "rb") as file:
+                file.seek(offset * SAMPLE.size)
+                data = file.read(-1 if count is None else count * SAMPLE.size)
+        except FileNotFoundError:
+            return []
+        # ignore a partially written last sample
+        data = data[: len(data) - len(data) % SAMPLE.size]
+        return list(SAMPLE.iter_unpack(data))
+
+    def _compact(self, drop: int) -> None:
+        """Remove the first `drop` samples from the sample file."""
+        try:
+            with open(self._path, "rb") as file:
+                file.seek(drop * SAMPLE.size)
+                data = file.read()
+        except FileNotFoundError:
+            return
+        with open(f"{self._path}.tmp", "wb") as file:
+            file.write(data)
+        os.replace(f"{self._path}.tmp", self._path)
+
+
+def _float(value: Any) -> float:
+    """Convert a value to a float, NaN if it isn't a number."""
+    try:
+        return float(value)
+    except (TypeError, ValueError):
+        return math.nan
+
+
+def _last(values: array) -> float | None:
+    """Return the last value that is a number."""
+    return next((value for value in reversed(values) if not math.isnan(value)), None)
+
+
+def _round(value: float | None) -> float | None:
+    """Round a summary value."""
+    return None if value is None else round(value, 2)
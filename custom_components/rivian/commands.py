@@ -0,0 +1,142 @@
+"""Per-vehicle queue of Rivian vehicle commands."""
+from __future__ import annotations
+
+import asyncio
+from collections import OrderedDict
+from collections.abc import Awaitable, Callable
+import logging
+from typing import Any
+
+from rivian import VehicleCommand
+
+from homeassistant.core import HomeAssistant
+
+_LOGGER = logging.getLogger(__name__)
+
+WAKE_TIMEOUT = 30  # seconds
+
+# commands setting the same thing, where only the last one queued matters
+COMMAND_TARGETS: dict[VehicleCommand, str] = {
+    VehicleCommand.CHARGING_LIMITS: "charging_limit",
+    VehicleCommand.START_CHARGING: "charging",
+    VehicleCommand.STOP_CHARGING: "charging",
+    VehicleCommand.CABIN_HVAC_DEFROST_DEFOG: "defrost",
+    VehicleCommand.CABIN_HVAC_LEFT_SEAT_HEAT: "left_seat_heat",
+    VehicleCommand.CABIN_HVAC_LEFT_SEAT_VENT: "left_seat_vent",
+    VehicleCommand.CABIN_HVAC_REAR_LEFT_SEAT_HEAT: "rear_left_seat_heat",
+    VehicleCommand.CABIN_HVAC_REAR_RIGHT_SEAT_HEAT: "rear_right_seat_heat",
+    VehicleCommand.CABIN_HVAC_RIGHT_SEAT_HEAT: "right_seat_heat",
+    VehicleCommand.CABIN_HVAC_RIGHT_SEAT_VENT: "right_seat_vent",
+    VehicleCommand.CABIN_HVAC_STEERING_HEAT: "steering_heat",
+    VehicleCommand.CABIN_PRECONDITIONING_SET_TEMP: "cabin_temperature",
+    VehicleCommand.VEHICLE_CABIN_PRECONDITION_DISABLE: "preconditioning",
+    VehicleCommand.VEHICLE_CABIN_PRECONDITION_ENABLE: "preconditioning",
+    VehicleCommand.LOCK_ALL_CLOSURES_FEEDBACK: "closures",
+    VehicleCommand.UNLOCK_ALL_CLOSURES: "closures",
+    VehicleCommand.CLOSE_FRUNK: "frunk",
+    VehicleCommand.OPEN_FRUNK: "frunk",
+    VehicleCommand.DISABLE_GEAR_GUARD: "gear_guard",
+    VehicleCommand.ENABLE_GEAR_GUARD: "gear_guard",
+    VehicleCommand.DISABLE_GEAR_GUARD_VIDEO: "gear_guard_video",
+    VehicleCommand.ENABLE_GEAR_GUARD_VIDEO: "gear_guard_video",
+    VehicleCommand.CLOSE_LIFTGATE: "liftgate",
+    VehicleCommand.OPEN_LIFTGATE_UNLATCH_TAILGATE: "liftgate",
+    VehicleCommand.PANIC_OFF: "panic",
+    VehicleCommand.PANIC_ON: "panic",
+    VehicleCommand.CLOSE_TONNEAU_COVER: "tonneau",
+    VehicleCommand.OPEN_TONNEAU_COVER: "tonneau",
+    VehicleCommand.CLOSE_ALL_WINDOWS: "windows",
+    VehicleCommand.OPEN_ALL_WINDOWS: "windows",
+}
+
+
+class VehicleCommandQueue:
+    """Send a vehicle's commands in order, waking it once for a whole batch.
+
+    A command replaces a queued, not yet sent command for the same target, as
+    in two charging limit changes in a row. The replaced command is dropped
+    and its caller returns without it being sent.
+    """
+
+    def __init__(
+        self,
+        hass: HomeAssistant,
+        dispatch: Callable[[VehicleCommand, dict[str, Any] | None], Awaitable[None]],
+        is_asleep: Callable[[], bool],
+        awake: asyncio.Event,
+    ) -> None:
+        """Initialize the queue."""
+        self.hass = hass
+        self._dispatch = dispatch
+        self._is_asleep = is_asleep
+        self._awake = awake
+        self._pending: OrderedDict[
+            object, tuple[VehicleCommand, dict[str, Any] | None, asyncio.Future[None]]
+        ] = OrderedDict()
+        self._worker: asyncio.Task | None = None
+
+    async def async_send(
+        self, command: VehicleCommand, params: dict[str, Any] | None = None
+    ) -> None:
+        """Queue a command and wait for it to be sent or dropped."""
+        future: asyncio.Future[None] = self.hass.loop.create_future()
+        target = COMMAND_TARGETS.get(command) or object()
+        if (replaced := self._pending.pop(target, None)) is not None:
+            _LOGGER.debug("Dropping %s, superseded by %s", replaced[0], command)
+            _set_result(replaced[2])
+        self._pending[target] = (command, params, future)
+        if self._worker is None or self._worker.done():
+            self._worker = self.hass.async_create_task(self._async_run())
+        await future
+
+    def async_stop(self) -> None:
+        """Stop sending, cancelling the queued commands."""
+        if self._worker:
+            self._worker.cancel()
+            self._worker = None
+        for _, _, future in self._pending.values():
+            future.cancel()
+        self._pending.clear()
+
+    async def _async_run(self) -> None:
+        """Send the queued commands in order, waking the vehicle once if needed."""
+        woken = waited = False
+        while self._pending:
+            _, (command, params, future) = self._pending.popitem(last=False)
+            if future.done():
+                continue
+            try:
+                if command == VehicleCommand.WAKE_VEHICLE:
+                    # sent right away, without waiting for the vehicle to wake
+                    if not woken:
+                        await self._dispatch(command, params)
+                        woken = True
+                else:
+                    if not waited and self._is_asleep():
+                        if not woken:
+                            await self._dispatch(VehicleCommand.WAKE_VEHICLE, None)
+                            woken = True
+                        await self._async_wait_awake()
+                    waited = True
+                    await self._dispatch(command, params)
+            except asyncio.CancelledError:
+                future.cancel()
+                raise
+            except Exception as err:  # pylint: disable=broad-except
+                if not future.done():
+                    future.set_exception(err)
+            else:
+                _set_result(future)
+
+    async def _async_wait_awake(self) -> None:
+        """Wait for the vehicle to report being awake."""
+        try:
+            await asyncio.wait_for(self._awake.wait(), WAKE_TIMEOUT)
+        except asyncio.TimeoutError:
+            pass  # didn't wake-up in time, but we'll try the commands anyway
+
+
+def _set_result(future: asyncio.Future[None]) -> None:
+    """Resolve a future that may have been cancelled."""
+    if not future.done():
+        future.set_result(None)
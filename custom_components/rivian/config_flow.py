@@ -22,11 +22,15 @@ from homeassistant.helpers.schema_config_entry_flow import (
     SchemaOptionsFlowHandler,
 )
 from homeassistant.helpers.selector import (
+    BooleanSelector,
     DeviceFilterSelectorConfig,
     DeviceSelector,
     DeviceSelectorConfig,
     EntitySelector,
     EntitySelectorConfig,
+    NumberSelector,
+    NumberSelectorConfig,
+    NumberSelectorMode,
     SelectSelector,
     SelectSelectorConfig,
     SelectSelectorMode,
@@ -34,11 +38,17 @@ from homeassistant.helpers.selector import (
 
 from .const import (
     CONF_ACCESS_TOKEN,
+    CONF_COALESCE_WINDOW,
+    CONF_HISTORY_ATTRIBUTE,
     CONF_OTP,
     CONF_REFRESH_TOKEN,
+    CONF_TRACKER_DISTANCE,
+    CONF_TRACKER_INTERVAL,
+    CONF_TRACKER_SMOOTHING,
     CONF_USER_SESSION_TOKEN,
     CONF_VEHICLE_CONTROL,
     CONF_VEHICLE_IMAGE_STYLE,
+    DEFAULT_TRACKER_INTERVAL,
     DOMAIN,
     IMAGE_STYLE_CEL,
     IMAGE_STYLE_NONE,
@@ -68,6 +78,37 @@ OPTIONS_SCHEMA = vol.Schema(
         vol.Optional(CONF_ZONE): EntitySelector(
             EntitySelectorConfig(domain=ZONE_DOMAIN, multiple=True)
         ),
+        vol.Optional(CONF_COALESCE_WINDOW, default=0): NumberSelector(
+            NumberSelectorConfig(
+                min=0,
+                max=5,
+                step=0.1,
+                unit_of_measurement="s",
+                mode=NumberSelectorMode.BOX,
+            )
+        ),
+        vol.Optional(CONF_TRACKER_DISTANCE, default=0): NumberSelector(
+            NumberSelectorConfig(
+                min=0,
+                max=1000,
+                step=1,
+                unit_of_measurement="m",
+                mode=NumberSelectorMode.BOX,
+            )
+        ),
+        vol.Optional(
+            CONF_TRACKER_INTERVAL, default=DEFAULT_TRACKER_INTERVAL
+        ): NumberSelector(
+            NumberSelectorConfig(
+                min=0,
+                max=3600,
+                step=1,
+                unit_of_measurement="s",
+                mode=NumberSelectorMode.BOX,
+            )
+        ),
+        vol.Optional(CONF_TRACKER_SMOOTHING, default=False): BooleanSelector(),
+        vol.Optional(CONF_HISTORY_ATTRIBUTE, default=True): BooleanSelector(),
     }
 )
 
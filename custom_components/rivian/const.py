@@ -20,6 +20,7 @@ from homeassistant.const import (
 from .data_classes import (
     RivianBinarySensorEntityDescription,
     RivianSensorEntityDescription,
+    RivianTripSensorEntityDescription,
 )
 
 NAME = "Rivian (Unofficial)"
@@ -30,14 +31,21 @@ ISSUE_URL = "https://github.com/bretterer/home-assistant-rivian/issues"
 # Attributes
 ATTR_API = "api"
 ATTR_COORDINATOR = "coordinator"
+ATTR_PLATFORMS = "platforms"
+ATTR_SNAPSHOT = "snapshot"
 ATTR_USER = "user"
 ATTR_VEHICLE = "vehicle"
 ATTR_WALLBOX = "wallbox"
 
 # Config properties
 CONF_ACCESS_TOKEN = "access_token"
+CONF_COALESCE_WINDOW = "coalesce_window"
+CONF_HISTORY_ATTRIBUTE = "history_attribute"
 CONF_OTP = "otp"
 CONF_REFRESH_TOKEN = "refresh_token"
+CONF_TRACKER_DISTANCE = "tracker_distance"
+CONF_TRACKER_INTERVAL = "tracker_interval"
+CONF_TRACKER_SMOOTHING = "tracker_smoothing"
 CONF_USER_SESSION_TOKEN = "user_session_token"
 CONF_VEHICLE_CONTROL = "vehicle_control"
 CONF_VEHICLE_IMAGE_STYLE = "vehicle_image_style"
@@ -46,6 +54,8 @@ IMAGE_STYLE_CEL = "cel"
 IMAGE_STYLE_PHOTO = "photo"
 IMAGE_STYLE_NONE = "none"
 
+DEFAULT_TRACKER_INTERVAL = 5 * 60  # 5 minutes
+
 LOCK_STATE_ENTITIES = {
     "closureFrunkLocked",
     "closureLiftgateLocked",
@@ -77,6 +87,16 @@ CLOSURE_STATE_ENTITIES = {
 
 INVALID_SENSOR_STATES = {"fault", "signal_not_available", "undefined"}
 
+# Per-field value history limits
+HISTORY_MAX_SIZE = 50
+HISTORY_MAX_AGE = 24 * 60 * 60  # 24 hours
+HISTORY_ATTRIBUTE_SIZE = 1024  # characters, oldest values are dropped beyond it
+
+# Change with every update, so never recorded in the database
+UNRECORDED_ATTRIBUTES: Final = frozenset(
+    {"history", "last_update", "native_value", "value"}
+)
+
 
 DRIVE_MODE_MAP = {
     "everyday": "All-Purpose",
@@ -1029,6 +1049,61 @@ BINARY_SENSORS: Final[dict[str, tuple[RivianBinarySensorEntityDescription, ...]]
         ),
     ),
 }
+TRIP_SENSORS: Final[tuple[RivianTripSensorEntityDescription, ...]] = (
+    RivianTripSensorEntityDescription(
+        key="last_trip_distance",
+        name="Last Trip Distance",
+        icon="mdi:map-marker-distance",
+        device_class=SensorDeviceClass.DISTANCE,
+        native_unit_of_measurement=UnitOfLength.KILOMETERS,
+        suggested_display_precision=1,
+        suggested_unit_of_measurement=UnitOfLength.MILES,
+        value_fn=lambda trip: trip.distance,
+    ),
+    RivianTripSensorEntityDescription(
+        key="last_trip_duration",
+        name="Last Trip Duration",
+        icon="mdi:timer-outline",
+        device_class=SensorDeviceClass.DURATION,
+        native_unit_of_measurement=UnitOfTime.SECONDS,
+        suggested_unit_of_measurement=UnitOfTime.MINUTES,
+        value_fn=lambda trip: trip.duration,
+    ),
+    RivianTripSensorEntityDescription(
+        key="last_trip_energy",
+        name="Last Trip Energy Used",
+        device_class=SensorDeviceClass.ENERGY,
+        native_unit_of_measurement=UnitOfEnergy.KILO_WATT_HOUR,
+        suggested_display_precision=1,
+        value_fn=lambda trip: trip.energy,
+    ),
+    RivianTripSensorEntityDescription(
+        key="last_trip_efficiency",
+        name="Last Trip Efficiency",
+        icon="mdi:leaf",
+        native_unit_of_measurement="km/kWh",
+        suggested_display_precision=2,
+        value_fn=lambda trip: trip.efficiency,
+    ),
+)
+
+# Read by the software update entity
+VEHICLE_STATE_OTA_API_FIELDS: Final[frozenset[str]] = frozenset(
+    {
+        "otaAvailableVersion",
+        "otaAvailableVersionGitHash",
+        "otaAvailableVersionNumber",
+        "otaAvailableVersionWeek",
+        "otaAvailableVersionYear",
+        "otaCurrentVersion",
+        "otaCurrentVersionGitHash",
+        "otaCurrentVersionNumber",
+        "otaCurrentVersionWeek",
+        "otaCurrentVersionYear",
+        "otaInstallProgress",
+        "otaStatus",
+    }
+)
 
 VEHICLE_STATE_API_FIELDS: Final[set[str]] = {
     *(description.field for sensor in SENSORS.values() for description in sensor),
@@ -1039,24 +1114,83 @@ VEHICLE_STATE_API_FIELDS: Final[set[str]] = {
         for field in ([sensor.field] if isinstance(sensor.field, str) else sensor.field)
     ),
     "gnssLocation",
-    "otaCurrentVersion",
-    "otaCurrentVersionYear",
-    "otaCurrentVersionWeek",
-    "otaCurrentVersionNumber",
-    "otaCurrentVersionGitHash",
-    "otaAvailableVersion",
-    "otaAvailableVersionYear",
-    "otaAvailableVersionWeek",
-    "otaAvailableVersionNumber",
-    "otaAvailableVersionGitHash",
-    "otaInstallProgress",
+    *VEHICLE_STATE_OTA_API_FIELDS,
+}
+
+# Read by the coordinator and by entities other than sensors, so always polled
+VEHICLE_STATE_CORE_API_FIELDS: Final[set[str]] = {
+    "chargerState",
+    "chargerStatus",
+    "gearStatus",
+    "gnssLocation",
+    "gnssSpeed",
+    "powerState",
+    *VEHICLE_STATE_OTA_API_FIELDS,
+}
+
+# Read by the trip recorder, in addition to the core fields
+TRIP_API_FIELDS: Final[set[str]] = {
+    "batteryCapacity",
+    "batteryLevel",
+    "vehicleMileage",
 }
 
-VEHICLE_STATE_SANS_TPMS_API_FIELDS: Final[set[str]] = VEHICLE_STATE_API_FIELDS ^ {
+# Polled on every update, other fields are polled less often
+VEHICLE_STATE_HOT_API_FIELDS: Final[set[str]] = {
+    "batteryLevel",
+    "chargerState",
+    "chargerStatus",
+    "distanceToEmpty",
+    "gearStatus",
+    "gnssAltitude",
+    "gnssBearing",
+    "gnssLocation",
+    "gnssSpeed",
+    "powerState",
+    "timeToEndOfCharge",
+    "vehicleMileage",
+}
+
+# Rarely change, so polled the least often
+VEHICLE_STATE_COLD_API_FIELDS: Final[set[str]] = {
+    "batteryCapacity",
+    "brakeFluidLow",
+    "btmFfHardwareFailureStatus",
+    "btmIcHardwareFailureStatus",
+    "btmLfdHardwareFailureStatus",
+    "btmRfHardwareFailureStatus",
+    "btmRfdHardwareFailureStatus",
+    "gearGuardVideoTermsAccepted",
+    "otaAvailableVersion",
+    "otaAvailableVersionGitHash",
+    "otaAvailableVersionNumber",
+    "otaAvailableVersionWeek",
+    "otaAvailableVersionYear",
+    "otaCurrentVersion",
+    "otaCurrentVersionGitHash",
+    "otaCurrentVersionNumber",
+    "otaCurrentVersionWeek",
+    "otaCurrentVersionYear",
+    "otaInstallDuration",
+    "otaInstallType",
     "tirePressureFrontLeft",
     "tirePressureFrontRight",
     "tirePressureRearLeft",
     "tirePressureRearRight",
+    "tirePressureStatusFrontLeft",
+    "tirePressureStatusFrontRight",
+    "tirePressureStatusRearLeft",
+    "tirePressureStatusRearRight",
+    "tirePressureStatusValidFrontLeft",
+    "tirePressureStatusValidFrontRight",
+    "tirePressureStatusValidRearLeft",
+    "tirePressureStatusValidRearRight",
+    "twelveVoltBatteryHealth",
+    "windowFrontLeftCalibrated",
+    "windowFrontRightCalibrated",
+    "windowRearLeftCalibrated",
+    "windowRearRightCalibrated",
+    "wiperFluidState",
 }
 
 CHARGING_API_FIELDS: Final[set[str]] = {
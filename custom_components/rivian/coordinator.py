@@ -3,9 +3,11 @@ from __future__ import annotations
 
 from abc import ABC, abstractmethod
 import asyncio
-from collections.abc import Coroutine
+from collections.abc import Callable, Coroutine
 from datetime import datetime, timedelta, timezone
+from functools import partial
 import logging
+import time
 from typing import Any, Generic, TypeVar
 
 from aiohttp import ClientResponse
@@ -17,7 +19,7 @@ from rivian.exceptions import (
     RivianUnauthenticated,
 )
 
-from homeassistant.core import HomeAssistant, callback
+from homeassistant.core import CALLBACK_TYPE, HomeAssistant, callback
 from homeassistant.exceptions import ConfigEntryAuthFailed
 from homeassistant.helpers.update_coordinator import DataUpdateCoordinator, UpdateFailed
 
@@ -27,22 +29,50 @@ from .const import (
     ATTR_VEHICLE,
     CHARGING_API_FIELDS,
     DOMAIN,
+    HISTORY_MAX_AGE,
+    HISTORY_MAX_SIZE,
     INVALID_SENSOR_STATES,
     VEHICLE_STATE_API_FIELDS,
-    VEHICLE_STATE_SANS_TPMS_API_FIELDS,
+    VEHICLE_STATE_COLD_API_FIELDS,
+    VEHICLE_STATE_HOT_API_FIELDS,
 )
+from .batch import (
+    DRIVERS_SELECTION,
+    GRAPHQL_CHARGING,
+    GRAPHQL_GATEWAY,
+    USER_PHONES_SELECTION,
+    USER_SELECTION,
+    WALLBOX_SELECTION,
+    BatchOperation,
+    BatchResponse,
+    get_request_batcher,
+    live_session_selection,
+)
+from .charging import ChargingSessionRecorder
+from .commands import VehicleCommandQueue
+from .credentials import MAX_TOKEN_REFRESHES, get_credential_refresher
+from .derived import DerivedValueCache
+from .geofence import ZoneIndex
 from .helpers import redact
+from .history import VehicleHistory
+from .metrics import CoordinatorMetrics
+from .scheduler import RequestPriority, get_request_scheduler
+from .subscriptions import get_subscription_manager
+from .trips import TRIP_FIELD, TripRecorder, TripSummary
 
 _LOGGER = logging.getLogger(__name__)
 T = TypeVar("T", bound=dict[str, Any] | list[dict[str, Any]])
 
+CHARGING_STATES = ("charging_active", "charging_connecting")
+
 
 class RivianDataUpdateCoordinator(DataUpdateCoordinator[T], Generic[T], ABC):
     """Data update coordinator for the Rivian integration."""
 
     key: str
     _update_interval_seconds = 30
-    _error_count = 0
+    _latency = 0.0  # seconds, of the last request sent on its own
+    stale = False
 
     def __init__(self, hass: HomeAssistant, client: Rivian) -> None:
         """Initialize the coordinator."""
@@ -57,59 +87,113 @@ class RivianDataUpdateCoordinator(DataUpdateCoordinator[T], Generic[T], ABC):
             ),
         )
         self.api = client
+        self.scheduler = get_request_scheduler(client)
+        self.batcher = get_request_batcher(client)
+        self.credentials = get_credential_refresher(client)
+        self.metrics = CoordinatorMetrics()
 
     def _set_update_interval(self, seconds: float | None = None) -> None:
         """Set the update interval or calculate new one based on errors."""
         if not seconds:
-            seconds = min(self._update_interval_seconds * 2**self._error_count, 900)
-        if self._update_interval_seconds != seconds:
-            refresh = self.update_interval and self._update_interval_seconds > seconds
-            self.update_interval = timedelta(seconds=seconds)
+            errors = self.metrics.consecutive_errors
+            seconds = min(self._update_interval_seconds * 2**errors, 900)
+        if (interval := timedelta(seconds=seconds)) != self.update_interval:
+            refresh = self.update_interval and self.update_interval > interval
+            self.update_interval = interval
             if refresh and self.data:
                 self.hass.async_add_job(self.async_request_refresh)
             else:
                 self._schedule_refresh()
             _LOGGER.info("Polling set to %s seconds", seconds)
 
+    @callback
+    def async_restore(self, data: T) -> None:
+        """Restore previously saved data, marked as stale until refreshed."""
+        self.stale = True
+        self.async_set_updated_data(data)
+
     async def _async_update_data(self) -> T:
         """Get the latest data from Rivian."""
         try:
-            resp = await self._fetch_data()
+            resp = await self._async_request()
             if resp.status == 200:
                 data = await resp.json()
+                recovered = bool(self.metrics.consecutive_errors)
+                if isinstance(resp, BatchResponse):
+                    self.metrics.record_request(resp.latency, resp.size)
+                else:
+                    self.metrics.record_request(self._latency, len(await resp.read()))
                 _LOGGER.debug(
                     "[%s] %s",
                     self.__class__.__name__.replace("Coordinator", ""),
                     redact(data),
                 )
-                if self._error_count:
-                    self._error_count = 0
+                if recovered:
                     self._set_update_interval()
+                self.stale = False
                 return data["data"][self.key]
             resp.raise_for_status()
+            raise RivianApiException(f"Unexpected response status {resp.status}")
 
-        except RivianExpiredTokenError:
-            _LOGGER.info("Rivian token expired, refreshing")
-            await self.api.create_csrf_token()
-            return await self._async_update_data()
+        except RivianExpiredTokenError as err:
+            self.metrics.record_error(err)
+            _LOGGER.error("Rivian token still expired after refreshing: %s", err)
         except RivianApiRateLimitError as err:
             _LOGGER.error("Rate limit being enforced: %s", err, exc_info=1)
             self._set_update_interval()
+            self.metrics.record_error(err)
         except RivianUnauthenticated as err:
+            self.metrics.record_error(err)
             await self.api.close()
             raise ConfigEntryAuthFailed from err
         except RivianApiException as ex:
+            self.metrics.record_error(ex)
             _LOGGER.error("Rivian api exception: %s", ex, exc_info=1)
         except Exception as ex:  # pylint: disable=broad-except
+            self.metrics.record_error(ex)
             _LOGGER.error(
                 "Unknown Exception while updating Rivian data: %s", ex, exc_info=1
             )
 
-        self._error_count += 1
         if self.data:
             return self.data
         raise UpdateFailed("Error communicating with API")
 
+    async def _async_request(self) -> ClientResponse | BatchResponse:
+        """Request the data, refreshing expired tokens a limited number of times."""
+        refreshes = 0
+        while True:
+            generation = self.credentials.generation
+            try:
+                if operation := self._batch_operation():
+                    return await self.batcher.async_fetch(operation)
+                return await self.scheduler.async_request(self._async_fetch)
+            except RivianExpiredTokenError:
+                if refreshes >= MAX_TOKEN_REFRESHES:
+                    raise
+                refreshes += 1
+                _LOGGER.info("Rivian token expired, refreshing")
+                await self.credentials.async_refresh(generation)
+
+    def _batch_operation(self) -> BatchOperation | None:
+        """Return the operation to batch with other requests, if supported."""
+        return None
+
+    async def _async_fetch(self) -> ClientResponse:
+        """Fetch the data on its own, timing the request."""
+        start = time.monotonic()
+        resp = await self._fetch_data()
+        self._latency = time.monotonic() - start
+        return resp
+
+    def stats(self) -> dict[str, Any]:
+        """Return the performance metrics and polling state."""
+        return self.metrics.as_dict() | {
+            "update_interval": self.update_interval.total_seconds()
+            if self.update_interval
+            else None,
+        }
+
     @abstractmethod
     async def _fetch_data(self) -> ClientResponse:
         """Fetch the data."""
@@ -128,6 +212,13 @@ class ChargingCoordinator(RivianDataUpdateCoordinator[dict[str, Any]]):
         """Initialize the coordinator."""
         super().__init__(hass=hass, client=client)
         self.vehicle_id = vehicle_id
+        self.sessions = ChargingSessionRecorder(hass, vehicle_id)
+
+    async def _async_update_data(self) -> dict[str, Any]:
+        """Get the latest data from Rivian and record it."""
+        data = await super()._async_update_data()
+        await self.sessions.async_update(data)
+        return data
 
     async def _fetch_data(self) -> ClientResponse:
         """Fetch the data."""
@@ -135,6 +226,17 @@ class ChargingCoordinator(RivianDataUpdateCoordinator[dict[str, Any]]):
             vin=self.vehicle_id, properties=CHARGING_API_FIELDS
         )
 
+    def _batch_operation(self) -> BatchOperation | None:
+        """Return the operation to batch with other requests."""
+        return BatchOperation(
+            key=self.key,
+            url=GRAPHQL_CHARGING,
+            field="getLiveSessionData(vehicleId: $vehicleId)",
+            selection=live_session_selection(CHARGING_API_FIELDS),
+            variables={"vehicleId": ("ID!", self.vehicle_id)},
+            fallback=self._async_fetch,
+        )
+
     def adjust_update_interval(self, is_plugged_in: bool) -> None:
         """Adjust update interval based on plugged in status."""
         self._set_update_interval(
@@ -152,25 +254,39 @@ class DriverKeyCoordinator(RivianDataUpdateCoordinator[dict[str, Any]]):
         """Initialize the coordinator."""
         super().__init__(hass=hass, client=client)
         self.vehicle_id = vehicle_id
+        self._devices: tuple[Any, dict[str, dict[str, Any]]] = (None, {})
 
     async def _fetch_data(self) -> ClientResponse:
         """Fetch the data."""
         return await self.api.get_drivers_and_keys(vehicle_id=self.vehicle_id)
 
+    def _batch_operation(self) -> BatchOperation | None:
+        """Return the operation to batch with other requests."""
+        return BatchOperation(
+            key=self.key,
+            url=GRAPHQL_GATEWAY,
+            field="getVehicle(id: $vehicleId)",
+            selection=DRIVERS_SELECTION,
+            variables={"vehicleId": ("String", self.vehicle_id)},
+            fallback=self._async_fetch,
+        )
+
     def get_device_details(self, identity_id: str) -> dict[str, Any] | None:
         """Get the details of a device."""
         if not self.data:
             return None
-        return next(
-            (
-                device
-                for user in self.data.get("invitedUsers")
-                if user["__typename"] == "ProvisionedUser"
-                for device in user["devices"]
-                if device["mappedIdentityId"] == identity_id
-            ),
-            None,
-        )
+        # index the devices once per update
+        if self._devices[0] is not self.data:
+            self._devices = (
+                self.data,
+                {
+                    device["mappedIdentityId"]: device
+                    for user in reversed(self.data.get("invitedUsers") or [])
+                    if user["__typename"] == "ProvisionedUser"
+                    for device in reversed(user["devices"])
+                },
+            )
+        return self._devices[1].get(identity_id)
 
 
 class UserCoordinator(RivianDataUpdateCoordinator[dict[str, Any]]):
@@ -183,25 +299,44 @@ class UserCoordinator(RivianDataUpdateCoordinator[dict[str, Any]]):
     ) -> None:
         super().__init__(hass, client)
         self.include_phones = include_phones
+        self._phones: tuple[Any, dict[str, tuple[str, dict[str, str]]]] = (None, {})
 
     async def _fetch_data(self) -> ClientResponse:
         """Fetch the data."""
         return await self.api.get_user_information(self.include_phones)
 
+    def _batch_operation(self) -> BatchOperation | None:
+        """Return the operation to batch with other requests."""
+        phones = USER_PHONES_SELECTION if self.include_phones else ""
+        return BatchOperation(
+            key=self.key,
+            url=GRAPHQL_GATEWAY,
+            field=self.key,
+            selection=USER_SELECTION % phones,
+            variables={},
+            fallback=self._async_fetch,
+        )
+
     def get_enrolled_phone_data(
         self, public_key: str
     ) -> tuple[str, dict[str, str]] | None:
         """Get enrolled phone data."""
-        phones = self.data.get("enrolledPhones", [])
-        if phone := next(
-            (phone for phone in phones if phone["vas"]["publicKey"] == public_key), None
-        ):
-            phone_id = phone["vas"]["vasPhoneId"]
-            vehicle_entry = {
-                entry["vehicleId"]: entry["identityId"] for entry in phone["enrolled"]
-            }
-            return (phone_id, vehicle_entry)
-        return None
+        # index the phones once per update
+        if self._phones[0] is not self.data:
+            self._phones = (
+                self.data,
+                {
+                    phone["vas"]["publicKey"]: (
+                        phone["vas"]["vasPhoneId"],
+                        {
+                            entry["vehicleId"]: entry["identityId"]
+                            for entry in phone["enrolled"]
+                        },
+                    )
+                    for phone in reversed(self.data.get("enrolledPhones") or [])
+                },
+            )
+        return self._phones[1].get(public_key)
 
     def get_vehicles(self) -> dict[str, dict[str, Any]]:
         """Get the user's vehicles."""
@@ -228,27 +363,110 @@ class VehicleCoordinator(RivianDataUpdateCoordinator[dict[str, Any]]):
 
     key = "vehicleState"
     _update_interval_seconds = 15 * 60  # 15 minutes
+    _driving_interval = 20  # 20 seconds
+    _charging_interval = 60  # 1 minute
+    _parked_interval = 5 * 60  # 5 minutes
+    _sleeping_interval = 60 * 60  # 1 hour
+    _warm_interval = 5 * 60  # 5 minutes
+    _cold_interval = 60 * 60  # 1 hour
 
-    def __init__(self, hass: HomeAssistant, client: Rivian, vehicle_id: str) -> None:
-        """Initialize the coordinator."""
+    def __init__(
+        self,
+        hass: HomeAssistant,
+        client: Rivian,
+        vehicle_id: str,
+        coalesce_window: float = 0,
+        fields: set[str] | None = None,
+    ) -> None:
+        """Initialize the coordinator.
+
+        Push updates received within `coalesce_window` seconds of each other are
+        combined into a single update. Only `fields` are requested, if given.
+        """
         super().__init__(hass=hass, client=client)
         self.vehicle_id = vehicle_id
+        self.fields = fields or VEHICLE_STATE_API_FIELDS
+        self._polled_fields = self.fields
+        self._tiers_refreshed: dict[str, float] = {}
+        self.coalesce_window = coalesce_window
+        self._pending_push: dict[str, Any] = {}
+        self._push_timer: asyncio.TimerHandle | None = None
         self.charging_coordinator = ChargingCoordinator(hass, client, vehicle_id)
         self.drivers_coordinator = DriverKeyCoordinator(hass, client, vehicle_id)
         self._initial = asyncio.Event()
-        self._unsub_handler: Coroutine[None, None, None] | None = None
+        self._unsub_handler: Callable[[], Coroutine[None, None, None]] | None = None
+        self.subscriptions = get_subscription_manager(client)
         self._awake = asyncio.Event()
+        self._polling = False
+        self.history = VehicleHistory(HISTORY_MAX_SIZE, HISTORY_MAX_AGE)
+        self.derived = DerivedValueCache()
+        self.zone_index: ZoneIndex | None = None
+        self._in_zone: tuple[tuple[Any, ...], bool] | None = None
+        self.trips = TripRecorder(hass, self._handle_trip)
+        self.commands = VehicleCommandQueue(
+            hass, self._async_dispatch_command, self._is_asleep, self._awake
+        )
+        self._field_listeners: dict[str, dict[CALLBACK_TYPE, CALLBACK_TYPE]] = {}
+        self._changed_fields: set[str] | None = None
+        self._notified_state = (True, False)
+
+    @callback
+    def async_add_listener(
+        self, update_callback: CALLBACK_TYPE, context: Any = None
+    ) -> Callable[[], None]:
+        """Listen for data updates, indexing the listener by its fields.
+
+        `context` is the set of fields the listener depends on. Listeners without
+        a context are notified on every update.
+        """
+        remove_listener = super().async_add_listener(update_callback, context)
+        if not context:
+            return remove_listener
+
+        for field in context:
+            listeners = self._field_listeners.setdefault(field, {})
+            listeners[remove_listener] = update_callback
+
+        @callback
+        def remove_field_listener() -> None:
+            """Remove field update listener."""
+            for field in context:
+                self._field_listeners[field].pop(remove_listener, None)
+            remove_listener()
+
+        return remove_field_listener
+
+    @callback
+    def async_update_listeners(self) -> None:
+        """Update the listeners whose fields changed since the last update."""
+        changed, self._changed_fields = self._changed_fields, None
+        state = (self.last_update_success, self.stale)
+        if changed is None or self._notified_state != state:
+            self._notified_state = state
+            super().async_update_listeners()
+            return
+
+        callbacks = {
+            remove_listener: update_callback
+            for field in changed
+            for remove_listener, update_callback in self._field_listeners.get(
+                field, {}
+            ).items()
+        }
+        callbacks.update(
+            (remove_listener, update_callback)
+            for remove_listener, (update_callback, context) in self._listeners.items()
+            if not context
+        )
+        for update_callback in list(callbacks.values()):
+            update_callback()
 
     async def _async_update_data(self) -> dict[str, Any]:
         """Get the latest data from Rivian."""
-        if not self.data or not self.last_update_success:
-            await self._unsubscribe()
-            self._unsub_handler = await self.api.subscribe_for_vehicle_updates(
-                vehicle_id=self.vehicle_id,
-                properties=VEHICLE_STATE_API_FIELDS,
-                callback=self._process_new_data,
-            )
+        if not self._unsub_handler:
+            await self._async_subscribe()
 
+        if not self.data or self.stale or not self.last_update_success:
             try:
                 await asyncio.wait_for(self._initial.wait(), 1)
             except asyncio.TimeoutError:
@@ -256,41 +474,157 @@ class VehicleCoordinator(RivianDataUpdateCoordinator[dict[str, Any]]):
             else:
                 return self.data
 
+        due = self._due_tiers()
+        self._polled_fields = set().union(*due.values())
         data = await super()._async_update_data()
-        return self._build_vehicle_info_dict(data)
+        if not self.metrics.consecutive_errors:
+            self._tiers_refreshed.update(dict.fromkeys(due, time.monotonic()))
+        vehicle_info = self._build_vehicle_info_dict(data)
+        self.trips.async_update(vehicle_info)
+        if self._polling:
+            self._set_update_interval(self._activity_interval(vehicle_info))
+        return vehicle_info
+
+    async def _async_subscribe(self) -> None:
+        """Subscribe to updates of the requested fields."""
+        self._unsub_handler = await self.subscriptions.async_subscribe(
+            vehicle_id=self.vehicle_id,
+            properties=self.fields,
+            callback=self._process_new_data,
+            fallback=self._fall_back_to_polling,
+        )
+
+    async def async_set_fields(self, fields: set[str]) -> None:
+        """Set the requested fields, resubscribing if they changed."""
+        if fields == self.fields:
+            return
+        _LOGGER.debug("Vehicle %s now requests %s fields", self.vehicle_id, len(fields))
+        self.fields = fields
+        self._tiers_refreshed.clear()
+        if self._unsub_handler:
+            await self._async_subscribe()
+
+    def _due_tiers(self) -> dict[str, set[str]]:
+        """Get the fields of the refresh tiers that are due to be polled."""
+        hot = self.fields & VEHICLE_STATE_HOT_API_FIELDS
+        cold = self.fields & VEHICLE_STATE_COLD_API_FIELDS
+        tiers = {
+            "hot": (hot, 0),
+            "warm": (self.fields - hot - cold, self._warm_interval),
+            "cold": (cold, self._cold_interval),
+        }
+        now = time.monotonic()
+        return {
+            tier: fields
+            for tier, (fields, interval) in tiers.items()
+            # allow for polls landing slightly early
+            if (refreshed := self._tiers_refreshed.get(tier)) is None
+            or now - refreshed >= interval * 0.9
+        }
 
     async def _fetch_data(self) -> ClientResponse:
         """Fetch the data."""
         return await self.api.get_vehicle_state(
-            vin=self.vehicle_id, properties=VEHICLE_STATE_SANS_TPMS_API_FIELDS
+            vin=self.vehicle_id,
+            properties=self._polled_fields,
+        )
+
+    def _batch_operation(self) -> BatchOperation | None:
+        """Return the operation to batch with other requests, if supported."""
+        if not (adapter := self.batcher.adapter).supported:
+            return None
+        return BatchOperation(
+            key=self.key,
+            url=GRAPHQL_GATEWAY,
+            field="vehicleState(id: $vehicleID)",
+            selection=adapter.vehicle_state_selection(self._polled_fields),
+            variables={"vehicleID": ("String!", self.vehicle_id)},
+            fallback=self._async_fetch,
         )
 
     async def async_shutdown(self) -> None:
-        await self._unsubscribe(True)
+        if self._push_timer:
+            self._push_timer.cancel()
+            self._push_timer = None
+        self.trips.async_stop()
+        self.commands.async_stop()
+        await self._unsubscribe()
         return await super().async_shutdown()
 
+    @callback
+    def async_restore(self, data: dict[str, Any]) -> None:
+        """Restore previously saved data, marked as stale until refreshed."""
+        super().async_restore(self._build_vehicle_info_dict(data))
+
     @callback
     def _process_new_data(self, data: dict[str, Any]) -> None:
         """Process new data."""
-        if not (payload := data.get("payload")) or not (pdata := payload.get("data")):
-            _LOGGER.error("Received an unknown subscription update: %s", data)
-            self._error_count += 1
-            if not self._initial.is_set() or self._error_count > 5:
-                self.hass.async_add_job(self._unsubscribe, True)
-                self._set_update_interval(20)
+        self.metrics.record_push()
+        items = data["payload"]["data"].get(self.key) or {}
+        if not self.coalesce_window or not self._initial.is_set():
+            self._apply_push(items)
             return
-        vehicle_info = self._build_vehicle_info_dict(pdata.get(self.key, {}))
+
+        # the window starts with the first message, so no update waits longer
+        self._pending_push.update((k, v) for k, v in items.items() if v)
+        if self._push_timer is None:
+            self._push_timer = self.hass.loop.call_later(
+                self.coalesce_window, self._flush_push
+            )
+
+    @callback
+    def _flush_push(self) -> None:
+        """Process the push updates combined during the coalescing window."""
+        self._push_timer = None
+        items, self._pending_push = self._pending_push, {}
+        self._apply_push(items)
+
+    @callback
+    def _apply_push(self, items: dict[str, Any]) -> None:
+        """Update the data with pushed vehicle state."""
+        vehicle_info = self._build_vehicle_info_dict(items)
+        self.trips.async_update(vehicle_info)
+        self.stale = False
         self.async_set_updated_data(vehicle_info)
-        self._error_count = 0
+        self.metrics.consecutive_errors = 0
         self._initial.set()
+        if self._polling:
+            self._polling = False
+            self._set_update_interval(self._update_interval_seconds)
+
+    @callback
+    def _handle_trip(self, trip: TripSummary) -> None:
+        """Update the trip sensors after a trip finished."""
+        self._changed_fields = {TRIP_FIELD}
+        self.async_update_listeners()
+
+    @callback
+    def _fall_back_to_polling(self) -> None:
+        """Poll the vehicle until push updates are received again."""
+        self._initial.clear()
+        self._polling = True
+        self._set_update_interval(self._activity_interval(self.data or {}))
+
+    def _activity_interval(self, data: dict[str, Any]) -> int:
+        """Return the polling interval for what the vehicle is currently doing."""
+
+        def value(key: str) -> Any | None:
+            return (data.get(key) or {}).get("value")
+
+        if value("powerState") == "sleep":
+            return self._sleeping_interval
+        if value("gearStatus") not in (None, "park") or (value("gnssSpeed") or 0) > 0:
+            return self._driving_interval
+        if (
+            value("chargerState") in CHARGING_STATES
+            or value("chargerStatus") == "chrgr_sts_connected_charging"
+        ):
+            return self._charging_interval
+        return self._parked_interval
 
     def _build_vehicle_info_dict(self, vijson: dict[str, Any]) -> dict[str, Any]:
         """Take the json output of vehicle_info and build a dictionary."""
-        items = {
-            k: v | ({"history": {v["value"]}} if "value" in v else {})
-            for k, v in vijson.items()
-            if v
-        }
+        items = {k: v for k, v in vijson.items() if v}
 
         if items:
             _LOGGER.debug("Vehicle %s updated: %s", self.vehicle_id, redact(items))
@@ -306,27 +640,50 @@ class VehicleCoordinator(RivianDataUpdateCoordinator[dict[str, Any]]):
             )
 
         if not (prev_items := (self.data or {})):
+            self._changed_fields = None
+            for key, item in items.items():
+                if "value" in item:
+                    self.history.add(key, item["value"])
+                    self.derived.update(key, item["value"])
             return items
         if not items or prev_items == items:
+            self._changed_fields = set()
             return prev_items
 
         new_data = prev_items | items
-        for key in filter(lambda i: i != "gnssLocation", items):
-            value = items[key].get("value")
-            if str(value).lower() in INVALID_SENSOR_STATES and key in prev_items:
-                new_data[key] = prev_items[key]
-            new_data[key]["history"] |= prev_items.get(key, {}).get("history", set())
+        changed = set()
+        for key, item in items.items():
+            if item == prev_items.get(key):
+                continue
+            if "value" in item:
+                value = item["value"]
+                if str(value).lower() in INVALID_SENSOR_STATES and key in prev_items:
+                    new_data[key] = prev_items[key]
+                    continue
+                self.history.add(key, value)
+                self.derived.update(key, value)
+            changed.add(key)
+        self._changed_fields = changed
 
         return new_data
 
-    async def _unsubscribe(self, close_monitor: bool = False):
+    async def _unsubscribe(self) -> None:
         """Unsubscribe."""
         if unsub := self._unsub_handler:
-            await unsub()
             self._unsub_handler = None
             self._initial.clear()
-        if close_monitor and (monitor := self.api._ws_monitor):
-            await monitor.close()
+            await unsub()
+
+    def in_zone(self) -> bool:
+        """Return `True` if the vehicle is in a configured zone or none are set."""
+        if self.zone_index is None:
+            return True
+        location = self.data.get("gnssLocation") or {}
+        latitude, longitude = location.get("latitude"), location.get("longitude")
+        key = (latitude, longitude, self.zone_index.version)
+        if self._in_zone is None or self._in_zone[0] != key:
+            self._in_zone = (key, self.zone_index.contains(latitude, longitude))
+        return self._in_zone[1]
 
     def get(self, key: str) -> Any | None:
         """Get a data value by key."""
@@ -334,17 +691,20 @@ class VehicleCoordinator(RivianDataUpdateCoordinator[dict[str, Any]]):
             return entity.get("value")
         return None
 
+    def _is_asleep(self) -> bool:
+        """Return `True` if the vehicle was last reported asleep."""
+        return bool(self.data) and self.get("powerState") == "sleep"
+
     async def send_vehicle_command(
         self, command: VehicleCommand, params: dict[str, Any] | None = None
     ) -> None:
-        """Send a command to the vehicle."""
-        if self.get("powerState") == "sleep" and command != VehicleCommand.WAKE_VEHICLE:
-            await self.send_vehicle_command(VehicleCommand.WAKE_VEHICLE)
-            try:
-                await asyncio.wait_for(self._awake.wait(), 30)
-            except asyncio.TimeoutError:
-                pass  # didn't wake-up in time, but we'll try command anyway
+        """Queue a command to the vehicle, waking it first if it's asleep."""
+        await self.commands.async_send(command, params)
 
+    async def _async_dispatch_command(
+        self, command: VehicleCommand, params: dict[str, Any] | None = None
+    ) -> None:
+        """Send a command to the vehicle."""
         entry_data = self.hass.data[DOMAIN][self.config_entry.entry_id]
         vehicle = entry_data[ATTR_VEHICLE][self.vehicle_id]
         user: UserCoordinator = entry_data[ATTR_COORDINATOR][ATTR_USER]
@@ -352,14 +712,18 @@ class VehicleCoordinator(RivianDataUpdateCoordinator[dict[str, Any]]):
             self.config_entry.options.get("public_key")
         )
 
-        if response := await self.api.send_vehicle_command(
-            command=command,
-            vehicle_id=self.vehicle_id,
-            phone_id=phone_info[0],
-            identity_id=vehicle["phone_identity_id"],
-            vehicle_key=vehicle["public_key"],
-            private_key=self.config_entry.options.get("private_key"),
-            params=params,
+        if response := await self.scheduler.async_request(
+            partial(
+                self.api.send_vehicle_command,
+                command=command,
+                vehicle_id=self.vehicle_id,
+                phone_id=phone_info[0],
+                identity_id=vehicle["phone_identity_id"],
+                vehicle_key=vehicle["public_key"],
+                private_key=self.config_entry.options.get("private_key"),
+                params=params,
+            ),
+            RequestPriority.COMMAND,
         ):
             _LOGGER.debug("%s response was: %s", command, response)
 
@@ -393,3 +757,14 @@ class WallboxCoordinator(RivianDataUpdateCoordinator[list[dict[str, Any]]]):
     async def _fetch_data(self) -> ClientResponse:
         """Fetch the data."""
         return await self.api.get_registered_wallboxes()
+
+    def _batch_operation(self) -> BatchOperation | None:
+        """Return the operation to batch with other requests."""
+        return BatchOperation(
+            key=self.key,
+            url=GRAPHQL_CHARGING,
+            field=self.key,
+            selection=WALLBOX_SELECTION,
+            variables={},
+            fallback=self._async_fetch,
+        )
@@ -0,0 +1,53 @@
+"""Shared credential refresh for the Rivian API."""
+from __future__ import annotations
+
+import asyncio
+import logging
+from weakref import WeakKeyDictionary, ref
+
+from rivian import Rivian
+from rivian.exceptions import RivianApiException
+
+_LOGGER = logging.getLogger(__name__)
+
+MAX_TOKEN_REFRESHES = 2  # per request
+
+
+class RivianCredentialRefresher:
+    """Refresh the session tokens of a client once for all concurrent callers."""
+
+    def __init__(self, client: Rivian) -> None:
+        """Initialize the refresher."""
+        self._api = ref(client)
+        self._refresh: asyncio.Future[None] | None = None
+        self.generation = 0
+
+    async def async_refresh(self, generation: int | None = None) -> None:
+        """Refresh the tokens, or wait for a refresh that is already in flight.
+
+        If `generation` is given and the tokens were refreshed since it was read,
+        the request that failed used old tokens and no new refresh is needed.
+        """
+        if self._refresh is None or self._refresh.done():
+            if generation is not None and generation != self.generation:
+                return
+            self._refresh = asyncio.ensure_future(self._async_refresh())
+        await asyncio.shield(self._refresh)
+
+    async def _async_refresh(self) -> None:
+        """Create new session tokens."""
+        if (api := self._api()) is None:
+            raise RivianApiException("Rivian client has been closed")
+        _LOGGER.debug("Refreshing Rivian session tokens")
+        await api.create_csrf_token()
+        self.generation += 1
+
+
+_REFRESHERS: WeakKeyDictionary[Rivian, RivianCredentialRefresher] = WeakKeyDictionary()
+
+
+def get_credential_refresher(client: Rivian) -> RivianCredentialRefresher:
+    """Get the credential refresher shared by all users of a client."""
+    if (refresher := _REFRESHERS.get(client)) is None:
+        refresher = _REFRESHERS[client] = RivianCredentialRefresher(client)
+    return refresher
@@ -17,7 +17,9 @@ from homeassistant.components.switch import SwitchEntityDescription
 from homeassistant.helpers.entity import EntityDescription
 
 if TYPE_CHECKING:
+    from .charging import ChargingSession
     from .coordinator import VehicleCoordinator
+    from .trips import TripSummary
 
 
 @dataclass(kw_only=True)
@@ -46,6 +48,13 @@ class RivianButtonEntityDescription(
     press_fn: Callable[[VehicleCoordinator], Awaitable[None]]
 
 
+@dataclass(kw_only=True)
+class RivianChargingSessionSensorEntityDescription(SensorEntityDescription):
+    """Rivian charging session sensor entity description."""
+
+    value_fn: Callable[[ChargingSession], Any]
+
+
 @dataclass(kw_only=True)
 class RivianCoverEntityDescription(CoverEntityDescription):
     """Rivian cover entity description."""
@@ -90,6 +99,13 @@ class RivianSensorEntityDescription(SensorEntityDescription):
     old_key: str | None = None  # to be removed 2024-06
 
 
+@dataclass(kw_only=True)
+class RivianStatsSensorEntityDescription(SensorEntityDescription):
+    """Rivian coordinator metrics sensor entity description."""
+
+    value_fn: Callable[[VehicleCoordinator], Any]
+
+
 @dataclass(kw_only=True)
 class RivianSwitchEntityDescription(
     SwitchEntityDescription, RivianVehicleControlAvailableMixin
@@ -106,8 +122,24 @@ class RivianTrackerEntityDescription(EntityDescription):
     """Rivian tracker entity Description."""
 
 
+@dataclass(kw_only=True)
+class RivianTripSensorEntityDescription(SensorEntityDescription):
+    """Rivian trip sensor entity description."""
+
+    value_fn: Callable[[TripSummary], Any]
+
+
 @dataclass(kw_only=True)
 class RivianWallboxSensorEntityDescription(SensorEntityDescription):
     """A class that describes Rivian wallbox sensor entities."""
 
     field: str
+
+
+@dataclass(frozen=True)
+class RivianModelDescriptions:
+    """The sensor descriptions and vehicle state fields of a vehicle model."""
+
+    sensors: tuple[RivianSensorEntityDescription, ...]
+    binary_sensors: tuple[RivianBinarySensorEntityDescription, ...]
+    fields: frozenset[str]
@@ -0,0 +1,52 @@
+"""Cache of sensor values derived from vehicle state fields."""
+from __future__ import annotations
+
+from collections.abc import Callable
+from typing import Any
+
+
+class DerivedValueCache:
+    """Transformed field values, recomputed when the coordinator changes a field."""
+
+    def __init__(self) -> None:
+        """Initialize the cache."""
+        self._values: dict[str, dict[Callable[[Any], Any], Any]] = {}
+        self._transforms: dict[str, set[Callable[[Any], Any]]] = {}
+
+    def register(
+        self, field: str, transform: Callable[[Any], Any]
+    ) -> Callable[[], None]:
+        """Register a transform to precompute whenever the field changes."""
+        self._transforms.setdefault(field, set()).add(transform)
+
+        def unregister() -> None:
+            """Stop precomputing the transform and drop its value."""
+            if transforms := self._transforms.get(field):
+                transforms.discard(transform)
+                if not transforms:
+                    del self._transforms[field]
+            if values := self._values.get(field):
+                values.pop(transform, None)
+                if not values:
+                    del self._values[field]
+
+        return unregister
+
+    def update(self, field: str, value: Any) -> None:
+        """Precompute the registered transforms of a changed field."""
+        if transforms := self._transforms.get(field):
+            self._values[field] = {
+                transform: transform(value) for transform in transforms
+            }
+
+    def get(self, field: str, transform: Callable[[Any], Any], value: Any) -> Any:
+        """Get the transformed current value of a field."""
+        try:
+            return self._values[field][transform]
+        except KeyError:
+            pass
+        result = transform(value)
+        if transform in self._transforms.get(field, ()):
+            # registered after the field last changed
+            self._values.setdefault(field, {})[transform] = result
+        return result
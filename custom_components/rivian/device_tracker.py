@@ -2,20 +2,35 @@
 from __future__ import annotations
 
 from collections.abc import Mapping
+import time
 from typing import Any
 
 from homeassistant.components.device_tracker import SourceType, TrackerEntity
+from homeassistant.components.zone import async_active_zone
 from homeassistant.config_entries import ConfigEntry
 from homeassistant.core import HomeAssistant, callback
+from homeassistant.helpers.entity import EntityDescription
 from homeassistant.helpers.entity_platform import AddEntitiesCallback
-
-from .const import ATTR_COORDINATOR, ATTR_VEHICLE, DOMAIN
+from homeassistant.util.location import distance
+
+from .const import (
+    ATTR_COORDINATOR,
+    ATTR_VEHICLE,
+    CONF_TRACKER_DISTANCE,
+    CONF_TRACKER_INTERVAL,
+    CONF_TRACKER_SMOOTHING,
+    DEFAULT_TRACKER_INTERVAL,
+    DOMAIN,
+)
 from .coordinator import VehicleCoordinator
 from .data_classes import RivianTrackerEntityDescription
 from .entity import RivianVehicleEntity
 
 LOCATION_DESCRIPTION = RivianTrackerEntityDescription(key="location", name="Location")
 
+PARKED_JITTER_RADIUS = 50  # meters, fixes further away mean the vehicle moved
+PARKED_SAMPLES = 20  # fixes averaged while parked
+
 
 async def async_setup_entry(
     hass: HomeAssistant, entry: ConfigEntry, async_add_entities: AddEntitiesCallback
@@ -50,7 +65,27 @@ class RivianDeviceEntity(RivianVehicleEntity, TrackerEntity):
         """Create a Rivian device tracker entity."""
         super().__init__(coordinator, config_entry, description, vehicle)
         self._attribute = "gnssLocation"
-        self._tracker_data = coordinator.data[self._attribute]
+        # not in data restored from a snapshot, until the first poll or push
+        self._tracker_data: dict[str, Any] = coordinator.data.get(self._attribute) or {}
+        self._timestamp = self._tracker_data.get("timeStamp")
+        self._position: tuple[float | None, float | None] = (
+            self._tracker_data.get("latitude"),
+            self._tracker_data.get("longitude"),
+        )
+        self._written_at = time.monotonic()
+        self._zone: str | None = None
+        self._parked: tuple[float, float, int] | None = None
+
+        options = config_entry.options
+        self._min_distance: float = options.get(CONF_TRACKER_DISTANCE, 0)
+        self._max_interval: float = options.get(
+            CONF_TRACKER_INTERVAL, DEFAULT_TRACKER_INTERVAL
+        )
+        self._smoothing: bool = options.get(CONF_TRACKER_SMOOTHING, False)
+
+    def _get_fields(self, description: EntityDescription) -> frozenset[str] | None:
+        """Get the data fields this entity depends on."""
+        return frozenset({"gnssLocation"})
 
     @property
     def force_update(self) -> bool:
@@ -60,12 +95,12 @@ class RivianDeviceEntity(RivianVehicleEntity, TrackerEntity):
     @property
     def latitude(self) -> float | None:
         """Return latitude value of the device."""
-        return self._tracker_data["latitude"]
+        return self._position[0]
 
     @property
     def longitude(self) -> float | None:
         """Return longitude value of the device."""
-        return self._tracker_data["longitude"]
+        return self._position[1]
 
     @property
     def source_type(self) -> SourceType:
@@ -79,17 +114,59 @@ class RivianDeviceEntity(RivianVehicleEntity, TrackerEntity):
     @property
     def extra_state_attributes(self) -> Mapping[str, Any]:
         """Return the state attributes of the device."""
-        return {
-            "last_update": self._tracker_data["timeStamp"],
-        }
+        if (timestamp := self._tracker_data.get("timeStamp")) is None:
+            return {}
+        return {"last_update": timestamp}
 
     @callback
     def _handle_coordinator_update(self) -> None:
         """Respond to a DataUpdateCoordinator update."""
-        entity = self.coordinator.data[self._attribute]
-        try:
-            if entity["timeStamp"] != self._tracker_data["timeStamp"]:
-                self._tracker_data = entity
-                self.async_write_ha_state()
-        except:
+        entity = self.coordinator.data.get(self._attribute) or {}
+        if (timestamp := entity.get("timeStamp")) == self._timestamp:
+            return
+        self._timestamp = timestamp
+        if None in (
+            latitude := entity.get("latitude"),
+            longitude := entity.get("longitude"),
+        ):
+            return
+
+        latitude, longitude = self._smooth(latitude, longitude)
+        if self._should_write(latitude, longitude):
             self._tracker_data = entity
+            self._position = (latitude, longitude)
+            self._written_at = time.monotonic()
+            self.async_write_ha_state()
+
+    def _smooth(self, latitude: float, longitude: float) -> tuple[float, float]:
+        """Average out GPS jitter while the vehicle is parked."""
+        if not self._smoothing or self._get_value("gearStatus") != "park":
+            self._parked = None
+            return latitude, longitude
+        if self._parked is not None:
+            mean_lat, mean_lon, count = self._parked
+            dist = distance(latitude, longitude, mean_lat, mean_lon)
+            if dist is not None and dist <= PARKED_JITTER_RADIUS:
+                count = min(count + 1, PARKED_SAMPLES)
+                mean_lat += (latitude - mean_lat) / count
+                mean_lon += (longitude - mean_lon) / count
+                self._parked = (mean_lat, mean_lon, count)
+                return mean_lat, mean_lon
+        self._parked = (latitude, longitude, 1)
+        return latitude, longitude
+
+    def _should_write(self, latitude: float, longitude: float) -> bool:
+        """Return `True` if the location moved, aged or crossed a zone boundary."""
+        if not self._min_distance or None in self._position:
+            return True
+        dist = distance(latitude, longitude, *self._position)
+        zone = async_active_zone(self.hass, latitude, longitude)
+        zone_id = zone.entity_id if zone else None
+        if zone_id != self._zone:
+            self._zone = zone_id
+            return True
+        return (
+            dist is None
+            or dist >= self._min_distance
+            or time.monotonic() - self._written_at >= self._max_interval
+        )
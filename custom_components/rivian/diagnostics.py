@@ -6,16 +6,25 @@ from typing import Any
 from homeassistant.config_entries import ConfigEntry
 from homeassistant.core import HomeAssistant
 
-from .const import ATTR_COORDINATOR, ATTR_USER, ATTR_VEHICLE, ATTR_WALLBOX, DOMAIN
+from .const import (
+    ATTR_API,
+    ATTR_COORDINATOR,
+    ATTR_USER,
+    ATTR_VEHICLE,
+    ATTR_WALLBOX,
+    DOMAIN,
+)
 from .coordinator import UserCoordinator, VehicleCoordinator, WallboxCoordinator
 from .helpers import redact
+from .subscriptions import get_subscription_manager
 
 
 async def async_get_config_entry_diagnostics(
     hass: HomeAssistant, entry: ConfigEntry
 ) -> dict[str, Any]:
     """Return diagnostics for a config entry."""
-    coordinators = hass.data[DOMAIN][entry.entry_id][ATTR_COORDINATOR]
+    entry_data = hass.data[DOMAIN][entry.entry_id]
+    coordinators = entry_data[ATTR_COORDINATOR]
     user_coordinator: UserCoordinator = coordinators[ATTR_USER]
     vehicle_coordinators: dict[str, VehicleCoordinator] = coordinators[ATTR_VEHICLE]
     wallbox_coordinator: WallboxCoordinator = coordinators[ATTR_WALLBOX]
@@ -28,6 +37,21 @@ async def async_get_config_entry_diagnostics(
         "drivers": [
             coor.drivers_coordinator.data for coor in vehicle_coordinators.values()
         ],
+        "history": [coor.history.as_dict() for coor in vehicle_coordinators.values()],
         "wallbox": wallbox_coordinator.data,
+        "subscriptions": get_subscription_manager(entry_data[ATTR_API]).stats(),
+        "coordinators": {
+            "user": user_coordinator.stats(),
+            "vehicle": [coor.stats() for coor in vehicle_coordinators.values()],
+            "charging": [
+                coor.charging_coordinator.stats()
+                for coor in vehicle_coordinators.values()
+            ],
+            "drivers": [
+                coor.drivers_coordinator.stats()
+                for coor in vehicle_coordinators.values()
+            ],
+            "wallbox": wallbox_coordinator.stats(),
+        },
     }
     return redact(data)
@@ -5,15 +5,21 @@ from collections.abc import Coroutine, Iterable
 import logging
 from typing import Any, TypeVar
 
-from homeassistant.components.zone import in_zone
 from homeassistant.config_entries import ConfigEntry
-from homeassistant.const import CONF_ZONE
 from homeassistant.core import HomeAssistant, callback
 from homeassistant.helpers.entity import DeviceInfo, EntityDescription
 import homeassistant.helpers.entity_registry as er
 from homeassistant.helpers.update_coordinator import CoordinatorEntity
 
-from .const import ATTR_COORDINATOR, ATTR_USER, ATTR_VEHICLE, DOMAIN
+from .const import (
+    ATTR_COORDINATOR,
+    ATTR_USER,
+    ATTR_VEHICLE,
+    CONF_HISTORY_ATTRIBUTE,
+    DOMAIN,
+    HISTORY_ATTRIBUTE_SIZE,
+    UNRECORDED_ATTRIBUTES,
+)
 from .coordinator import (
     ChargingCoordinator,
     RivianDataUpdateCoordinator,
@@ -30,6 +36,12 @@ class RivianEntity(CoordinatorEntity[T]):
     """Base class for Rivian entities."""
 
     _attr_has_entity_name = True
+    _unrecorded_attributes = UNRECORDED_ATTRIBUTES
+
+    @property
+    def assumed_state(self) -> bool:
+        """Return `True` while showing restored data that hasn't been refreshed."""
+        return self.coordinator.stale
 
 
 class RivianVehicleEntity(RivianEntity[VehicleCoordinator]):
@@ -43,7 +55,7 @@ class RivianVehicleEntity(RivianEntity[VehicleCoordinator]):
         vehicle: dict[str, Any],
     ) -> None:
         """Construct a Rivian vehicle entity."""
-        super().__init__(coordinator)
+        super().__init__(coordinator, self._get_fields(description))
         self._config_entry = config_entry
         self.entity_description = description
         self._vin = (vin := vehicle["vin"])
@@ -69,14 +81,38 @@ class RivianVehicleEntity(RivianEntity[VehicleCoordinator]):
                 return False
         return self._available
 
+    def _get_fields(self, description: EntityDescription) -> frozenset[str] | None:
+        """Get the data fields this entity depends on, `None` for all fields."""
+        if getattr(description, "value_fn", None):
+            return None
+        if not (field := getattr(description, "field", None)):
+            return None
+        return frozenset({field} if isinstance(field, str) else field)
+
     def _get_value(self, key: str) -> Any | None:
         """Get a data value from the coordinator."""
         return self.coordinator.get(key)
 
+    def _get_history(self, key: str) -> dict[str, str]:
+        """Get the history attribute of a field, if enabled."""
+        if not self._config_entry.options.get(CONF_HISTORY_ATTRIBUTE, True):
+            return {}
+        values: list[str] = []
+        size = 2  # brackets
+        for value in reversed(self.coordinator.history.get(key)):
+            if (size := size + len(text := repr(value)) + 2) > HISTORY_ATTRIBUTE_SIZE:
+                break
+            values.append(text)
+        return {"history": f"[{', '.join(reversed(values))}]"}
+
 
 class RivianVehicleControlEntity(RivianVehicleEntity):
     """Base class for Rivian vehicle control entities."""
 
+    def _get_fields(self, description: EntityDescription) -> frozenset[str] | None:
+        """Control entities depend on several fields, so listen to all of them."""
+        return None
+
     @property
     def available(self) -> bool:
         """Return the availability of the entity."""
@@ -85,14 +121,7 @@ class RivianVehicleControlEntity(RivianVehicleEntity):
         if _fn := getattr(self.entity_description, "available", None):
             if not _fn(self.coordinator):
                 return False
-        if zone_entity_ids := self._config_entry.options.get(CONF_ZONE, []):
-            location = self.coordinator.data.get("gnssLocation", {})
-            for entity_id in zone_entity_ids:
-                zone = self.hass.states.get(entity_id)
-                if in_zone(zone, location.get("latitude"), location.get("longitude")):
-                    return True
-            return False
-        return True
+        return self.coordinator.in_zone()
 
     def _handle_driver_update(self) -> None:
         """Handle driver update."""
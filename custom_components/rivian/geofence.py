@@ -0,0 +1,99 @@
+"""Spatial index of the zones vehicle control is limited to."""
+from __future__ import annotations
+
+from collections.abc import Iterable
+import math
+
+from homeassistant.components.zone import ATTR_RADIUS
+from homeassistant.const import ATTR_LATITUDE, ATTR_LONGITUDE, STATE_UNAVAILABLE
+from homeassistant.core import CALLBACK_TYPE, Event, HomeAssistant, State, callback
+from homeassistant.helpers.event import async_track_state_change_event
+from homeassistant.util.location import distance
+
+CELL_SIZE = 0.1  # degrees, roughly 11 km of latitude
+MAX_CELLS = 64  # per zone, larger zones are always checked
+METERS_PER_DEGREE = 111_320  # meters
+
+Zone = tuple[float, float, float]  # latitude, longitude, radius
+
+
+class ZoneIndex:
+    """Grid index of zones, kept up to date with the zones' states."""
+
+    def __init__(self, hass: HomeAssistant, entity_ids: Iterable[str]) -> None:
+        """Initialize the zone index."""
+        self.hass = hass
+        self.entity_ids = list(entity_ids)
+        self.version = 0
+        self._zones: dict[str, Zone] = {}
+        self._cells: dict[tuple[int, int], set[str]] = {}
+        self._large: set[str] = set()
+
+    @callback
+    def async_start(self) -> CALLBACK_TYPE:
+        """Index the zones and follow their changes."""
+        for entity_id in self.entity_ids:
+            self._update_zone(entity_id, self.hass.states.get(entity_id))
+        return async_track_state_change_event(
+            self.hass, self.entity_ids, self._async_zone_changed
+        )
+
+    def contains(self, latitude: float | None, longitude: float | None) -> bool:
+        """Return `True` if the location is in any of the zones."""
+        if latitude is None or longitude is None:
+            return False
+        candidates = self._cells.get(_cell(latitude, longitude), set()) | self._large
+        for entity_id in candidates:
+            zone_latitude, zone_longitude, radius = self._zones[entity_id]
+            zone_dist = distance(latitude, longitude, zone_latitude, zone_longitude)
+            if zone_dist is not None and zone_dist < radius:
+                return True
+        return False
+
+    @callback
+    def _async_zone_changed(self, event: Event) -> None:
+        """Update a zone after its state changed."""
+        self._update_zone(event.data["entity_id"], event.data["new_state"])
+
+    def _update_zone(self, entity_id: str, state: State | None) -> None:
+        """Index a zone, replacing any previous geometry."""
+        self._remove_zone(entity_id)
+        self.version += 1
+        if state is None or state.state == STATE_UNAVAILABLE:
+            return
+        attrs = state.attributes
+        if None in (
+            latitude := attrs.get(ATTR_LATITUDE),
+            longitude := attrs.get(ATTR_LONGITUDE),
+            radius := attrs.get(ATTR_RADIUS),
+        ):
+            return
+
+        self._zones[entity_id] = (latitude, longitude, radius)
+        lat_delta = radius / METERS_PER_DEGREE
+        lon_delta = lat_delta / max(math.cos(math.radians(latitude)), 0.01)
+        min_cell = _cell(latitude - lat_delta, longitude - lon_delta)
+        max_cell = _cell(latitude + lat_delta, longitude + lon_delta)
+        rows = range(min_cell[0], max_cell[0] + 1)
+        cols = range(min_cell[1], max_cell[1] + 1)
+        if len(rows) * len(cols) > MAX_CELLS:
+            self._large.add(entity_id)
+            return
+        for row in rows:
+            for col in cols:
+                self._cells.setdefault((row, col), set()).add(entity_id)
+
+    def _remove_zone(self, entity_id: str) -> None:
+        """Remove a zone from the index."""
+        if self._zones.pop(entity_id, None) is None:
+            return
+        self._large.discard(entity_id)
+        for key, ids in list(self._cells.items()):
+            ids.discard(entity_id)
+            if not ids:
+                del self._cells[key]
+
+
+def _cell(latitude: float, longitude: float) -> tuple[int, int]:
+    """Return the grid cell of a location."""
+    return math.floor(latitude / CELL_SIZE), math.floor(longitude / CELL_SIZE)
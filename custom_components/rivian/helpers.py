@@ -1,13 +1,34 @@
 """Rivian helpers."""
 from __future__ import annotations
 
+from functools import cache
+
 from rivian import Rivian
 
 from homeassistant.components.diagnostics.util import async_redact_data
 from homeassistant.config_entries import ConfigEntry
-from homeassistant.const import CONF_EMAIL, CONF_LATITUDE, CONF_LONGITUDE
+from homeassistant.const import CONF_EMAIL, CONF_LATITUDE, CONF_LONGITUDE, Platform
+from homeassistant.core import HomeAssistant, callback
+from homeassistant.helpers import entity_registry as er
+from homeassistant.helpers.entity import EntityDescription
 
-from .const import CONF_ACCESS_TOKEN, CONF_REFRESH_TOKEN, CONF_USER_SESSION_TOKEN
+from .const import (
+    BINARY_SENSORS,
+    CONF_ACCESS_TOKEN,
+    CONF_REFRESH_TOKEN,
+    CONF_USER_SESSION_TOKEN,
+    DOMAIN,
+    SENSORS,
+    TRIP_API_FIELDS,
+    TRIP_SENSORS,
+    VEHICLE_STATE_API_FIELDS,
+    VEHICLE_STATE_CORE_API_FIELDS,
+)
+from .data_classes import (
+    RivianBinarySensorEntityDescription,
+    RivianModelDescriptions,
+    RivianSensorEntityDescription,
+)
 
 from typing import Any
 
@@ -43,3 +64,74 @@ def get_rivian_api_from_entry(entry: ConfigEntry) -> Rivian:
 def redact(data: Any) -> dict:
     """Redact sensitive data."""
     return async_redact_data(data, TO_REDACT)
+
+
+def get_description_fields(
+    description: RivianSensorEntityDescription | RivianBinarySensorEntityDescription,
+) -> set[str]:
+    """Get the vehicle state fields read by a sensor description."""
+    field = description.field
+    return {field} if isinstance(field, str) else set(field)
+
+
+SENSOR_API_FIELDS = frozenset(
+    field
+    for sensors in (SENSORS, BINARY_SENSORS)
+    for descriptions in sensors.values()
+    for description in descriptions
+    for field in get_description_fields(description)
+)
+
+
+@cache
+def get_model_descriptions(model: str) -> RivianModelDescriptions:
+    """Get the sensor descriptions and vehicle state fields of a vehicle model."""
+    sensors = tuple(
+        description
+        for sensor_model, descriptions in SENSORS.items()
+        if sensor_model in model
+        for description in descriptions
+    )
+    binary_sensors = tuple(
+        description
+        for sensor_model, descriptions in BINARY_SENSORS.items()
+        if sensor_model in model
+        for description in descriptions
+    )
+    fields = (VEHICLE_STATE_API_FIELDS - SENSOR_API_FIELDS) | {
+        field
+        for description in (*sensors, *binary_sensors)
+        for field in get_description_fields(description)
+    }
+    return RivianModelDescriptions(
+        sensors, binary_sensors, frozenset(fields | VEHICLE_STATE_CORE_API_FIELDS)
+    )
+
+
+@callback
+def async_get_vehicle_fields(hass: HomeAssistant, vehicle: dict[str, Any]) -> set[str]:
+    """Get the vehicle state fields backing the enabled entities of a vehicle."""
+    model = get_model_descriptions(vehicle["model"])
+    if vehicle.get("phone_identity_id"):
+        # control entities read many of the sensor fields as well
+        return set(model.fields)
+
+    ent_reg = er.async_get(hass)
+
+    def enabled(platform: str, description: EntityDescription) -> bool:
+        unique_id = f"{vehicle['vin']}-{description.key}"
+        if entity_id := ent_reg.async_get_entity_id(platform, DOMAIN, unique_id):
+            return not ent_reg.entities[entity_id].disabled
+        return description.entity_registry_enabled_default
+
+    fields = set(model.fields - SENSOR_API_FIELDS) | VEHICLE_STATE_CORE_API_FIELDS
+    for platform, descriptions in (
+        (Platform.SENSOR, model.sensors),
+        (Platform.BINARY_SENSOR, model.binary_sensors),
+    ):
+        for description in descriptions:
+            if enabled(platform, description):
+                fields |= get_description_fields(description)
+    if any(enabled(Platform.SENSOR, description) for description in TRIP_SENSORS):
+        fields |= TRIP_API_FIELDS
+    return fields
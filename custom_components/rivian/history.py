@@ -0,0 +1,126 @@
+"""Bounded value history for Rivian vehicle state fields."""
+from __future__ import annotations
+
+from abc import ABC, abstractmethod
+from array import array
+from collections import OrderedDict
+from collections.abc import Iterable
+import time
+from typing import Any
+
+
+class FieldHistory(ABC):
+    """Recent values of a single vehicle state field."""
+
+    def __init__(self, max_size: int, max_age: float | None = None) -> None:
+        """Initialize the history."""
+        self.max_size = max_size
+        self.max_age = max_age
+
+    @abstractmethod
+    def add(self, value: Any, timestamp: float | None = None) -> None:
+        """Add a value."""
+
+    @abstractmethod
+    def items(self) -> list[tuple[float, Any]]:
+        """Return the `(timestamp, value)` pairs, oldest first."""
+
+    def values(self) -> list[Any]:
+        """Return the values that have not expired, oldest first."""
+        return [value for _, value in self.items()]
+
+    def _cutoff(self) -> float | None:
+        """Return the timestamp before which values are expired."""
+        return time.monotonic() - self.max_age if self.max_age else None
+
+
+class NumericHistory(FieldHistory):
+    """Array backed ring buffer of numeric values."""
+
+    def __init__(self, max_size: int, max_age: float | None = None) -> None:
+        """Initialize the history."""
+        super().__init__(max_size, max_age)
+        self._values = array("d", bytes(8 * max_size))
+        self._timestamps = array("d", bytes(8 * max_size))
+        self._is_int = True
+        self._head = 0
+        self._count = 0
+
+    def add(self, value: float, timestamp: float | None = None) -> None:
+        """Add a value."""
+        self._values[self._head] = value
+        self._timestamps[self._head] = timestamp or time.monotonic()
+        self._is_int &= isinstance(value, int)
+        self._head = (self._head + 1) % self.max_size
+        self._count = min(self._count + 1, self.max_size)
+
+    def items(self) -> list[tuple[float, float]]:
+        """Return the `(timestamp, value)` pairs, oldest first."""
+        cutoff = self._cutoff()
+        start = (self._head - self._count) % self.max_size
+        cast = int if self._is_int else float
+        return [
+            (self._timestamps[idx], cast(self._values[idx]))
+            for idx in ((start + i) % self.max_size for i in range(self._count))
+            if cutoff is None or self._timestamps[idx] >= cutoff
+        ]
+
+
+class EnumHistory(FieldHistory):
+    """Deduplicated, most recently seen values of a non-numeric field."""
+
+    def __init__(self, max_size: int, max_age: float | None = None) -> None:
+        """Initialize the history."""
+        super().__init__(max_size, max_age)
+        self._last_seen: OrderedDict[Any, float] = OrderedDict()
+
+    def add(self, value: Any, timestamp: float | None = None) -> None:
+        """Add a value."""
+        self._last_seen.pop(value, None)
+        self._last_seen[value] = timestamp or time.monotonic()
+        if len(self._last_seen) > self.max_size:
+            self._last_seen.popitem(last=False)
+
+    def items(self) -> list[tuple[float, Any]]:
+        """Return the `(timestamp, value)` pairs, oldest first."""
+        if (cutoff := self._cutoff()) is not None:
+            while self._last_seen and next(iter(self._last_seen.values())) < cutoff:
+                self._last_seen.popitem(last=False)
+        return [(timestamp, value) for value, timestamp in self._last_seen.items()]
+
+
+class VehicleHistory:
+    """Bounded value history for all fields of a vehicle."""
+
+    def __init__(self, max_size: int, max_age: float | None = None) -> None:
+        """Initialize the vehicle history."""
+        self.max_size = max_size
+        self.max_age = max_age
+        self._fields: dict[str, FieldHistory] = {}
+
+    def add(self, field: str, value: Any) -> None:
+        """Add a value to a field's history."""
+        numeric = isinstance(value, (int, float)) and not isinstance(value, bool)
+        if (history := self._fields.get(field)) is None:
+            history_cls = NumericHistory if numeric else EnumHistory
+            history = self._fields[field] = history_cls(self.max_size, self.max_age)
+        elif not numeric and isinstance(history, NumericHistory):
+            history = self._fields[field] = self._as_enum(history.items())
+        history.add(value)
+
+    def get(self, field: str) -> list[Any]:
+        """Get the recent values of a field, oldest first."""
+        if (history := self._fields.get(field)) is None:
+            return []
+        return history.values()
+
+    def as_dict(self) -> dict[str, list[Any]]:
+        """Get the recent values of all fields, oldest first."""
+        return {field: history.values() for field, history in self._fields.items()}
+
+    def _as_enum(self, items: Iterable[tuple[float, Any]]) -> EnumHistory:
+        """Convert existing history items to an enum history."""
+        history = EnumHistory(self.max_size, self.max_age)
+        for timestamp, value in items:
+            history.add(value, timestamp)
+        return history
@@ -0,0 +1,104 @@
+"""Performance metrics of Rivian data update coordinators."""
+from __future__ import annotations
+
+from bisect import bisect_left
+from collections import Counter, deque
+import time
+from typing import Any
+
+LATENCY_BUCKETS = (0.1, 0.25, 0.5, 1, 2.5, 5, 10, 30)  # seconds
+LATENCY_SAMPLES = 100  # most recent requests used for percentiles
+RATE_WINDOW = 5 * 60  # 5 minutes
+
+_BUCKET_LABELS = (
+    *(f"<={bound}s" for bound in LATENCY_BUCKETS),
+    f">{LATENCY_BUCKETS[-1]}s",
+)
+
+
+class CoordinatorMetrics:
+    """Request latencies, errors, payload sizes and push rates of a coordinator."""
+
+    def __init__(self) -> None:
+        """Initialize the metrics."""
+        self.requests = 0
+        self.pushes = 0
+        self.errors: Counter[str] = Counter()
+        self.consecutive_errors = 0
+        self.latency_buckets = [0] * (len(LATENCY_BUCKETS) + 1)
+        self.latency_total = 0.0
+        self.payload_size: int | None = None
+        self.payload_total = 0
+        self._latencies: deque[float] = deque(maxlen=LATENCY_SAMPLES)
+        self._pushed: deque[float] = deque()
+
+    @property
+    def error_total(self) -> int:
+        """Return the number of failed requests."""
+        return sum(self.errors.values())
+
+    @property
+    def push_rate(self) -> float:
+        """Return the push messages received per minute over the rate window."""
+        self._prune_pushed(time.monotonic())
+        return len(self._pushed) * 60 / RATE_WINDOW
+
+    def record_request(self, latency: float, payload_size: int | None) -> None:
+        """Record a successful request."""
+        self.requests += 1
+        self.consecutive_errors = 0
+        self.latency_buckets[bisect_left(LATENCY_BUCKETS, latency)] += 1
+        self.latency_total += latency
+        self._latencies.append(latency)
+        if payload_size is not None:
+            self.payload_size = payload_size
+            self.payload_total += payload_size
+
+    def record_error(self, err: BaseException) -> None:
+        """Record a failed request."""
+        self.errors[type(err).__name__] += 1
+        self.consecutive_errors += 1
+
+    def record_push(self) -> None:
+        """Record a push message."""
+        now = time.monotonic()
+        self.pushes += 1
+        self._pushed.append(now)
+        self._prune_pushed(now)
+
+    def latency(self, percentile: float) -> float | None:
+        """Return a percentile of the recent request latencies, in seconds."""
+        if not self._latencies:
+            return None
+        latencies = sorted(self._latencies)
+        return latencies[
+            min(int(len(latencies) * percentile / 100), len(latencies) - 1)
+        ]
+
+    def as_dict(self) -> dict[str, Any]:
+        """Return the metrics."""
+        return {
+            "requests": self.requests,
+            "errors": dict(self.errors),
+            "consecutive_errors": self.consecutive_errors,
+            "latency_p50": _round(self.latency(50)),
+            "latency_p95": _round(self.latency(95)),
+            "latency_mean": _round(self.latency_total / self.requests)
+            if self.requests
+            else None,
+            "latency_histogram": dict(zip(_BUCKET_LABELS, self.latency_buckets)),
+            "payload_size": self.payload_size,
+            "payload_total": self.payload_total,
+            "pushes": self.pushes,
+            "push_rate": round(self.push_rate, 2),
+        }
+
+    def _prune_pushed(self, now: float) -> None:
+        """Drop push timestamps older than the rate window."""
+        while self._pushed and self._pushed[0] < now - RATE_WINDOW:
+            self._pushed.popleft()
+
+
+def _round(value: float | None) -> float | None:
+    """Round a latency for display."""
+    return None if value is None else round(value, 3)
@@ -3,8 +3,10 @@ from __future__ import annotations
 
 from homeassistant.core import HomeAssistant, callback
 
+from .const import UNRECORDED_ATTRIBUTES
+
 
 @callback
 def exclude_attributes(hass: HomeAssistant) -> set[str]:
-    """Exclude last_update from being recorded in the database."""
-    return {"last_update"}
+    """Exclude volatile attributes from being recorded in the database."""
+    return set(UNRECORDED_ATTRIBUTES)
@@ -0,0 +1,145 @@
+"""Shared request scheduler for the Rivian API."""
+from __future__ import annotations
+
+import asyncio
+from collections.abc import Awaitable, Callable
+from enum import IntEnum
+import heapq
+from itertools import count
+import logging
+import time
+from typing import TypeVar
+from weakref import WeakKeyDictionary
+
+from rivian import Rivian
+from rivian.exceptions import RivianApiRateLimitError
+
+from homeassistant.exceptions import HomeAssistantError
+
+_LOGGER = logging.getLogger(__name__)
+_R = TypeVar("_R")
+
+BUCKET_CAPACITY = 10  # requests
+BUCKET_REFILL_RATE = 0.5  # requests per second
+BACKOFF_BASE = 30  # seconds
+BACKOFF_MAX = 15 * 60  # 15 minutes
+COMMAND_TIMEOUT = 30  # seconds, commands fail rather than be sent late
+
+
+class RequestPriority(IntEnum):
+    """Request priority, lower values are sent first."""
+
+    COMMAND = 0
+    POLL = 1
+
+
+class RivianRequestScheduler:
+    """Token bucket request scheduler shared by everything using a client."""
+
+    def __init__(
+        self, capacity: int = BUCKET_CAPACITY, refill_rate: float = BUCKET_REFILL_RATE
+    ) -> None:
+        """Initialize the scheduler."""
+        self.capacity = capacity
+        self.refill_rate = refill_rate
+        self._tokens = float(capacity)
+        self._refilled = time.monotonic()
+        self._backoff_count = 0
+        self._backoff_until = 0.0
+        self._sequence = count()
+        self._waiters: list[tuple[int, int, asyncio.Future[None]]] = []
+        self._timer: asyncio.TimerHandle | None = None
+
+    @property
+    def backoff_remaining(self) -> float:
+        """Return the seconds left before requests are sent again."""
+        return max(self._backoff_until - time.monotonic(), 0)
+
+    async def async_request(
+        self,
+        request: Callable[[], Awaitable[_R]],
+        priority: RequestPriority = RequestPriority.POLL,
+    ) -> _R:
+        """Wait for the budget to allow a request, then send it."""
+        if priority is RequestPriority.COMMAND:
+            await self._async_acquire_command()
+        else:
+            await self._async_acquire(priority)
+        try:
+            result = await request()
+        except RivianApiRateLimitError:
+            self.backoff()
+            raise
+        self._backoff_count = 0
+        return result
+
+    def backoff(self) -> None:
+        """Hold all requests after the API enforced its rate limit."""
+        delay = min(BACKOFF_BASE * 2**self._backoff_count, BACKOFF_MAX)
+        self._backoff_count += 1
+        self._backoff_until = max(self._backoff_until, time.monotonic() + delay)
+        self._tokens = 0
+        _LOGGER.warning("Rate limit enforced, holding requests for %s seconds", delay)
+
+    async def _async_acquire_command(self) -> None:
+        """Wait a limited time for a command's token."""
+        if (remaining := self.backoff_remaining) >= COMMAND_TIMEOUT:
+            raise HomeAssistantError(
+                f"Rivian API rate limit enforced, try again in {remaining:.0f} seconds"
+            )
+        try:
+            await asyncio.wait_for(
+                self._async_acquire(RequestPriority.COMMAND), COMMAND_TIMEOUT
+            )
+        except asyncio.TimeoutError as err:
+            raise HomeAssistantError(
+                "Rivian API request budget exhausted, try again later"
+            ) from err
+
+    async def _async_acquire(self, priority: RequestPriority) -> None:
+        """Wait for a token."""
+        future = asyncio.get_running_loop().create_future()
+        heapq.heappush(self._waiters, (priority, next(self._sequence), future))
+        self._dispatch()
+        try:
+            await future
+        except asyncio.CancelledError:
+            if future.done() and not future.cancelled():
+                self._tokens += 1  # give back the unused token
+                self._dispatch()
+            raise
+
+    def _dispatch(self) -> None:
+        """Release waiters while the budget allows it."""
+        if self._timer:
+            self._timer.cancel()
+            self._timer = None
+        now = time.monotonic()
+        self._tokens = min(
+            self._tokens + (now - self._refilled) * self.refill_rate, self.capacity
+        )
+        self._refilled = now
+
+        while self._waiters and now >= self._backoff_until and self._tokens >= 1:
+            _, _, future = heapq.heappop(self._waiters)
+            if not future.done():
+                self._tokens -= 1
+                future.set_result(None)
+
+        while self._waiters and self._waiters[0][2].done():
+            heapq.heappop(self._waiters)
+        if self._waiters:
+            delay = max(
+                self._backoff_until - now, (1 - self._tokens) / self.refill_rate, 0
+            )
+            self._timer = asyncio.get_running_loop().call_later(delay, self._dispatch)
+
+
+_SCHEDULERS: WeakKeyDictionary[Rivian, RivianRequestScheduler] = WeakKeyDictionary()
+
+
+def get_request_scheduler(client: Rivian) -> RivianRequestScheduler:
+    """Get the request scheduler shared by all users of a client."""
+    if (scheduler := _SCHEDULERS.get(client)) is None:
+        scheduler = _SCHEDULERS[client] = RivianRequestScheduler()
+    return scheduler
@@ -8,6 +8,7 @@ from typing import Any, Final
 
 from homeassistant.components.sensor import (
     DOMAIN as PLATFORM,
+    RestoreSensor,
     SensorDeviceClass,
     SensorEntity,
     SensorStateClass,
@@ -19,20 +20,24 @@ from homeassistant.const import (
     UnitOfElectricCurrent,
     UnitOfElectricPotential,
     UnitOfEnergy,
+    UnitOfInformation,
     UnitOfLength,
     UnitOfPower,
     UnitOfSpeed,
     UnitOfTime,
 )
 from homeassistant.core import HomeAssistant
-from homeassistant.helpers.entity import DeviceInfo
+from homeassistant.helpers.entity import DeviceInfo, EntityDescription
 from homeassistant.helpers.entity_platform import AddEntitiesCallback
 from homeassistant.helpers.typing import StateType
 
-from .const import ATTR_COORDINATOR, ATTR_VEHICLE, ATTR_WALLBOX, DOMAIN, SENSORS
+from .const import ATTR_COORDINATOR, ATTR_VEHICLE, ATTR_WALLBOX, DOMAIN, TRIP_SENSORS
 from .coordinator import DriverKeyCoordinator, VehicleCoordinator, WallboxCoordinator
 from .data_classes import (
+    RivianChargingSessionSensorEntityDescription,
     RivianSensorEntityDescription,
+    RivianStatsSensorEntityDescription,
+    RivianTripSensorEntityDescription,
     RivianWallboxSensorEntityDescription,
 )
 from .entity import (
@@ -42,6 +47,8 @@ from .entity import (
     RivianWallboxEntity,
     async_update_unique_id,
 )
+from .helpers import get_model_descriptions
+from .trips import TRIP_FIELD
 
 _LOGGER = logging.getLogger(__name__)
 
@@ -63,14 +70,30 @@ async def async_setup_entry(
             vehicle_coordinators[vehicle_id], entry, description, vehicle
         )
         for vehicle_id, vehicle in vehicles.items()
-        for model, descriptions in SENSORS.items()
-        if model in vehicle["model"]
-        for description in descriptions
+        for description in get_model_descriptions(vehicle["model"]).sensors
     ]
 
     # Migrate unique ids
     async_update_unique_id(hass, PLATFORM, entities)
 
+    # Add trip entities
+    entities.extend(
+        RivianTripSensorEntity(
+            vehicle_coordinators[vehicle_id], entry, description, vehicle
+        )
+        for vehicle_id, vehicle in vehicles.items()
+        for description in TRIP_SENSORS
+    )
+
+    # Add coordinator metrics entities
+    entities.extend(
+        RivianStatsSensorEntity(
+            vehicle_coordinators[vehicle_id], entry, description, vehicle
+        )
+        for vehicle_id, vehicle in vehicles.items()
+        for description in STATS_SENSORS
+    )
+
     # Add charging entities
     entities.extend(
         RivianChargingSensorEntity(
@@ -82,6 +105,17 @@ async def async_setup_entry(
         for description in CHARGING_SENSORS
     )
 
+    # Add charging session entities
+    entities.extend(
+        RivianChargingSessionSensorEntity(
+            vehicle_coordinators[vehicle_id].charging_coordinator,
+            description,
+            vehicle["vin"],
+        )
+        for vehicle_id, vehicle in vehicles.items()
+        for description in CHARGING_SESSION_SENSORS
+    )
+
     # Add drivers and keys entities
     entities.extend(
         RivianDriverSensorEntity(
@@ -109,6 +143,14 @@ class RivianSensorEntity(RivianVehicleEntity, SensorEntity):
 
     entity_description: RivianSensorEntityDescription
 
+    async def async_added_to_hass(self) -> None:
+        """Precompute the sensor's value when its field changes."""
+        await super().async_added_to_hass()
+        if _fn := self.entity_description.value_lambda:
+            self.async_on_remove(
+                self.coordinator.derived.register(self.entity_description.field, _fn)
+            )
+
     @property
     def native_value(self) -> str | None:
         """Return the value reported by the sensor."""
@@ -118,7 +160,10 @@ class RivianSensorEntity(RivianVehicleEntity, SensorEntity):
         if (val := self._get_value(self.entity_description.field)) is None:
             return STATE_UNAVAILABLE if not self.native_unit_of_measurement else None
 
-        rval = _fn(val) if (_fn := self.entity_description.value_lambda) else val
+        if _fn := self.entity_description.value_lambda:
+            rval = self.coordinator.derived.get(self.entity_description.field, _fn, val)
+        else:
+            rval = val
         if self.device_class == SensorDeviceClass.ENUM and rval not in self.options:
             _LOGGER.error(
                 "Sensor %s provides state value '%s', which is not in the list of known options. Please consider opening an issue at https://github.com/bretterer/home-assistant-rivian/issues with the following info: 'field: \"%s\" / value: \"%s\"'",
@@ -144,12 +189,128 @@ class RivianSensorEntity(RivianVehicleEntity, SensorEntity):
             return {
                 "native_value": entity["value"],
                 "last_update": entity["timeStamp"],
-                "history": str(entity["history"]),
+                **self._get_history(self.entity_description.field),
             }
         except KeyError:
             return None
 
 
+class RivianTripSensorEntity(RivianVehicleEntity, RestoreSensor):
+    """Representation of a Rivian last trip sensor entity."""
+
+    entity_description: RivianTripSensorEntityDescription
+    _restored_value: StateType | None = None
+
+    def _get_fields(self, description: EntityDescription) -> frozenset[str] | None:
+        """Only update when a trip finished."""
+        return frozenset({TRIP_FIELD})
+
+    async def async_added_to_hass(self) -> None:
+        """Restore the last trip from before a restart."""
+        await super().async_added_to_hass()
+        if last_data := await self.async_get_last_sensor_data():
+            self._restored_value = last_data.native_value
+
+    @property
+    def native_value(self) -> StateType:
+        """Return the value of the last trip."""
+        if (trip := self.coordinator.trips.last) is None:
+            return self._restored_value
+        return self.entity_description.value_fn(trip)
+
+
+class RivianStatsSensorEntity(RivianVehicleEntity, SensorEntity):
+    """Representation of a Rivian vehicle coordinator metrics sensor entity."""
+
+    entity_description: RivianStatsSensorEntityDescription
+
+    @property
+    def available(self) -> bool:
+        """Metrics are available even while requests fail."""
+        return True
+
+    @property
+    def native_value(self) -> StateType:
+        """Return the value of the metric."""
+        return self.entity_description.value_fn(self.coordinator)
+
+
+STATS_SENSORS: Final[tuple[RivianStatsSensorEntityDescription, ...]] = (
+    RivianStatsSensorEntityDescription(
+        key="api_errors",
+        name="API Errors",
+        icon="mdi:alert-circle-outline",
+        entity_category=EntityCategory.DIAGNOSTIC,
+        entity_registry_enabled_default=False,
+        state_class=SensorStateClass.TOTAL_INCREASING,
+        value_fn=lambda coor: coor.metrics.error_total,
+    ),
+    RivianStatsSensorEntityDescription(
+        key="api_consecutive_errors",
+        name="API Consecutive Errors",
+        icon="mdi:alert-circle-outline",
+        entity_category=EntityCategory.DIAGNOSTIC,
+        entity_registry_enabled_default=False,
+        state_class=SensorStateClass.MEASUREMENT,
+        value_fn=lambda coor: coor.metrics.consecutive_errors,
+    ),
+    RivianStatsSensorEntityDescription(
+        key="api_latency",
+        name="API Latency",
+        device_class=SensorDeviceClass.DURATION,
+        entity_category=EntityCategory.DIAGNOSTIC,
+        entity_registry_enabled_default=False,
+        native_unit_of_measurement=UnitOfTime.SECONDS,
+        state_class=SensorStateClass.MEASUREMENT,
+        suggested_display_precision=2,
+        value_fn=lambda coor: coor.metrics.latency(50),
+    ),
+    RivianStatsSensorEntityDescription(
+        key="api_latency_p95",
+        name="API Latency 95th Percentile",
+        device_class=SensorDeviceClass.DURATION,
+        entity_category=EntityCategory.DIAGNOSTIC,
+        entity_registry_enabled_default=False,
+        native_unit_of_measurement=UnitOfTime.SECONDS,
+        state_class=SensorStateClass.MEASUREMENT,
+        suggested_display_precision=2,
+        value_fn=lambda coor: coor.metrics.latency(95),
+    ),
+    RivianStatsSensorEntityDescription(
+        key="api_payload_size",
+        name="API Payload Size",
+        device_class=SensorDeviceClass.DATA_SIZE,
+        entity_category=EntityCategory.DIAGNOSTIC,
+        entity_registry_enabled_default=False,
+        native_unit_of_measurement=UnitOfInformation.BYTES,
+        state_class=SensorStateClass.MEASUREMENT,
+        value_fn=lambda coor: coor.metrics.payload_size,
+    ),
+    RivianStatsSensorEntityDescription(
+        key="polling_interval",
+        name="Polling Interval",
+        device_class=SensorDeviceClass.DURATION,
+        entity_category=EntityCategory.DIAGNOSTIC,
+        entity_registry_enabled_default=False,
+        native_unit_of_measurement=UnitOfTime.SECONDS,
+        value_fn=lambda coor: coor.update_interval.total_seconds()
+        if coor.update_interval
+        else None,
+    ),
+    RivianStatsSensorEntityDescription(
+        key="push_rate",
+        name="Push Updates",
+        icon="mdi:access-point-network",
+        entity_category=EntityCategory.DIAGNOSTIC,
+        entity_registry_enabled_default=False,
+        native_unit_of_measurement="messages/min",
+        state_class=SensorStateClass.MEASUREMENT,
+        suggested_display_precision=1,
+        value_fn=lambda coor: coor.metrics.push_rate,
+    ),
+)
+
+
 class RivianChargingSensorEntity(RivianChargingEntity, SensorEntity):
     """Representation of a Rivian charging sensor entity."""
 
@@ -238,6 +399,71 @@ CHARGING_SENSORS: Final[tuple[RivianSensorEntityDescription, ...]] = (
 )
 
 
+class RivianChargingSessionSensorEntity(RivianChargingEntity, SensorEntity):
+    """Representation of a Rivian last charging session sensor entity."""
+
+    entity_description: RivianChargingSessionSensorEntityDescription
+
+    @property
+    def native_value(self) -> StateType:
+        """Return the value of the last charging session."""
+        if (session := self.coordinator.sessions.last) is None:
+            return None
+        return self.entity_description.value_fn(session)
+
+    @property
+    def native_unit_of_measurement(self) -> str | None:
+        """Return the unit of measurement of the sensor, if any."""
+        if self.device_class == SensorDeviceClass.MONETARY:
+            session = self.coordinator.sessions.last
+            return (session and session["currency"]) or self.hass.config.currency
+        return super().native_unit_of_measurement
+
+
+CHARGING_SESSION_SENSORS: Final[
+    tuple[RivianChargingSessionSensorEntityDescription, ...]
+] = (
+    RivianChargingSessionSensorEntityDescription(
+        key="last_charging_session_cost",
+        name="Last Charging Session Cost",
+        device_class=SensorDeviceClass.MONETARY,
+        value_fn=lambda session: session["cost"],
+    ),
+    RivianChargingSessionSensorEntityDescription(
+        key="last_charging_session_duration",
+        name="Last Charging Session Duration",
+        device_class=SensorDeviceClass.DURATION,
+        native_unit_of_measurement=UnitOfTime.SECONDS,
+        suggested_unit_of_measurement=UnitOfTime.MINUTES,
+        value_fn=lambda session: session["duration"],
+    ),
+    RivianChargingSessionSensorEntityDescription(
+        key="last_charging_session_energy",
+        name="Last Charging Session Energy",
+        device_class=SensorDeviceClass.ENERGY,
+        native_unit_of_measurement=UnitOfEnergy.KILO_WATT_HOUR,
+        suggested_display_precision=1,
+        value_fn=lambda session: session["energy"],
+    ),
+    RivianChargingSessionSensorEntityDescription(
+        key="last_charging_session_power_average",
+        name="Last Charging Session Average Power",
+        device_class=SensorDeviceClass.POWER,
+        native_unit_of_measurement=UnitOfPower.KILO_WATT,
+        suggested_display_precision=1,
+        value_fn=lambda session: session["average_power"],
+    ),
+    RivianChargingSessionSensorEntityDescription(
+        key="last_charging_session_power_peak",
+        name="Last Charging Session Peak Power",
+        device_class=SensorDeviceClass.POWER,
+        native_unit_of_measurement=UnitOfPower.KILO_WATT,
+        suggested_display_precision=1,
+        value_fn=lambda session: session["peak_power"],
+    ),
+)
+
+
 class RivianWallboxSensorEntity(RivianWallboxEntity, SensorEntity):
     """Representation of a Rivian wallbox sensor entity."""
 
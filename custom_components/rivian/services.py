@@ -0,0 +1,78 @@
+"""Rivian services."""
+from __future__ import annotations
+
+from datetime import datetime
+
+import voluptuous as vol
+
+from homeassistant.const import ATTR_DEVICE_ID
+from homeassistant.core import (
+    HomeAssistant,
+    ServiceCall,
+    ServiceResponse,
+    SupportsResponse,
+    callback,
+)
+from homeassistant.exceptions import HomeAssistantError
+from homeassistant.helpers import config_validation as cv, device_registry as dr
+from homeassistant.util import dt as dt_util
+
+from .const import ATTR_COORDINATOR, ATTR_VEHICLE, DOMAIN
+from .coordinator import VehicleCoordinator
+
+ATTR_END = "end"
+ATTR_INCLUDE_SAMPLES = "include_samples"
+ATTR_START = "start"
+
+SERVICE_GET_CHARGING_SESSIONS = "get_charging_sessions"
+GET_CHARGING_SESSIONS_SCHEMA = vol.Schema(
+    {
+        vol.Required(ATTR_DEVICE_ID): cv.string,
+        vol.Optional(ATTR_START): cv.datetime,
+        vol.Optional(ATTR_END): cv.datetime,
+        vol.Optional(ATTR_INCLUDE_SAMPLES, default=False): cv.boolean,
+    }
+)
+
+
+@callback
+def async_setup_services(hass: HomeAssistant) -> None:
+    """Set up the Rivian services."""
+
+    async def async_get_charging_sessions(call: ServiceCall) -> ServiceResponse:
+        """Get the recorded charging sessions of a vehicle."""
+        coordinator = _get_vehicle_coordinator(hass, call.data[ATTR_DEVICE_ID])
+        sessions = await coordinator.charging_coordinator.sessions.async_query(
+            start=_as_aware(call.data.get(ATTR_START)),
+            end=_as_aware(call.data.get(ATTR_END)),
+            include_samples=call.data[ATTR_INCLUDE_SAMPLES],
+        )
+        return {"sessions": sessions}
+
+    hass.services.async_register(
+        DOMAIN,
+        SERVICE_GET_CHARGING_SESSIONS,
+        async_get_charging_sessions,
+        schema=GET_CHARGING_SESSIONS_SCHEMA,
+        supports_response=SupportsResponse.ONLY,
+    )
+
+
+def _get_vehicle_coordinator(hass: HomeAssistant, device_id: str) -> VehicleCoordinator:
+    """Get the coordinator of a vehicle device."""
+    if device := dr.async_get(hass).async_get(device_id):
+        for domain, identifier in device.identifiers:
+            if domain != DOMAIN:
+                continue
+            for entry_data in hass.data.get(DOMAIN, {}).values():
+                coordinators = entry_data[ATTR_COORDINATOR][ATTR_VEHICLE]
+                if coordinator := coordinators.get(identifier):
+                    return coordinator
+    raise HomeAssistantError(f"Device {device_id} is not a loaded Rivian vehicle")
+
+
+def _as_aware(value: datetime | None) -> datetime | None:
+    """Interpret a naive datetime in the configured time zone."""
+    if value is None or value.tzinfo is not None:
+        return value
+    return value.replace(tzinfo=dt_util.DEFAULT_TIME_ZONE)
@@ -0,0 +1,120 @@
+"""Persisted snapshot of the last known Rivian coordinator data."""
+from __future__ import annotations
+
+from datetime import datetime, timezone
+from typing import TYPE_CHECKING, Any, TypedDict
+
+from homeassistant.components.diagnostics.util import async_redact_data
+from homeassistant.core import HomeAssistant, callback
+from homeassistant.helpers.storage import Store
+
+from .const import DOMAIN
+
+if TYPE_CHECKING:
+    from .coordinator import UserCoordinator, VehicleCoordinator, WallboxCoordinator
+
+STORAGE_VERSION = 1
+SAVE_DELAY = 60  # seconds
+
+# Only needed for display, never to restore entities or send commands
+TO_REDACT = {"email", "firstName", "lastName"}
+# Not saved at all, live data replaces them shortly after a restart
+USER_EXCLUDE = {"enrolledPhones"}  # phone identities used to send commands
+VEHICLE_EXCLUDE = {"gnssLocation"}  # precise location
+
+
+class SnapshotData(TypedDict):
+    """Saved coordinator data."""
+
+    saved: str
+    user: dict[str, Any]
+    vehicle: dict[str, dict[str, Any]]
+    charging: dict[str, dict[str, Any]]
+    drivers: dict[str, dict[str, Any]]
+    wallbox: list[dict[str, Any]]
+
+
+class RivianSnapshotStore:
+    """Load and save the last known coordinator data of a config entry."""
+
+    def __init__(self, hass: HomeAssistant, entry_id: str) -> None:
+        """Initialize the store."""
+        self._store: Store[SnapshotData] = Store(
+            hass, STORAGE_VERSION, f"{DOMAIN}.{entry_id}"
+        )
+        self._user: UserCoordinator | None = None
+        self._vehicles: dict[str, VehicleCoordinator] = {}
+        self._wallbox: WallboxCoordinator | None = None
+        self._save_scheduled = False
+
+    async def async_load(self) -> SnapshotData | None:
+        """Load the snapshot."""
+        return await self._store.async_load()
+
+    @callback
+    def async_track(
+        self,
+        user: UserCoordinator,
+        vehicles: dict[str, VehicleCoordinator],
+        wallbox: WallboxCoordinator,
+    ) -> None:
+        """Set the coordinators to save and save them whenever they update."""
+        self._user = user
+        self._vehicles = vehicles
+        self._wallbox = wallbox
+
+    @callback
+    def async_schedule_save(self) -> None:
+        """Save the snapshot after a delay, unless a save is already scheduled."""
+        if not self._save_scheduled and self._user and self._user.data:
+            self._save_scheduled = True
+            self._store.async_delay_save(self._data_to_save, SAVE_DELAY)
+
+    async def async_save(self) -> None:
+        """Save the snapshot now."""
+        if self._user and self._user.data:
+            await self._store.async_save(self._data_to_save())
+
+    @staticmethod
+    def is_complete(snapshot: SnapshotData | None) -> bool:
+        """Return `True` if the snapshot has data for all of the user's vehicles."""
+        if not snapshot or not (user := snapshot.get("user")):
+            return False
+        return all(
+            vehicle["id"] in snapshot["vehicle"] for vehicle in user.get("vehicles", [])
+        )
+
+    async def async_remove(self) -> None:
+        """Remove the snapshot."""
+        await self._store.async_remove()
+
+    @callback
+    def _data_to_save(self) -> SnapshotData:
+        """Return the data to save."""
+        assert self._user
+        self._save_scheduled = False
+        return {
+            "saved": datetime.now(timezone.utc).isoformat(),
+            "user": _exclude(self._user.data, USER_EXCLUDE),
+            "vehicle": {
+                vehicle_id: _exclude(coor.data, VEHICLE_EXCLUDE)
+                for vehicle_id, coor in self._vehicles.items()
+                if coor.data
+            },
+            "charging": {
+                vehicle_id: coor.charging_coordinator.data
+                for vehicle_id, coor in self._vehicles.items()
+                if coor.charging_coordinator.data
+            },
+            "drivers": {
+                vehicle_id: async_redact_data(coor.drivers_coordinator.data, TO_REDACT)
+                for vehicle_id, coor in self._vehicles.items()
+                if coor.drivers_coordinator.data
+            },
+            "wallbox": (self._wallbox.data if self._wallbox else None) or [],
+        }
+
+
+def _exclude(data: dict[str, Any], keys: set[str]) -> dict[str, Any]:
+    """Return the data without some of its keys."""
+    return {key: value for key, value in data.items() if key not in keys}
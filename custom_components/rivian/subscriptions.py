@@ -0,0 +1,257 @@
+"""Shared web socket subscription manager for Rivian vehicles."""
+from __future__ import annotations
+
+import asyncio
+from collections import deque
+from collections.abc import Awaitable, Callable
+from dataclasses import dataclass, field
+import logging
+from random import uniform
+import time
+from typing import Any
+from weakref import WeakKeyDictionary, ref
+
+from rivian import Rivian
+
+_LOGGER = logging.getLogger(__name__)
+
+RESUBSCRIBE_BASE = 15  # seconds
+RESUBSCRIBE_MAX = 15 * 60  # 15 minutes
+HEALTH_CHECK_INTERVAL = 60  # seconds
+MAX_ERRORS = 5  # consecutive bad messages
+RATE_WINDOW = 5 * 60  # 5 minutes
+
+
+@dataclass
+class VehicleSubscription:
+    """Subscription state of a single vehicle."""
+
+    vehicle_id: str
+    properties: set[str]
+    callback: Callable[[dict[str, Any]], None]
+    fallback: Callable[[], None]
+    unsubscribe: Callable[[], Awaitable[None]] | None = None
+    receiving: bool = False
+    attempt: int = 0
+    errors: int = 0
+    messages: int = 0
+    retry: asyncio.TimerHandle | None = field(default=None, repr=False)
+
+
+class RivianSubscriptionManager:
+    """Own the web socket of a client and keep its vehicles subscribed."""
+
+    def __init__(self, client: Rivian) -> None:
+        """Initialize the subscription manager."""
+        self._api = ref(client)
+        self._lock = asyncio.Lock()
+        self._vehicles: dict[str, VehicleSubscription] = {}
+        self._tasks: set[asyncio.Task] = set()
+        self._health_check: asyncio.TimerHandle | None = None
+        self._was_connected = False
+        self._received: deque[float] = deque()
+        self.connects = 0
+        self.reconnects = 0
+        self.messages = 0
+        self.errors = 0
+
+    @property
+    def message_rate(self) -> float:
+        """Return the messages received per minute over the rate window."""
+        self._prune_received(time.monotonic())
+        return len(self._received) * 60 / RATE_WINDOW
+
+    def stats(self) -> dict[str, Any]:
+        """Return the subscription counters."""
+        return {
+            "connected": self._connected(),
+            "connects": self.connects,
+            "reconnects": self.reconnects,
+            "messages": self.messages,
+            "errors": self.errors,
+            "message_rate": round(self.message_rate, 2),
+            "vehicles": [
+                {
+                    "vehicleId": sub.vehicle_id,
+                    "receiving": sub.receiving,
+                    "attempt": sub.attempt,
+                    "messages": sub.messages,
+                }
+                for sub in self._vehicles.values()
+            ],
+        }
+
+    async def async_subscribe(
+        self,
+        vehicle_id: str,
+        properties: set[str],
+        callback: Callable[[dict[str, Any]], None],
+        fallback: Callable[[], None],
+    ) -> Callable[[], Awaitable[None]]:
+        """Subscribe a vehicle, retrying in the background until it succeeds.
+
+        `callback` receives valid subscription messages. `fallback` is called
+        whenever the vehicle stops receiving them and should be polled instead.
+        """
+        if vehicle_id in self._vehicles:
+            await self._async_stop(self._vehicles.pop(vehicle_id))
+        sub = self._vehicles[vehicle_id] = VehicleSubscription(
+            vehicle_id, properties, callback, fallback
+        )
+        await self._async_start(sub)
+        self._schedule_health_check()
+
+        async def unsubscribe() -> None:
+            """Unsubscribe the vehicle."""
+            if self._vehicles.get(vehicle_id) is sub:
+                del self._vehicles[vehicle_id]
+                await self._async_stop(sub)
+            if not self._vehicles:
+                await self._async_close()
+
+        return unsubscribe
+
+    async def _async_start(self, sub: VehicleSubscription) -> None:
+        """Subscribe a vehicle, falling back to polling on failure."""
+        if (api := self._api()) is None:
+            return
+        async with self._lock:
+            connected = self._connected()
+            try:
+                sub.unsubscribe = await api.subscribe_for_vehicle_updates(
+                    vehicle_id=sub.vehicle_id,
+                    properties=sub.properties,
+                    callback=lambda data: self._on_message(sub, data),
+                )
+            except Exception as err:  # pylint: disable=broad-except
+                _LOGGER.warning("Could not subscribe %s: %s", sub.vehicle_id, err)
+                sub.unsubscribe = None
+            if sub.unsubscribe and not connected:
+                self.connects += 1
+                self._was_connected = True
+        if not sub.unsubscribe:
+            sub.fallback()
+            self._schedule_retry(sub)
+
+    async def _async_stop(self, sub: VehicleSubscription) -> None:
+        """Stop a vehicle's subscription and any pending retry."""
+        if sub.retry:
+            sub.retry.cancel()
+            sub.retry = None
+        sub.receiving = False
+        if unsub := sub.unsubscribe:
+            sub.unsubscribe = None
+            await unsub()
+
+    async def _async_close(self) -> None:
+        """Close the web socket."""
+        if self._health_check:
+            self._health_check.cancel()
+            self._health_check = None
+        self._was_connected = False
+        # pylint: disable-next=protected-access
+        if (api := self._api()) and (monitor := api._ws_monitor):
+            await monitor.close()
+
+    def _on_message(self, sub: VehicleSubscription, data: dict[str, Any]) -> None:
+        """Validate a subscription message and pass it on."""
+        if not (payload := data.get("payload")) or not payload.get("data"):
+            _LOGGER.error("Received an unknown subscription update: %s", data)
+            self.errors += 1
+            sub.errors += 1
+            if not sub.receiving or sub.errors > MAX_ERRORS:
+                self._create_task(self._async_fail(sub))
+            return
+        now = time.monotonic()
+        self._received.append(now)
+        self._prune_received(now)
+        self.messages += 1
+        sub.messages += 1
+        sub.errors = 0
+        sub.attempt = 0
+        sub.receiving = True
+        sub.callback(data)
+
+    async def _async_fail(self, sub: VehicleSubscription) -> None:
+        """Move a vehicle to polling and resubscribe it later."""
+        if self._vehicles.get(sub.vehicle_id) is not sub or not sub.unsubscribe:
+            return
+        await self._async_stop(sub)
+        sub.fallback()
+        self._schedule_retry(sub)
+        if any(other.receiving for other in self._vehicles.values()):
+            return
+
+        # no vehicle is receiving anything, so start over with a new socket
+        _LOGGER.debug("No subscriptions are healthy, closing the web socket")
+        for other in list(self._vehicles.values()):
+            if other.unsubscribe:
+                await self._async_stop(other)
+                other.fallback()
+                self._schedule_retry(other)
+        await self._async_close()
+        self._schedule_health_check()
+
+    def _schedule_retry(self, sub: VehicleSubscription) -> None:
+        """Resubscribe a vehicle after a jittered exponential backoff."""
+        delay = min(RESUBSCRIBE_BASE * 2**sub.attempt, RESUBSCRIBE_MAX)
+        delay *= uniform(0.5, 1.5)
+        sub.attempt += 1
+        _LOGGER.debug("Resubscribing %s in %.0f seconds", sub.vehicle_id, delay)
+        sub.retry = asyncio.get_running_loop().call_later(delay, self._retry, sub)
+
+    def _retry(self, sub: VehicleSubscription) -> None:
+        """Resubscribe a vehicle, unless it was removed in the meantime."""
+        sub.retry = None
+        if self._vehicles.get(sub.vehicle_id) is sub and not sub.unsubscribe:
+            self._create_task(self._async_start(sub))
+
+    def _schedule_health_check(self) -> None:
+        """Check the web socket periodically while vehicles are subscribed."""
+        if self._health_check is None and self._vehicles:
+            self._health_check = asyncio.get_running_loop().call_later(
+                HEALTH_CHECK_INTERVAL, self._check_health
+            )
+
+    def _check_health(self) -> None:
+        """Count reconnects and promote polling vehicles once the socket is healthy."""
+        self._health_check = None
+        connected = self._connected()
+        if connected and not self._was_connected:
+            self.reconnects += 1
+        self._was_connected = connected
+
+        if connected and any(sub.receiving for sub in self._vehicles.values()):
+            for sub in self._vehicles.values():
+                if sub.retry:
+                    sub.retry.cancel()
+                    self._retry(sub)
+        self._schedule_health_check()
+
+    def _connected(self) -> bool:
+        """Return `True` if the web socket is connected and acknowledged."""
+        # pylint: disable-next=protected-access
+        if (api := self._api()) is None or (monitor := api._ws_monitor) is None:
+            return False
+        return monitor.connected and monitor.connection_ack.is_set()
+
+    def _prune_received(self, now: float) -> None:
+        """Drop message timestamps older than the rate window."""
+        while self._received and self._received[0] < now - RATE_WINDOW:
+            self._received.popleft()
+
+    def _create_task(self, coro: Awaitable[None]) -> None:
+        """Run a coroutine in the background, keeping a reference to it."""
+        task = asyncio.ensure_future(coro)
+        self._tasks.add(task)
+        task.add_done_callback(self._tasks.discard)
+
+
+_MANAGERS: WeakKeyDictionary[Rivian, RivianSubscriptionManager] = WeakKeyDictionary()
+
+
+def get_subscription_manager(client: Rivian) -> RivianSubscriptionManager:
+    """Get the subscription manager shared by all vehicles of a client."""
+    if (manager := _MANAGERS.get(client)) is None:
+        manager = _MANAGERS[client] = RivianSubscriptionManager(client)
+    return manager
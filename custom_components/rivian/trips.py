@@ -0,0 +1,252 @@
+"""Streaming trip segmentation of vehicle state updates."""
+from __future__ import annotations
+
+from array import array
+import asyncio
+from collections import deque
+from collections.abc import Callable
+from dataclasses import dataclass, field
+from datetime import datetime
+from itertools import accumulate
+import logging
+import math
+import time
+from typing import Any
+
+from homeassistant.core import HomeAssistant, callback
+from homeassistant.util import dt as dt_util
+from homeassistant.util.location import distance
+
+_LOGGER = logging.getLogger(__name__)
+
+TRIP_END_DELAY = 5 * 60  # 5 minutes parked
+MIN_TRIP_DISTANCE = 100  # meters, shorter trips are discarded
+MAX_TRIPS = 20  # trips kept in memory, with their traces
+COORDINATE_SCALE = 1_000_000  # microdegrees
+
+TRIP_FIELD = "trip"  # listener context of the trip sensors
+
+
+@dataclass(frozen=True)
+class TripSummary:
+    """Summary of a finished trip."""
+
+    start: datetime
+    end: datetime
+    distance: float  # kilometers
+    duration: float  # seconds
+    energy: float | None  # kilowatt hours
+    efficiency: float | None  # kilometers per kilowatt hour
+    max_speed: float | None  # meters per second
+    samples: int
+    trace: TripTrace = field(repr=False, compare=False)
+
+
+class TripTrace:
+    """Delta-encoded, array backed samples of a trip."""
+
+    def __init__(self) -> None:
+        """Initialize the trace."""
+        # the first sample, kept apart so the deltas fit 32 bit arrays
+        self.origin: tuple[int, int, int] | None = None
+        self.times = array("l")  # deciseconds since the previous sample
+        self.latitudes = array("l")  # microdegrees since the previous sample
+        self.longitudes = array("l")  # microdegrees since the previous sample
+        self.speeds = array("f")  # meters per second, NaN if unknown
+        self._last = (0, 0, 0)
+
+    def __len__(self) -> int:
+        """Return the number of samples."""
+        return len(self.times)
+
+    def append(
+        self, timestamp: float, latitude: float, longitude: float, speed: float | None
+    ) -> None:
+        """Append a sample."""
+        sample = (
+            round(timestamp * 10),
+            round(latitude * COORDINATE_SCALE),
+            round(longitude * COORDINATE_SCALE),
+        )
+        if self.origin is None:
+            self.origin = self._last = sample
+        self.times.append(sample[0] - self._last[0])
+        self.latitudes.append(sample[1] - self._last[1])
+        self.longitudes.append(sample[2] - self._last[2])
+        self.speeds.append(math.nan if speed is None else speed)
+        self._last = sample
+
+    def decode(self) -> list[tuple[float, float, float]]:
+        """Return the `(timestamp, latitude, longitude)` samples."""
+        if self.origin is None:
+            return []
+        time0, latitude0, longitude0 = self.origin
+        return [
+            (
+                (time0 + timestamp) / 10,
+                (latitude0 + latitude) / COORDINATE_SCALE,
+                (longitude0 + longitude) / COORDINATE_SCALE,
+            )
+            for timestamp, latitude, longitude in zip(
+                accumulate(self.times),
+                accumulate(self.latitudes),
+                accumulate(self.longitudes),
+            )
+        ]
+
+
+@dataclass
+class TripState:
+    """Odometer and battery readings at a point of a trip."""
+
+    timestamp: float
+    mileage: float | None  # meters
+    battery_level: float | None  # percent
+    battery_capacity: float | None  # kilowatt hours
+
+
+def summarize_trip(
+    trace: TripTrace, start: TripState, end: TripState
+) -> TripSummary | None:
+    """Summarize a trip, `None` if it is too short to keep.
+
+    This decodes and walks every sample, so it is run in the executor.
+    """
+    if start.mileage is not None and end.mileage is not None:
+        meters = end.mileage - start.mileage
+    else:
+        samples = trace.decode()
+        meters = sum(
+            distance(lat1, lon1, lat2, lon2) or 0
+            for (_, lat1, lon1), (_, lat2, lon2) in zip(samples, samples[1:])
+        )
+    if meters < MIN_TRIP_DISTANCE:
+        return None
+
+    energy = None
+    if (
+        start.battery_level is not None
+        and end.battery_level is not None
+        and (capacity := end.battery_capacity or start.battery_capacity)
+    ):
+        energy = (start.battery_level - end.battery_level) / 100 * capacity
+        if energy <= 0:  # charged or regenerated more than used
+            energy = None
+    kilometers = meters / 1000
+    speeds = [speed for speed in trace.speeds if not math.isnan(speed)]
+    return TripSummary(
+        start=dt_util.utc_from_timestamp(start.timestamp),
+        end=dt_util.utc_from_timestamp(end.timestamp),
+        distance=round(kilometers, 2),
+        duration=round(end.timestamp - start.timestamp),
+        energy=round(energy, 2) if energy else None,
+        efficiency=round(kilometers / energy, 2) if energy else None,
+        max_speed=max(speeds, default=None),
+        samples=len(trace),
+        trace=trace,
+    )
+
+
+class TripRecorder:
+    """Split a vehicle's state updates into trips."""
+
+    def __init__(
+        self,
+        hass: HomeAssistant,
+        on_trip: Callable[[TripSummary], None],
+        max_trips: int = MAX_TRIPS,
+    ) -> None:
+        """Initialize the recorder.
+
+        `on_trip` is called with the summary of every finished trip.
+        """
+        self.hass = hass
+        self.on_trip = on_trip
+        self.trips: deque[TripSummary] = deque(maxlen=max_trips)
+        self._trace: TripTrace | None = None
+        self._start: TripState | None = None
+        self._state: TripState | None = None
+        self._end: TripState | None = None
+        self._location_timestamp: str | None = None
+        self._end_timer: asyncio.TimerHandle | None = None
+        self._tasks: set[asyncio.Task] = set()
+
+    @property
+    def last(self) -> TripSummary | None:
+        """Return the last finished trip."""
+        return self.trips[-1] if self.trips else None
+
+    @callback
+    def async_update(self, data: dict[str, Any]) -> None:
+        """Process the latest vehicle state."""
+
+        def value(key: str) -> Any | None:
+            return (data.get(key) or {}).get("value")
+
+        now = time.time()
+        self._state = TripState(
+            now,
+            value("vehicleMileage"),
+            value("batteryLevel"),
+            value("batteryCapacity"),
+        )
+        speed = value("gnssSpeed")
+        moving = value("gearStatus") not in (None, "park") or (speed or 0) > 0
+
+        if self._trace is None:
+            if not moving:
+                return
+            _LOGGER.debug("Trip started")
+            self._trace = TripTrace()
+            self._start = self._state
+
+        location = data.get("gnssLocation") or {}
+        if (
+            location.get("timeStamp") != self._location_timestamp
+            and (latitude := location.get("latitude")) is not None
+            and (longitude := location.get("longitude")) is not None
+        ):
+            self._location_timestamp = location.get("timeStamp")
+            self._trace.append(now, latitude, longitude, speed)
+
+        if moving:
+            if self._end_timer:
+                self._end_timer.cancel()
+                self._end_timer = None
+        elif self._end_timer is None:
+            self._end = self._state
+            self._end_timer = self.hass.loop.call_later(TRIP_END_DELAY, self._end_trip)
+
+    @callback
+    def async_stop(self) -> None:
+        """Stop recording, discarding the trip in progress."""
+        if self._end_timer:
+            self._end_timer.cancel()
+            self._end_timer = None
+        self._trace = self._start = self._end = None
+
+    @callback
+    def _end_trip(self) -> None:
+        """End the trip in progress and summarize it in the background."""
+        self._end_timer = None
+        trace, start, end = self._trace, self._start, self._end
+        self._trace = self._start = self._end = None
+        if trace is None or start is None or end is None:
+            return
+        task = self.hass.async_create_task(self._async_summarize(trace, start, end))
+        self._tasks.add(task)
+        task.add_done_callback(self._tasks.discard)
+
+    async def _async_summarize(
+        self, trace: TripTrace, start: TripState, end: TripState
+    ) -> None:
+        """Summarize a finished trip."""
+        summary = await self.hass.async_add_executor_job(
+            summarize_trip, trace, start, end
+        )
+        if summary is None:
+            _LOGGER.debug("Discarded a trip shorter than %s meters", MIN_TRIP_DISTANCE)
+            return
+        _LOGGER.debug("Trip finished: %s", summary)
+        self.trips.append(summary)
+        self.on_trip(summary)
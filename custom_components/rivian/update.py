@@ -20,7 +20,12 @@ from homeassistant.core import HomeAssistant
 from homeassistant.helpers.entity import EntityDescription
 from homeassistant.helpers.entity_platform import AddEntitiesCallback
 
-from .const import ATTR_COORDINATOR, ATTR_VEHICLE, DOMAIN
+from .const import (
+    ATTR_COORDINATOR,
+    ATTR_VEHICLE,
+    DOMAIN,
+    VEHICLE_STATE_OTA_API_FIELDS,
+)
 from .coordinator import VehicleCoordinator
 from .entity import RivianVehicleEntity
 
@@ -65,6 +70,10 @@ class RivianUpdateEntity(RivianVehicleEntity, UpdateEntity):
         super().__init__(coordinator, config_entry, description, vehicle)
         self.can_install = vehicle.get("phone_identity_id") is not None
 
+    def _get_fields(self, description: EntityDescription) -> frozenset[str] | None:
+        """Get the data fields this entity depends on."""
+        return VEHICLE_STATE_OTA_API_FIELDS
+
     @property
     def installed_version(self) -> str:
         """Version installed and in use."""
@@ -0,0 +1,102 @@
+"""Tests for the Rivian device tracker."""
+from __future__ import annotations
+
+import asyncio
+from collections.abc import Awaitable, Callable
+import tempfile
+from typing import Any
+from unittest.mock import patch
+
+from homeassistant.config_entries import SOURCE_USER, ConfigEntry
+from homeassistant.core import HomeAssistant
+
+from custom_components.rivian.const import DOMAIN
+from custom_components.rivian.coordinator import VehicleCoordinator
+from custom_components.rivian.device_tracker import (
+    LOCATION_DESCRIPTION,
+    RivianDeviceEntity,
+)
+from custom_components.rivian.snapshot import VEHICLE_EXCLUDE
+
+VEHICLE = {"id": "vehicle-1", "vin": "VIN1", "name": "Truck", "model": "R1T"}
+LOCATION = {
+    "latitude": 40.1,
+    "longitude": -105.2,
+    "timeStamp": "2024-02-01T12:00:00.000Z",
+}
+VEHICLE_DATA = {
+    "gnssLocation": LOCATION,
+    "otaCurrentVersion": {"value": "2024.03.1", "timeStamp": LOCATION["timeStamp"]},
+    "powerState": {"value": "ready", "timeStamp": LOCATION["timeStamp"]},
+}
+
+
+class FakeRivian:
+    """Stand-in for the Rivian client, never used to send requests."""
+
+
+def run(test: Callable[[HomeAssistant], Awaitable[None]]) -> None:
+    """Run a test in a throwaway Home Assistant instance."""
+
+    async def _async_run() -> None:
+        with tempfile.TemporaryDirectory() as config_dir:
+            hass = HomeAssistant(config_dir)
+            try:
+                await test(hass)
+            finally:
+                await hass.async_stop(force=True)
+
+    asyncio.run(_async_run())
+
+
+def create_entity(hass: HomeAssistant, data: dict[str, Any]) -> RivianDeviceEntity:
+    """Create the tracker of a vehicle with restored data."""
+    entry = ConfigEntry(
+        version=1,
+        minor_version=1,
+        domain=DOMAIN,
+        title="Rivian",
+        data={},
+        source=SOURCE_USER,
+    )
+    coordinator = VehicleCoordinator(
+        hass, FakeRivian(), VEHICLE["id"]  # type: ignore[arg-type]
+    )
+    coordinator.async_restore(data)
+    return RivianDeviceEntity(coordinator, entry, LOCATION_DESCRIPTION, VEHICLE)
+
+
+def test_restored_from_snapshot() -> None:
+    """Test the tracker is set up from a snapshot without the vehicle location."""
+
+    async def _test(hass: HomeAssistant) -> None:
+        snapshot = {
+            key: value
+            for key, value in VEHICLE_DATA.items()
+            if key not in VEHICLE_EXCLUDE
+        }
+        entity = create_entity(hass, snapshot)
+        assert entity.latitude is None
+        assert entity.longitude is None
+        assert entity.extra_state_attributes == {}
+
+        # the first poll or push brings the location
+        entity.coordinator.async_set_updated_data(VEHICLE_DATA)
+        with patch.object(entity, "async_write_ha_state") as write:
+            entity._handle_coordinator_update()  # pylint: disable=protected-access
+        write.assert_called_once()
+        assert (entity.latitude, entity.longitude) == (40.1, -105.2)
+        assert entity.extra_state_attributes == {"last_update": LOCATION["timeStamp"]}
+
+    run(_test)
+
+
+def test_restored_with_location() -> None:
+    """Test the tracker uses a location in the restored data."""
+
+    async def _test(hass: HomeAssistant) -> None:
+        entity = create_entity(hass, VEHICLE_DATA)
+        assert (entity.latitude, entity.longitude) == (40.1, -105.2)
+        assert entity.extra_state_attributes == {"last_update": LOCATION["timeStamp"]}
+
+    run(_test)
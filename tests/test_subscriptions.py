@@ -0,0 +1,78 @@
+"""Tests for the Rivian subscription manager."""
+from __future__ import annotations
+
+import asyncio
+from collections.abc import Awaitable, Callable
+from typing import Any
+from unittest.mock import patch
+
+from aiohttp import ClientError
+
+from custom_components.rivian import subscriptions
+from custom_components.rivian.subscriptions import RivianSubscriptionManager
+
+
+class FakeRivian:
+    """Stand-in for the Rivian client, failing its first subscriptions."""
+
+    _ws_monitor = None
+
+    def __init__(self, results: list[Any]) -> None:
+        """Initialize the client with the results of each subscribe call."""
+        self.results = results
+        self.calls = 0
+
+    async def subscribe_for_vehicle_updates(
+        self, **kwargs: Any
+    ) -> Callable[[], Awaitable[None]] | None:
+        """Return or raise the next result."""
+        result = self.results[min(self.calls, len(self.results) - 1)]
+        self.calls += 1
+        if isinstance(result, Exception):
+            raise result
+        return result
+
+
+async def _async_unsubscribe() -> None:
+    """Unsubscribe from nothing."""
+
+
+def run_subscription(results: list[Any]) -> tuple[FakeRivian, int]:
+    """Subscribe a vehicle until it succeeds, returning how often it fell back."""
+    client = FakeRivian(results)
+    fallbacks = 0
+
+    def fallback() -> None:
+        nonlocal fallbacks
+        fallbacks += 1
+
+    async def _async_run() -> None:
+        manager = RivianSubscriptionManager(client)  # type: ignore[arg-type]
+        unsubscribe = await manager.async_subscribe(
+            "vehicle-1", {"powerState"}, lambda data: None, fallback
+        )
+        for _ in range(100):
+            if client.calls >= len(results):
+                break
+            await asyncio.sleep(0.01)
+        await unsubscribe()
+
+    with patch.object(subscriptions, "RESUBSCRIBE_BASE", 0.01):
+        asyncio.run(_async_run())
+    return client, fallbacks
+
+
+def test_subscribe_raises() -> None:
+    """Test a subscription that raises is retried."""
+    client, fallbacks = run_subscription([ClientError("down"), _async_unsubscribe])
+    assert client.calls == 2
+    assert fallbacks == 1
+
+
+def test_resubscribe_raises() -> None:
+    """Test a failed resubscription that raises is retried again."""
+    client, fallbacks = run_subscription(
+        [None, ClientError("down"), ClientError("down"), _async_unsubscribe]
+    )
+    assert client.calls == 4
+    assert fallbacks == 3